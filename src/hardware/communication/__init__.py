@@ -1,5 +1,6 @@
 """Communication modules for the BCP Accelerator."""
 
+from .baud_gen import BaudGen
 from .uart_rx import UARTReceiver
 from .uart_tx import UARTTransmitter
 from .host_interface import HostInterface
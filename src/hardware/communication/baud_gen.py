@@ -0,0 +1,48 @@
+"""
+Baud Rate Generator for the BCP Accelerator Host Interface.
+
+A single free-running bit-period counter shared by the UART receiver and
+transmitter, so the two halves don't each carry their own bit timer.
+
+Parameters
+----------
+divisor : int
+    Clock cycles per bit = clk_freq / baud_rate.
+    At 12 MHz / 1 Mbaud = 12.
+
+Ports
+-----
+count : Signal(range(divisor)), out — counts divisor-1 down to 0, then wraps
+tick  : Signal(),               out — high in the cycle count is 0, i.e.
+                                      once every divisor cycles
+"""
+
+from amaranth import *
+
+
+class BaudGen(Elaboratable):
+    """
+    Free-running bit-period counter.
+
+    The transmitter steps its FSM on `tick`.  The receiver can't use a
+    fixed phase, since a start bit may begin at any point in the period,
+    so it latches the `count` value its bit centres fall on when it sees
+    the start edge and samples whenever `count` comes back round to it.
+    """
+
+    def __init__(self, divisor: int = 12):
+        self.divisor = divisor
+
+        self.count = Signal(range(divisor))
+        self.tick  = Signal()
+
+    def elaborate(self, platform):
+        m = Module()
+
+        with m.If(self.count == 0):
+            m.d.sync += self.count.eq(self.divisor - 1)
+        with m.Else():
+            m.d.sync += self.count.eq(self.count - 1)
+        m.d.comb += self.tick.eq(self.count == 0)
+
+        return m
@@ -12,25 +12,39 @@ Protocol — Host → FPGA (8N1, big-endian multi-byte fields):
   0x04 WRITE_ASSIGN   [var:2][val:1]                             3 payload bytes
   0x05 BCP_START      [false_lit:2]                              2 payload bytes
   0x06 RESET_STATE    (none)                                      0 payload bytes
+                      — resets every variable assignment to UNASSIGNED
+  0x08 WRITE_CLAUSE_BURST [count:2][clause_id:2]                 4 payload bytes
+                      then count × [size:1][sat:1][lit0..4:10]  12 bytes each
+                      — clauses clause_id, clause_id+1, … written back to back
+  0x09 WRITE_CLAUSE_BYTE  [clause_id:2][offset:1][data:1]        4 payload bytes
+                      — rewrites byte lane `offset` (0..10) of the stored
+                        clause word only (see ClauseMemory packing)
+  0x0A WRITE_BATCH    [cmd:1][count:1]                           2 payload bytes
+                      then count × the payload of `cmd`, with no command
+                      byte in between; `cmd` is one of 0x01..0x04, 0x09
 
 Protocol — FPGA → Host (streamed after BCP_START completes):
   0xB0 [var:2][val:1][reason:2]  — one implication  (6 bytes total)
-  0xC0 [clause_id:2][0x00]       — done, no conflict (4 bytes total)
-  0xC1 [clause_id:2][0x00]       — done, conflict    (4 bytes total)
+  0xC0 [clause_id:2]             — done, no conflict (3 bytes total)
+  0xC1 [clause_id:2]             — done, conflict    (3 bytes total)
 
 FSM states:
   CMD_WAIT     — idle, waiting for the command byte
-  PAYLOAD_RECV — accumulating payload bytes into buf[]
-  CMD_EXEC     — one-cycle dispatch: pulse write enable or start BCP
-  BCP_WAIT     — waiting for the accelerator done pulse
-  IMPL_CHECK   — decide: send next implication, or the done packet
-  IMPL_SEND    — serialise 6-byte implication packet over UART TX
-  DONE_SEND    — serialise 4-byte done/conflict packet over UART TX
+  PAYLOAD_RECV — latching payload bytes into buf; the last byte
+                 dispatches the command (write enable or BCP start), and
+                 inside a WRITE_BATCH reloads for the next payload
+  BURST_RECV   — receiving WRITE_CLAUSE_BURST clause bodies; each 12th
+                 byte writes one clause and advances the clause address
+  BCP_WAIT     — waiting for the accelerator done pulse; queues the first
+                 packet in the same cycle when the TX FIFO has room
+  IMPL_CHECK   — queue the next implication packet (one per cycle) into
+                 the TX FIFO, or the done packet and back to CMD_WAIT
 """
 
 from amaranth import *
+from amaranth.lib.fifo import SyncFIFO, SyncFIFOBuffered
 
-from memory.clause_memory import MAX_CLAUSES, LIT_WIDTH
+from memory.clause_memory import MAX_CLAUSES, LIT_WIDTH, CLAUSE_WORD_BYTES
 from memory.watch_list_memory import (NUM_LITERALS, MAX_WATCH_LEN,
                                       CLAUSE_ID_WIDTH, LENGTH_WIDTH)
 from memory.assignment_memory import MAX_VARS
@@ -42,15 +56,67 @@ CMD_WRITE_WL_LEN   = 0x03
 CMD_WRITE_ASSIGN   = 0x04
 CMD_BCP_START      = 0x05
 CMD_RESET_STATE    = 0x06
+CMD_WRITE_CLAUSE_BURST = 0x08
+CMD_WRITE_CLAUSE_BYTE  = 0x09
+CMD_WRITE_BATCH        = 0x0A
 
 # ── Response bytes ─────────────────────────────────────────────────────────
 RSP_IMPLICATION = 0xB0
 RSP_DONE_OK     = 0xC0
 RSP_DONE_CONF   = 0xC1
 
+# Payload length of each command that takes one (RESET_STATE has none)
+PAYLOAD_LEN = {
+    CMD_WRITE_CLAUSE:       14,
+    CMD_WRITE_WL_ENTRY:     5,
+    CMD_WRITE_WL_LEN:       3,
+    CMD_WRITE_ASSIGN:       3,
+    CMD_BCP_START:          2,
+    CMD_WRITE_CLAUSE_BURST: 4,
+    CMD_WRITE_CLAUSE_BYTE:  4,
+    CMD_WRITE_BATCH:        2,
+}
+
+# Dispatch bits of the command decode ROM's control word (one-hot): which
+# write enable the last payload byte pulses, or which sequencer it starts.
+# Bits 0..4 hold the payload length (see HostInterface.elaborate).
+CTRL_CLAUSE      = 5
+CTRL_CLAUSE_BYTE = 6
+CTRL_WL_ENTRY    = 7
+CTRL_WL_LEN      = 8
+CTRL_ASSIGN      = 9
+CTRL_BCP_START   = 10
+CTRL_BATCH       = 11
+CTRL_BURST       = 12
+CTRL_WIDTH       = 13
+
+DISPATCH = {
+    CMD_WRITE_CLAUSE:       CTRL_CLAUSE,
+    CMD_WRITE_WL_ENTRY:     CTRL_WL_ENTRY,
+    CMD_WRITE_WL_LEN:       CTRL_WL_LEN,
+    CMD_WRITE_ASSIGN:       CTRL_ASSIGN,
+    CMD_BCP_START:          CTRL_BCP_START,
+    CMD_WRITE_CLAUSE_BURST: CTRL_BURST,
+    CMD_WRITE_CLAUSE_BYTE:  CTRL_CLAUSE_BYTE,
+    CMD_WRITE_BATCH:        CTRL_BATCH,
+}
+
+# Commands a WRITE_BATCH may repeat: single-payload memory writes only
+BATCHABLE = (CMD_WRITE_CLAUSE, CMD_WRITE_WL_ENTRY, CMD_WRITE_WL_LEN,
+             CMD_WRITE_ASSIGN, CMD_WRITE_CLAUSE_BYTE)
+
 # Maximum payload length across all commands
 MAX_PAYLOAD = 14
 
+# Received bytes buffered between the UART receiver and the command FSM
+RX_FIFO_DEPTH = 4
+
+# Response packets buffered between the response FSM and the UART
+# transmitter
+TX_FIFO_DEPTH = 4
+# Longest response packet (implication)
+MAX_PACKET = 6
+
 
 class HostInterface(Elaboratable):
     """
@@ -62,8 +128,11 @@ class HostInterface(Elaboratable):
 
     Ports — UART RX (from UARTReceiver)
     ------------------------------------
-    rx_data  : Signal(8), in
-    rx_valid : Signal(),  in  — one-cycle strobe per received byte
+    rx_data    : Signal(8), in
+    rx_valid   : Signal(),  in  — one-cycle strobe per received byte
+    rx_ready   : Signal(),  out — the RX skid buffer has room for a byte
+    rx_overrun : Signal(),  out — sticky: a byte arrived while rx_ready was
+                                  low and was dropped; cleared by RESET_STATE
 
     Ports — UART TX (to UARTTransmitter)
     -------------------------------------
@@ -89,15 +158,18 @@ class HostInterface(Elaboratable):
 
     Ports — Memory write ports (driven to BCPAccelerator write port inputs)
     ------------------------------------------------------------------------
-    clause_wr_*  — Clause database
+    clause_wr_*  — Clause database (clause_wr_byte_en picks the byte lanes)
     wl_wr_*      — Watch lists
     assign_wr_*  — Variable assignments
+    assign_clear_all — one-cycle pulse on RESET_STATE
     """
 
     def __init__(self):
         # UART
         self.rx_data  = Signal(8)
         self.rx_valid = Signal()
+        self.rx_ready = Signal()
+        self.rx_overrun = Signal()
         self.tx_data  = Signal(8)
         self.tx_valid = Signal()
         self.tx_ready = Signal()
@@ -126,6 +198,8 @@ class HostInterface(Elaboratable):
         self.clause_wr_lit3    = Signal(LIT_WIDTH)
         self.clause_wr_lit4    = Signal(LIT_WIDTH)
         self.clause_wr_en      = Signal()
+        self.clause_wr_byte_en = Signal(CLAUSE_WORD_BYTES,
+                                        init=(1 << CLAUSE_WORD_BYTES) - 1)
 
         # Watch list write port
         self.wl_wr_lit    = Signal(range(NUM_LITERALS))
@@ -139,227 +213,367 @@ class HostInterface(Elaboratable):
         self.assign_wr_addr = Signal(range(MAX_VARS))
         self.assign_wr_data = Signal(2)
         self.assign_wr_en   = Signal()
+        self.assign_clear_all = Signal()
 
     def elaborate(self, platform):
         m = Module()
 
+        # ── RX skid buffer ──────────────────────────────────────────────────
+        # Received bytes queue here and the FSM takes at most one per cycle
+        # in the states that consume them, so bytes that arrive back to back,
+        # or while a BCP call is being answered, wait instead of being lost.
+        m.submodules.rx_fifo = rx_fifo = SyncFIFO(width=8,
+                                                  depth=RX_FIFO_DEPTH)
+        rx_byte  = Signal(8)    # byte at the buffer head
+        rx_avail = Signal()     # rx_byte is valid
+        rx_take  = Signal()     # the current state consumes rx_byte
+        m.d.comb += [
+            rx_fifo.w_data.eq(self.rx_data),
+            rx_fifo.w_en.eq(self.rx_valid),
+            self.rx_ready.eq(rx_fifo.w_rdy),
+            rx_byte.eq(rx_fifo.r_data),
+            rx_avail.eq(rx_fifo.r_rdy),
+            rx_fifo.r_en.eq(rx_take),
+        ]
+
         # ── Payload receive buffer ──────────────────────────────────────────
-        # Array of MAX_PAYLOAD byte registers; addressed by buf_idx at runtime.
-        buf = Array([Signal(8, name=f"buf_{i}") for i in range(MAX_PAYLOAD)])
-        cmd         = Signal(8)   # latched command byte
-        payload_len = Signal(4)   # expected payload length (0..14)
-        buf_idx     = Signal(4)   # current write position into buf (0..13)
-
-        # ── TX shift register ───────────────────────────────────────────────
-        # Holds up to 6 bytes LSB-first.  The byte at bits [0:8] is always
-        # the next byte to transmit.  When a byte is accepted (tx_ready high),
-        # we shift right by 8 and decrement tx_count.
-        tx_shift = Signal(48)
-        tx_count = Signal(3)      # bytes remaining to send (0..6)
+        # Each received byte is latched straight into byte slot bytes_left
+        # of buf, so the payload lands end-aligned (last byte lowest) and
+        # only one 8-bit register loads per byte, rather than the whole
+        # buffer shifting.  Slot 0 is never stored: the last byte is used
+        # live from rx_byte.
+        buf        = Signal((MAX_PAYLOAD - 1) * 8)   # slots 1..13
+        cmd        = Signal(8)    # latched command byte
+        bytes_left = Signal(4)    # bytes still expected, minus one (0..13)
+
+        def store_byte():
+            """Latch rx_byte into slot bytes_left (1..13) of buf."""
+            with m.Switch(bytes_left):
+                for k in range(1, MAX_PAYLOAD):
+                    with m.Case(k):
+                        m.d.sync += buf[(k - 1) * 8:k * 8].eq(rx_byte)
+
+        # buf completed by the byte on rx_byte.  In the cycle a payload's
+        # last byte arrives this holds the whole payload end-aligned, so a
+        # field is found by its distance from the end.
+        rx_word = Signal(MAX_PAYLOAD * 8)
+        m.d.comb += rx_word.eq(Cat(rx_byte, buf))
+
+        # Command byte → control word micro-ROM, indexed by the low nibble
+        # (all opcodes are 0x01..0x0A): bit 4 flags a command that takes a
+        # payload, bits 0..3 are its length minus one (bytes_left's reload)
+        # and bits 5.. are the one-hot CTRL_* dispatch bits.  A new opcode
+        # is one more ROM entry rather than another decoder arm.
+        decode_rom = Array(
+            Const(0x10 | (PAYLOAD_LEN[op] - 1) | (1 << DISPATCH[op]),
+                  CTRL_WIDTH) if op in PAYLOAD_LEN
+            else Const(0, CTRL_WIDTH)
+            for op in range(16))
+
+        # Control word of the latched command
+        ctrl = Signal(CTRL_WIDTH)
+        m.d.comb += ctrl.eq(decode_rom[cmd[:4]])
+
+        def field(end, n=1):
+            """n-byte big-endian payload field followed by `end` more bytes."""
+            return rx_word[end * 8:(end + n) * 8]
+
+        # ── WRITE_BATCH state ───────────────────────────────────────────────
+        batch_left = Signal(8)    # payloads still to receive, this one included
+        batch_len  = Signal(4)    # bytes_left reload for each payload
+        batchable  = Const(sum(1 << op for op in BATCHABLE), 16)
+
+        # ── WRITE_CLAUSE_BURST state ────────────────────────────────────────
+        burst_count = Signal(16)  # clauses still to receive (1..65535)
+        burst_addr  = Signal(range(MAX_CLAUSES))  # next clause_id to write
+
+        # ── Write-port data ─────────────────────────────────────────────────
+        # At most one write enable is pulsed per cycle, so the data ports are
+        # wired straight to their payload fields and only the enables are
+        # decoded per command.  A clause body ends the same way in
+        # WRITE_CLAUSE and WRITE_CLAUSE_BURST, so both share these slices.
+        m.d.comb += [
+            # [size:1][sat:1][lit0:2][lit1:2][lit2:2][lit3:2][lit4:2]
+            self.clause_wr_size.eq(   field(11)),
+            self.clause_wr_sat_bit.eq(field(10)),
+            self.clause_wr_lit0.eq(   field(8, 2)),
+            self.clause_wr_lit1.eq(   field(6, 2)),
+            self.clause_wr_lit2.eq(   field(4, 2)),
+            self.clause_wr_lit3.eq(   field(2, 2)),
+            self.clause_wr_lit4.eq(   field(0, 2)),
+            # WRITE_WL_ENTRY [lit:2][idx:1][clause_id:2]
+            self.wl_wr_idx.eq(        field(2)),
+            self.wl_wr_data.eq(       field(0, 2)),
+            # WRITE_WL_LEN [lit:2][len:1]
+            self.wl_wr_len.eq(        field(0)),
+            # WRITE_ASSIGN [var:2][val:1]
+            self.assign_wr_addr.eq(   field(1, 2)),
+            self.assign_wr_data.eq(   field(0)),
+            # BCP_START [false_lit:2]
+            self.bcp_false_lit.eq(    field(0, 2)),
+        ]
 
         # ── Latched BCP result ──────────────────────────────────────────────
-        conflict_reg    = Signal()
+        # The done status byte is resolved when bcp_done is captured, so the
+        # TX path reads a flop instead of a Mux on a conflict flag.
+        done_b0         = Signal(8)   # 0xC0 or 0xC1
         conflict_id_reg = Signal(range(MAX_CLAUSES))
 
-        # ── Combinational response-byte helpers ─────────────────────────────
-        # Implication packet bytes (derived from impl_* ports)
-        impl_b1 = Signal(8)   # var  high byte  (1 bit zero-extended)
-        impl_b2 = Signal(8)   # var  low  byte
-        impl_b3 = Signal(8)   # value      byte (1 bit zero-extended)
-        impl_b4 = Signal(8)   # reason high byte (5 bits zero-extended)
-        impl_b5 = Signal(8)   # reason low  byte
+        # ── Response packets ────────────────────────────────────────────────
+        # Built whole, first byte in the top byte.  The implication packet is
+        # taken straight from the implication FIFO head, which is popped in
+        # the same cycle the packet is queued.
+        impl_var16    = Signal(16)
+        impl_value8   = Signal(8)
+        impl_reason16 = Signal(16)
+        impl_pkt      = Signal(MAX_PACKET * 8)
         m.d.comb += [
-            impl_b1.eq(self.impl_var[8:]),
-            impl_b2.eq(self.impl_var[:8]),
-            impl_b3.eq(self.impl_value),
-            impl_b4.eq(self.impl_reason[8:]),
-            impl_b5.eq(self.impl_reason[:8]),
+            impl_var16.eq(self.impl_var),
+            impl_value8.eq(self.impl_value),
+            impl_reason16.eq(self.impl_reason),
+            impl_pkt.eq(Cat(impl_reason16, impl_value8, impl_var16,
+                            Const(RSP_IMPLICATION, 8))),
         ]
 
-        # Done packet bytes (derived from latched conflict registers)
-        done_b0 = Signal(8)   # 0xC0 or 0xC1
-        done_b1 = Signal(8)   # conflict_id high byte
-        done_b2 = Signal(8)   # conflict_id low  byte
+        # The done packet comes from the latched result, except in the
+        # bcp_done cycle itself (done_direct), when it is not latched yet.
+        done_direct = Signal()
+        done_status = Signal(8)
+        done_id16   = Signal(16)
+        m.d.comb += [
+            done_status.eq(Mux(done_direct,
+                               Mux(self.bcp_conflict,
+                                   RSP_DONE_CONF, RSP_DONE_OK),
+                               done_b0)),
+            done_id16.eq(Mux(done_direct,
+                             self.bcp_conflict_id, conflict_id_reg)),
+        ]
+
+        # ── TX FIFO ─────────────────────────────────────────────────────────
+        # Whole packets are queued here in one cycle each and serialised
+        # below at the UART's pace, so the FSM can queue the next
+        # implication while earlier packets are still being sent.  An entry
+        # is the 48-bit packet plus a flag marking a 3-byte done packet
+        # (which then sits in the top three bytes).
+        m.submodules.tx_fifo = tx_fifo = SyncFIFOBuffered(
+            width=MAX_PACKET * 8 + 1, depth=TX_FIFO_DEPTH)
+
+        def queue_packet():
+            """If the TX FIFO has room: queue the implication FIFO head as a
+            6-byte packet and pop it (then IMPL_CHECK for more), or, once no
+            implications are left, the 3-byte done packet (then CMD_WAIT)."""
+            with m.If(tx_fifo.w_rdy):
+                m.d.comb += tx_fifo.w_en.eq(1)
+                with m.If(self.impl_valid):
+                    m.d.comb += [
+                        tx_fifo.w_data.eq(Cat(impl_pkt, Const(0, 1))),
+                        self.impl_ready.eq(1),
+                    ]
+                    m.next = "IMPL_CHECK"
+                with m.Else():
+                    m.d.comb += tx_fifo.w_data.eq(
+                        Cat(Const(0, 24), done_id16, done_status,
+                            Const(1, 1)))
+                    m.next = "CMD_WAIT"
+
+        # ── TX serialiser ───────────────────────────────────────────────────
+        # Shifts the packet at the FIFO head out to the UART one byte per
+        # tx_ready, loading the next packet as the last byte is accepted.
+        tx_pkt  = Signal(MAX_PACKET * 8)          # next byte in the top byte
+        tx_left = Signal(range(MAX_PACKET + 1))   # bytes of tx_pkt still to send
+        tx_load = Signal()
         m.d.comb += [
-            done_b0.eq(Mux(conflict_reg, RSP_DONE_CONF, RSP_DONE_OK)),
-            done_b1.eq(conflict_id_reg[8:]),
-            done_b2.eq(conflict_id_reg[:8]),
+            self.tx_data.eq(tx_pkt[-8:]),
+            self.tx_valid.eq(tx_left != 0),
+            tx_load.eq((tx_left == 0) | ((tx_left == 1) & self.tx_ready)),
+            tx_fifo.r_en.eq(tx_load),
         ]
+        with m.If(tx_load & tx_fifo.r_rdy):
+            m.d.sync += [
+                tx_pkt.eq(tx_fifo.r_data[:-1]),
+                tx_left.eq(Mux(tx_fifo.r_data[-1], 3, MAX_PACKET)),
+            ]
+        with m.Elif(self.tx_valid & self.tx_ready):
+            m.d.sync += [
+                tx_pkt.eq(Cat(Const(0, 8), tx_pkt[:-8])),
+                tx_left.eq(tx_left - 1),
+            ]
 
         # ── FSM ─────────────────────────────────────────────────────────────
-        with m.FSM():
+        with m.FSM() as fsm:
 
             # ----------------------------------------------------------------
-            # CMD_WAIT: idle until a command byte arrives on rx_valid.
+            # CMD_WAIT: idle until a command byte is in the RX buffer.
             # ----------------------------------------------------------------
             with m.State("CMD_WAIT"):
-                with m.If(self.rx_valid):
-                    m.d.sync += [
-                        cmd.eq(self.rx_data),
-                        buf_idx.eq(0),
-                    ]
-                    with m.Switch(self.rx_data):
-                        with m.Case(CMD_WRITE_CLAUSE):
-                            m.d.sync += payload_len.eq(14)
-                            m.next = "PAYLOAD_RECV"
-                        with m.Case(CMD_WRITE_WL_ENTRY):
-                            m.d.sync += payload_len.eq(5)
-                            m.next = "PAYLOAD_RECV"
-                        with m.Case(CMD_WRITE_WL_LEN, CMD_WRITE_ASSIGN):
-                            m.d.sync += payload_len.eq(3)
-                            m.next = "PAYLOAD_RECV"
-                        with m.Case(CMD_BCP_START):
-                            m.d.sync += payload_len.eq(2)
-                            m.next = "PAYLOAD_RECV"
-                        with m.Default():
-                            # 0-byte payload (e.g. RESET_STATE): execute directly
-                            m.d.sync += payload_len.eq(0)
-                            m.next = "CMD_EXEC"
+                m.d.comb += rx_take.eq(1)
+                with m.If(rx_avail):
+                    m.d.sync += cmd.eq(rx_byte)
+                    rom_entry = decode_rom[rx_byte[:4]]
+                    with m.If((rx_byte[4:] == 0) & rom_entry[4]):
+                        m.d.sync += bytes_left.eq(rom_entry[:4])
+                        m.next = "PAYLOAD_RECV"
+                    with m.If(rx_byte == CMD_RESET_STATE):
+                        # 0-byte payload: execute on the command byte
+                        m.d.comb += self.assign_clear_all.eq(1)
 
             # ----------------------------------------------------------------
-            # PAYLOAD_RECV: shift incoming bytes into buf[] one at a time.
+            # PAYLOAD_RECV: latch incoming bytes into buf one at a time.
+            # The command is dispatched in the same cycle as its last byte,
+            # reading its fields from rx_word (that byte is never stored).
+            # Write enables are asserted combinationally so that exactly one
+            # memory write cycle occurs; the data ports are already driven
+            # from the payload above.
             # ----------------------------------------------------------------
             with m.State("PAYLOAD_RECV"):
-                with m.If(self.rx_valid):
-                    m.d.sync += buf[buf_idx].eq(self.rx_data)
-                    with m.If(buf_idx + 1 >= payload_len):
-                        m.next = "CMD_EXEC"
-                    with m.Else():
-                        m.d.sync += buf_idx.eq(buf_idx + 1)
-
-            # ----------------------------------------------------------------
-            # CMD_EXEC: one-cycle dispatch based on the latched command byte.
-            # All write enables are asserted combinationally so that exactly
-            # one memory write cycle occurs.
-            # ----------------------------------------------------------------
-            with m.State("CMD_EXEC"):
-                with m.Switch(cmd):
-
-                    with m.Case(CMD_WRITE_CLAUSE):
-                        # buf: [clause_id:2][size:1][sat:1][lit0:2][lit1:2][lit2:2][lit3:2][lit4:2]
-                        m.d.comb += [
-                            self.clause_wr_addr.eq(   Cat(buf[1],  buf[0])),
-                            self.clause_wr_size.eq(        buf[2]),
-                            self.clause_wr_sat_bit.eq(     buf[3]),
-                            self.clause_wr_lit0.eq(    Cat(buf[5],  buf[4])),
-                            self.clause_wr_lit1.eq(    Cat(buf[7],  buf[6])),
-                            self.clause_wr_lit2.eq(    Cat(buf[9],  buf[8])),
-                            self.clause_wr_lit3.eq(    Cat(buf[11], buf[10])),
-                            self.clause_wr_lit4.eq(    Cat(buf[13], buf[12])),
-                            self.clause_wr_en.eq(1),
-                        ]
+                m.d.comb += rx_take.eq(1)
+                with m.If(rx_avail):
+                    with m.If(bytes_left == 0):
                         m.next = "CMD_WAIT"
-
-                    with m.Case(CMD_WRITE_WL_ENTRY):
-                        # buf: [lit:2][idx:1][clause_id:2]
+                        # Inside a WRITE_BATCH cmd is the repeated command:
+                        # stay here for its next payload until count runs out
+                        with m.If(batch_left != 0):
+                            m.d.sync += [
+                                batch_left.eq(batch_left - 1),
+                                bytes_left.eq(batch_len),
+                            ]
+                            with m.If(batch_left != 1):
+                                m.next = "PAYLOAD_RECV"
+                        # Dispatch from the control word: the enables are
+                        # its one-hot bits, and the two address fields that
+                        # sit at different payload offsets pick theirs by
+                        # the same bits.
                         m.d.comb += [
-                            self.wl_wr_lit.eq(  Cat(buf[1], buf[0])),
-                            self.wl_wr_idx.eq(      buf[2]),
-                            self.wl_wr_data.eq( Cat(buf[4], buf[3])),
-                            self.wl_wr_en.eq(1),
+                            self.clause_wr_en.eq(ctrl[CTRL_CLAUSE] |
+                                                 ctrl[CTRL_CLAUSE_BYTE]),
+                            self.wl_wr_en.eq(    ctrl[CTRL_WL_ENTRY]),
+                            self.wl_wr_len_en.eq(ctrl[CTRL_WL_LEN]),
+                            self.assign_wr_en.eq(ctrl[CTRL_ASSIGN]),
+                            self.bcp_start.eq(   ctrl[CTRL_BCP_START]),
+                            # WRITE_CLAUSE [clause_id:2] ahead of the
+                            # 12-byte body; WRITE_CLAUSE_BYTE
+                            # [clause_id:2][offset:1][data:1]
+                            self.clause_wr_addr.eq(
+                                Mux(ctrl[CTRL_CLAUSE_BYTE],
+                                    field(2, 2), field(12, 2))),
+                            # WRITE_WL_LEN [lit:2][len:1];
+                            # WRITE_WL_ENTRY [lit:2][idx:1][clause_id:2]
+                            self.wl_wr_lit.eq(
+                                Mux(ctrl[CTRL_WL_LEN],
+                                    field(1, 2), field(3, 2))),
                         ]
-                        m.next = "CMD_WAIT"
 
-                    with m.Case(CMD_WRITE_WL_LEN):
-                        # buf: [lit:2][len:1]
-                        m.d.comb += [
-                            self.wl_wr_lit.eq(    Cat(buf[1], buf[0])),
-                            self.wl_wr_len.eq(        buf[2]),
-                            self.wl_wr_len_en.eq(1),
-                        ]
-                        m.next = "CMD_WAIT"
+                        with m.If(ctrl[CTRL_CLAUSE_BYTE]):
+                            # The data byte is repeated on every lane of the
+                            # clause word and only lane `offset` is enabled
+                            data = field(0)
+                            m.d.comb += [
+                                self.clause_wr_byte_en.eq(
+                                    Const(1, CLAUSE_WORD_BYTES) << field(1)),
+                                self.clause_wr_sat_bit.eq(data[0]),
+                                self.clause_wr_size.eq(   data[1:4]),
+                                self.clause_wr_lit0.eq(   Cat(data, data)),
+                                self.clause_wr_lit1.eq(   Cat(data, data)),
+                                self.clause_wr_lit2.eq(   Cat(data, data)),
+                                self.clause_wr_lit3.eq(   Cat(data, data)),
+                                self.clause_wr_lit4.eq(   Cat(data, data)),
+                            ]
+
+                        with m.If(ctrl[CTRL_BCP_START]):
+                            m.next = "BCP_WAIT"
+
+                        with m.If(ctrl[CTRL_BATCH]):
+                            # [cmd:1][count:1] — payloads follow; an empty
+                            # batch or a command that cannot be batched is
+                            # ignored
+                            sub_cmd   = field(1)
+                            sub_entry = decode_rom[sub_cmd[:4]]
+                            m.d.sync += [
+                                cmd.eq(sub_cmd),
+                                batch_left.eq(field(0)),
+                                batch_len.eq(sub_entry[:4]),
+                                bytes_left.eq(sub_entry[:4]),
+                            ]
+                            with m.If((sub_cmd[4:] == 0) &
+                                      batchable.bit_select(sub_cmd[:4], 1) &
+                                      (field(0) != 0)):
+                                m.next = "PAYLOAD_RECV"
+                            with m.Else():
+                                m.d.sync += batch_left.eq(0)
+
+                        with m.If(ctrl[CTRL_BURST]):
+                            # [count:2][clause_id:2] — clause bodies follow
+                            m.d.sync += [
+                                burst_count.eq(field(2, 2)),
+                                burst_addr.eq( field(0, 2)),
+                                bytes_left.eq(11),
+                            ]
+                            with m.If(field(2, 2) != 0):
+                                m.next = "BURST_RECV"
+                    with m.Else():
+                        store_byte()
+                        m.d.sync += bytes_left.eq(bytes_left - 1)
 
-                    with m.Case(CMD_WRITE_ASSIGN):
-                        # buf: [var:2][val:1]
+            # ----------------------------------------------------------------
+            # BURST_RECV: like PAYLOAD_RECV for a 12-byte clause body whose
+            # clause_id is implicit.  The last byte writes the clause; the
+            # FSM stays here for the next one until burst_count runs out.
+            # ----------------------------------------------------------------
+            with m.State("BURST_RECV"):
+                m.d.comb += rx_take.eq(1)
+                with m.If(rx_avail):
+                    with m.If(bytes_left == 0):
                         m.d.comb += [
-                            self.assign_wr_addr.eq(Cat(buf[1], buf[0])),
-                            self.assign_wr_data.eq(    buf[2]),
-                            self.assign_wr_en.eq(1),
+                            self.clause_wr_addr.eq(burst_addr),
+                            self.clause_wr_en.eq(1),
                         ]
-                        m.next = "CMD_WAIT"
-
-                    with m.Case(CMD_BCP_START):
-                        # buf: [false_lit:2]
-                        m.d.comb += [
-                            self.bcp_false_lit.eq(Cat(buf[1], buf[0])),
-                            self.bcp_start.eq(1),
+                        m.d.sync += [
+                            burst_addr.eq(burst_addr + 1),
+                            burst_count.eq(burst_count - 1),
+                            bytes_left.eq(11),
                         ]
-                        m.next = "BCP_WAIT"
-
-                    with m.Default():
-                        m.next = "CMD_WAIT"
+                        with m.If(burst_count == 1):
+                            m.next = "CMD_WAIT"
+                    with m.Else():
+                        store_byte()
+                        m.d.sync += bytes_left.eq(bytes_left - 1)
 
             # ----------------------------------------------------------------
             # BCP_WAIT: hold until the accelerator pulses done (1 cycle).
-            # Latch conflict info immediately since done is a 1-cycle pulse.
+            # Latch conflict info immediately since done is a 1-cycle pulse,
+            # and queue the first packet in the same cycle, taking the done
+            # packet straight from the accelerator.  Only if the TX FIFO is
+            # full does the FSM fall back to IMPL_CHECK to wait for room.
             # ----------------------------------------------------------------
             with m.State("BCP_WAIT"):
                 with m.If(self.bcp_done):
                     m.d.sync += [
-                        conflict_reg.eq(self.bcp_conflict),
+                        done_b0.eq(Mux(self.bcp_conflict,
+                                       RSP_DONE_CONF, RSP_DONE_OK)),
                         conflict_id_reg.eq(self.bcp_conflict_id),
                     ]
+                    m.d.comb += done_direct.eq(1)
                     m.next = "IMPL_CHECK"
+                    queue_packet()
 
             # ----------------------------------------------------------------
-            # IMPL_CHECK: if the implication FIFO has data, load and send a
-            # 6-byte implication packet; otherwise send the 4-byte done packet.
+            # IMPL_CHECK: queue one implication per cycle while the TX FIFO
+            # has room, then the done packet (see queue_packet).
             # ----------------------------------------------------------------
             with m.State("IMPL_CHECK"):
-                with m.If(self.impl_valid):
-                    m.d.sync += [
-                        tx_shift.eq(Cat(
-                            Const(RSP_IMPLICATION, 8),
-                            impl_b1, impl_b2, impl_b3, impl_b4, impl_b5,
-                        )),
-                        tx_count.eq(6),
-                    ]
-                    m.next = "IMPL_SEND"
-                with m.Else():
-                    m.d.sync += [
-                        tx_shift.eq(Cat(
-                            done_b0,
-                            done_b1, done_b2,
-                            Const(0x00, 8),
-                        )),
-                        tx_count.eq(4),
-                    ]
-                    m.next = "DONE_SEND"
-
-            # ----------------------------------------------------------------
-            # IMPL_SEND: shift out the 6 implication bytes one per tx_ready.
-            # On the last byte, pulse impl_ready to pop the FIFO and return
-            # to IMPL_CHECK to check for more implications.
-            # ----------------------------------------------------------------
-            with m.State("IMPL_SEND"):
-                m.d.comb += [
-                    self.tx_data.eq(tx_shift[0:8]),
-                    self.tx_valid.eq(1),
-                ]
-                with m.If(self.tx_ready):
-                    m.d.sync += [
-                        tx_shift.eq(Cat(tx_shift[8:], Const(0, 8))),
-                        tx_count.eq(tx_count - 1),
-                    ]
-                    with m.If(tx_count == 1):
-                        # Last byte — pop the FIFO entry we just described
-                        m.d.comb += self.impl_ready.eq(1)
-                        m.next = "IMPL_CHECK"
-
-            # ----------------------------------------------------------------
-            # DONE_SEND: shift out the 4 done/conflict bytes, then idle.
-            # ----------------------------------------------------------------
-            with m.State("DONE_SEND"):
-                m.d.comb += [
-                    self.tx_data.eq(tx_shift[0:8]),
-                    self.tx_valid.eq(1),
-                ]
-                with m.If(self.tx_ready):
-                    m.d.sync += [
-                        tx_shift.eq(Cat(tx_shift[8:], Const(0, 8))),
-                        tx_count.eq(tx_count - 1),
-                    ]
-                    with m.If(tx_count == 1):
-                        m.next = "CMD_WAIT"
+                queue_packet()
+
+        # ── RX overrun flag ─────────────────────────────────────────────────
+        # The host may send at most RX_FIFO_DEPTH bytes while a BCP call is
+        # being answered; a byte that finds the buffer full is dropped and
+        # flagged until RESET_STATE.
+        with m.If(self.rx_valid & ~self.rx_ready):
+            m.d.sync += self.rx_overrun.eq(1)
+        with m.Elif(self.assign_clear_all):
+            m.d.sync += self.rx_overrun.eq(0)
+
+        # One-hot state register: every transition and per-state output is
+        # a single flop test.  Yosys' fsm pass honours fsm_encoding.
+        fsm.state.attrs["fsm_encoding"] = "one-hot"
 
         return m
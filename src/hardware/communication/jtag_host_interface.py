@@ -17,20 +17,25 @@ Protocol — 128-bit DR register accessed via ER1 (IR=0x32):
     [119:104] var         (16 bits, for IMPL)
     [103:96]  val         (8 bits, for IMPL)
     [95:80]   reason      (16 bits, for IMPL) / clause_id (for DONE)
-    [79:8]    reserved    (72 bits)
+    [79:64]   var2        (16 bits, second implication when count = 2)
+    [63:56]   val2        (8 bits)
+    [55:40]   reason2     (16 bits)
+    [39:32]   count       (implications in this word, 1 or 2, for IMPL)
+    [31:8]    reserved    (24 bits)
     [7:0]     ack_seq     (echoes seq_num when command consumed)
 
-  New command (JTAG only): CMD_ACK_IMPL = 0x07 -- pops implication FIFO.
+  New command (JTAG only): CMD_ACK_IMPL = 0x07 -- acknowledges the
+  implications in the current response word and moves on to the next.
 
 Clock domain crossing (2-FF synchronizer, adopted from proven bcp_engine.py):
   - Command path (jtck -> sync): jce1 & jupdate latches rx_shift into a
-    stable register and asserts a valid flag.  A 2-FF synchronizer with
-    edge detection in the sync domain picks up the new command.  Data is
-    safe to sample because it was stable for many jtck cycles before the
-    edge propagates.
-  - Response path (sync -> jtck): a shadow register in the sync domain
-    continuously snapshots the response word.  The jtck domain reads it
-    asynchronously — standard practice for slow-changing status registers.
+    stable register and pulses a PulseSynchronizer (2-FF synchronized
+    toggle with edge detection), whose one-cycle output in the sync domain
+    picks up the new command.  Data is safe to sample because it was
+    stable for many jtck cycles before the edge propagates.
+  - Response path (sync -> jtck): the response word is built from
+    sync-domain registers (the combinational status byte goes through a
+    shadow register).  The jtck domain reads it asynchronously — standard practice for slow-changing status registers.
 
 JTAG shift register (adapted from proven bcp_engine.py implementation):
   - Edge detection on jshift: first shift loads rsp_shadow, subsequent
@@ -45,9 +50,12 @@ handles the BCP lifecycle.
 
 FSM states:
   IDLE       -- waiting for bcp_start_pending
-  BCP_WAIT   -- waiting for the accelerator done pulse
-  IMPL_CHECK -- decide: load next implication or the done packet
-  IMPL_READY -- implication available, waiting for ack_impl_pending
+  BCP_WAIT   -- waiting for the accelerator done pulse; loads the first
+                implication or the done packet in the same cycle
+  IMPL_CHECK -- after an ACK: load (and pop) next implication or the
+                done packet
+  IMPL_PAIR  -- load (and pop) a second implication if one is queued
+  IMPL_READY -- implications available, waiting for ack_impl_pending
   DONE_READY -- BCP finished, results loaded, waiting for next command
 
 Constructor parameter use_jtagg_primitive (default True):
@@ -57,6 +65,7 @@ Constructor parameter use_jtagg_primitive (default True):
 
 from amaranth import *
 from amaranth.hdl import *
+from amaranth.lib.cdc import PulseSynchronizer
 
 from memory.clause_memory import MAX_CLAUSES, LIT_WIDTH
 from memory.watch_list_memory import (NUM_LITERALS, MAX_WATCH_LEN,
@@ -72,6 +81,27 @@ CMD_BCP_START      = 0x05
 CMD_RESET_STATE    = 0x06
 CMD_ACK_IMPL       = 0x07
 
+# Control word of the command decode micro-ROM: one-hot bits, one per
+# opcode, each setting that command's *_pending flag.
+CTRL_CLAUSE      = 0
+CTRL_WL_ENTRY    = 1
+CTRL_WL_LEN      = 2
+CTRL_ASSIGN      = 3
+CTRL_BCP_START   = 4
+CTRL_RESET_STATE = 5
+CTRL_ACK_IMPL    = 6
+CTRL_WIDTH       = 7
+
+DISPATCH = {
+    CMD_WRITE_CLAUSE:   CTRL_CLAUSE,
+    CMD_WRITE_WL_ENTRY: CTRL_WL_ENTRY,
+    CMD_WRITE_WL_LEN:   CTRL_WL_LEN,
+    CMD_WRITE_ASSIGN:   CTRL_ASSIGN,
+    CMD_BCP_START:      CTRL_BCP_START,
+    CMD_RESET_STATE:    CTRL_RESET_STATE,
+    CMD_ACK_IMPL:       CTRL_ACK_IMPL,
+}
+
 # -- Response status bytes -----------------------------------------------------
 RSP_IDLE        = 0x00
 RSP_BUSY        = 0x01
@@ -140,6 +170,7 @@ class JTAGHostInterface(Elaboratable):
         self.assign_wr_addr = Signal(range(MAX_VARS))
         self.assign_wr_data = Signal(2)
         self.assign_wr_en   = Signal()
+        self.assign_clear_all = Signal()
 
     def elaborate(self, platform):
         m = Module()
@@ -181,25 +212,42 @@ class JTAGHostInterface(Elaboratable):
         rsp_var       = Signal(16)
         rsp_val       = Signal(8)
         rsp_reason_id = Signal(16)
+        rsp_var2      = Signal(16)
+        rsp_val2      = Signal(8)
+        rsp_reason2   = Signal(16)
+        rsp_count     = Signal(8)
         ack_seq       = Signal(8)
         conflict_reg    = Signal()
         conflict_id_reg = Signal(range(MAX_CLAUSES))
 
+        # Shadow registers for reads.  rsp_status is decoded combinationally
+        # from the FSM state, so it is snapshotted (with ack_seq, to keep the
+        # two in step) to give the jtck domain a glitch-free value.  The
+        # other fields are already sync-domain registers, loaded at least a
+        # cycle before the status that publishes them, so they are read as
+        # they are rather than copied every cycle.
+        status_shadow = Signal(8)
+        ack_shadow    = Signal(8)
+        m.d.sync += [
+            status_shadow.eq(rsp_status),
+            ack_shadow.eq(ack_seq),
+        ]
+
         # Assemble the 128-bit response word
-        jtag_data = Signal(REG_WIDTH)
-        m.d.comb += jtag_data.eq(Cat(
-            ack_seq,                    # [7:0]
-            Const(0, 72),               # [79:8]   reserved
+        jtag_shadow = Signal(REG_WIDTH)
+        m.d.comb += jtag_shadow.eq(Cat(
+            ack_shadow,                 # [7:0]
+            Const(0, 24),               # [31:8]   reserved
+            rsp_count,                  # [39:32]
+            rsp_reason2,                # [55:40]
+            rsp_val2,                   # [63:56]
+            rsp_var2,                   # [79:64]
             rsp_reason_id,              # [95:80]
             rsp_val,                    # [103:96]
             rsp_var,                    # [119:104]
-            rsp_status,                 # [127:120]
+            status_shadow,              # [127:120]
         ))
 
-        # Shadow register for reads
-        jtag_shadow = Signal(REG_WIDTH)
-        m.d.sync += jtag_shadow.eq(jtag_data)
-
         # JTAG read shift register
         shift_reg = Signal(REG_WIDTH)
         jshift_prev = Signal()
@@ -221,7 +269,6 @@ class JTAGHostInterface(Elaboratable):
         # JTAG write path
         rx_shift = Signal(REG_WIDTH)
         jtag_rx = Signal(REG_WIDTH)
-        jtag_rx_toggle = Signal()
 
         # Track whether ER1 was selected during the shift phase
         er1_was_selected = Signal()
@@ -235,39 +282,53 @@ class JTAGHostInterface(Elaboratable):
             m.d.jtag += rx_shift.eq(Cat(rx_shift[1:], jtdi))
 
         # Latch: jupdate + ER1 was selected (NOT gated by jce1)
-        with m.If(jupdate & er1_was_selected):
-            m.d.jtag += [
-                jtag_rx.eq(rx_shift),
-                jtag_rx_toggle.eq(~jtag_rx_toggle),
-            ]
-
-        # Synchronize rx into sync domain (toggle-based CDC)
-        toggle_sync1 = Signal()
-        toggle_sync2 = Signal()
-        toggle_prev = Signal()
-        rx_data_latched = Signal(REG_WIDTH)
-
-        m.d.sync += toggle_sync1.eq(jtag_rx_toggle)
-        m.d.sync += toggle_sync2.eq(toggle_sync1)
-        m.d.sync += toggle_prev.eq(toggle_sync2)
-
+        rx_update = Signal()
+        m.d.comb += rx_update.eq(jupdate & er1_was_selected)
+        with m.If(rx_update):
+            m.d.jtag += jtag_rx.eq(rx_shift)
+
+        # Carry the update into the sync domain: the pulse synchroniser's
+        # output is the XOR of its 2-FF synchronised toggle against a
+        # delayed copy, so cmd_pending is high for exactly one sync cycle.
+        #
+        # jtag_rx is read directly in the sync domain rather than copied
+        # into a second 128-bit register: it only changes on Update-DR, and
+        # every reader below samples it in the cmd_pending cycle, a few sync
+        # cycles after the update and a whole scan before the next one.
+        m.submodules.cmd_psync = cmd_psync = PulseSynchronizer(
+            i_domain="jtag", o_domain="sync")
         cmd_pending = Signal()
-        with m.If(toggle_sync2 ^ toggle_prev):
-            m.d.sync += [
-                cmd_pending.eq(1),
-                rx_data_latched.eq(jtag_rx),
-            ]
+        m.d.comb += [
+            cmd_psync.i.eq(rx_update),
+            cmd_pending.eq(cmd_psync.o),
+        ]
 
         # ==================================================================
         # Sync domain: command processing + FSM
         # ==================================================================
 
-        # Payload byte extraction (big-endian: buf[0] = payload[119:112])
-        # payload sits at rx_data_latched[8:120]
-        buf = Array([Signal(8, name=f"pbyte_{i}") for i in range(14)])
-        for i in range(14):
-            lo = 112 - i * 8
-            m.d.comb += buf[i].eq(rx_data_latched[lo:lo+8])
+        # Payload byte extraction (big-endian: pbyte(0) = payload[119:112])
+        # payload sits at jtag_rx[8:120]
+        def pbyte(i):
+            return jtag_rx[112 - i * 8:120 - i * 8]
+
+        # The word is shifted in MSB first, so a big-endian 16-bit field is
+        # already a contiguous slice: pword(i) == Cat(pbyte(i + 1), pbyte(i))
+        def pword(i):
+            return jtag_rx[104 - i * 8:120 - i * 8]
+
+        # Shared field decoders.  Every payload starts at pbyte(0), so the
+        # leading 16-bit address/literal sits at the same bits for all
+        # commands; one decoder each is read by every Switch arm below.
+        addr16    = Signal(16)    # clause_id / lit / var / false_lit
+        data16    = Signal(16)    # WRITE_WL_ENTRY clause_id
+        lit_pairs = [Signal(16, name=f"lit_pair_{i}") for i in range(5)]
+        m.d.comb += [
+            addr16.eq(pword(0)),
+            data16.eq(pword(3)),
+        ]
+        for i in range(5):
+            m.d.comb += lit_pairs[i].eq(pword(4 + 2 * i))
 
         # -- Latched command data registers --------------------------------
         clause_addr_r  = Signal(range(MAX_CLAUSES))
@@ -296,6 +357,7 @@ class JTAGHostInterface(Elaboratable):
         assign_wr_pending  = Signal()
         bcp_start_pending  = Signal()
         ack_impl_pending   = Signal()
+        assign_clear_pending = Signal()
         any_cmd_processed  = Signal()
 
         # Auto-clear one-shot flag each cycle (overridden when cmd_pending)
@@ -304,65 +366,63 @@ class JTAGHostInterface(Elaboratable):
         # =================================================================
         # Command processing — fires on cmd_pending, independent of FSM
         # =================================================================
-        cmd_byte = rx_data_latched[120:128]
-        with m.If(cmd_pending):
-            m.d.sync += cmd_pending.eq(0)
+        cmd_byte = jtag_rx[120:128]
+
+        # Opcode → control word lookup, indexed by the low nibble (all
+        # opcodes are 0x01..0x07).  Anything else, NOP scans (0x00)
+        # included, maps to an all-zero word and sets no flag.
+        decode_rom = Array(
+            Const(1 << DISPATCH[op], CTRL_WIDTH) if op in DISPATCH
+            else Const(0, CTRL_WIDTH)
+            for op in range(16))
+        ctrl = Signal(CTRL_WIDTH)
+        m.d.comb += ctrl.eq(Mux(cmd_byte[4:] == 0,
+                                decode_rom[cmd_byte[:4]], 0))
 
-            # Only process real commands (skip NOP scans with cmd_byte=0x00)
-            with m.If((cmd_byte >= CMD_WRITE_CLAUSE) & (cmd_byte <= CMD_ACK_IMPL)):
+        with m.If(cmd_pending):
+            # Only process real commands (skip NOP scans with cmd_byte=0x00).
+            # The host never sends opcodes past CMD_ACK_IMPL, so a zero test
+            # is enough; unknown opcodes decode to no pending flag.
+            with m.If(cmd_byte != 0):
                 m.d.sync += [
                     any_cmd_processed.eq(1),
-                    ack_seq.eq(rx_data_latched[0:8]),
+                    ack_seq.eq(jtag_rx[0:8]),
                 ]
 
-            with m.Switch(cmd_byte):
-
-                with m.Case(CMD_WRITE_CLAUSE):
-                    m.d.sync += [
-                        clause_addr_r.eq(Cat(buf[1], buf[0])),
-                        clause_size_r.eq(buf[2]),
-                        clause_sat_r.eq(buf[3]),
-                        clause_lit0_r.eq(Cat(buf[5], buf[4])),
-                        clause_lit1_r.eq(Cat(buf[7], buf[6])),
-                        clause_lit2_r.eq(Cat(buf[9], buf[8])),
-                        clause_lit3_r.eq(Cat(buf[11], buf[10])),
-                        clause_lit4_r.eq(Cat(buf[13], buf[12])),
-                        clause_wr_pending.eq(1),
-                    ]
-
-                with m.Case(CMD_WRITE_WL_ENTRY):
-                    m.d.sync += [
-                        wl_lit_r.eq(Cat(buf[1], buf[0])),
-                        wl_idx_r.eq(buf[2]),
-                        wl_data_r.eq(Cat(buf[4], buf[3])),
-                        wl_wr_pending.eq(1),
-                    ]
-
-                with m.Case(CMD_WRITE_WL_LEN):
-                    m.d.sync += [
-                        wl_lit_r.eq(Cat(buf[1], buf[0])),
-                        wl_len_r.eq(buf[2]),
-                        wl_len_pending.eq(1),
-                    ]
-
-                with m.Case(CMD_WRITE_ASSIGN):
-                    m.d.sync += [
-                        assign_addr_r.eq(Cat(buf[1], buf[0])),
-                        assign_data_r.eq(buf[2]),
-                        assign_wr_pending.eq(1),
-                    ]
-
-                with m.Case(CMD_BCP_START):
-                    m.d.sync += [
-                        bcp_false_lit_r.eq(Cat(buf[1], buf[0])),
-                        bcp_start_pending.eq(1),
-                    ]
-
-                with m.Case(CMD_ACK_IMPL):
-                    m.d.sync += ack_impl_pending.eq(1)
-
-                with m.Case(CMD_RESET_STATE):
-                    pass
+            # Every write command's fields sit at fixed payload offsets, so
+            # the data registers latch unconditionally and only the pending
+            # flags are decoded.  A flag is consumed the cycle after it is
+            # set, long before the next scan can overwrite its data.
+            m.d.sync += [
+                clause_addr_r.eq(addr16),
+                clause_size_r.eq(pbyte(2)),
+                clause_sat_r.eq(pbyte(3)),
+                clause_lit0_r.eq(lit_pairs[0]),
+                clause_lit1_r.eq(lit_pairs[1]),
+                clause_lit2_r.eq(lit_pairs[2]),
+                clause_lit3_r.eq(lit_pairs[3]),
+                clause_lit4_r.eq(lit_pairs[4]),
+                wl_lit_r.eq(addr16),
+                wl_idx_r.eq(pbyte(2)),
+                wl_data_r.eq(data16),
+                wl_len_r.eq(pbyte(2)),
+                assign_addr_r.eq(addr16),
+                assign_data_r.eq(pbyte(2)),
+            ]
+            # BCP_START may wait in pending for the current call to finish,
+            # so its literal is only taken from its own command.
+            with m.If(ctrl[CTRL_BCP_START]):
+                m.d.sync += bcp_false_lit_r.eq(addr16)
+
+            for flag, bit in ((clause_wr_pending,    CTRL_CLAUSE),
+                              (wl_wr_pending,        CTRL_WL_ENTRY),
+                              (wl_len_pending,       CTRL_WL_LEN),
+                              (assign_wr_pending,    CTRL_ASSIGN),
+                              (bcp_start_pending,    CTRL_BCP_START),
+                              (assign_clear_pending, CTRL_RESET_STATE),
+                              (ack_impl_pending,     CTRL_ACK_IMPL)):
+                with m.If(ctrl[bit]):
+                    m.d.sync += flag.eq(1)
 
         # =================================================================
         # Write-enable pulse generation (one cycle after pending is set)
@@ -398,6 +458,10 @@ class JTAGHostInterface(Elaboratable):
                 self.wl_wr_len_en.eq(1),
             ]
 
+        with m.If(assign_clear_pending):
+            m.d.sync += assign_clear_pending.eq(0)
+            m.d.comb += self.assign_clear_all.eq(1)
+
         with m.If(assign_wr_pending):
             m.d.sync += assign_wr_pending.eq(0)
             m.d.comb += [
@@ -413,6 +477,31 @@ class JTAGHostInterface(Elaboratable):
         in_impl_ready = Signal()
         in_done_ready = Signal()
 
+        # Implications are popped as they are latched into the response
+        # registers, up to two per response word, so one ACK_IMPL round
+        # trip covers a pair.
+        def load_first(conflict_id):
+            """Latch and pop the implication FIFO head (then IMPL_PAIR for
+            a second), or, once none are left, the done result (then
+            DONE_READY)."""
+            with m.If(self.impl_valid):
+                m.d.sync += [
+                    rsp_var.eq(self.impl_var),
+                    rsp_val.eq(self.impl_value),
+                    rsp_reason_id.eq(self.impl_reason),
+                    rsp_count.eq(1),
+                ]
+                m.d.comb += self.impl_ready.eq(1)
+                m.next = "IMPL_PAIR"
+            with m.Else():
+                m.d.sync += [
+                    rsp_var.eq(0),
+                    rsp_val.eq(0),
+                    rsp_reason_id.eq(conflict_id),
+                    rsp_count.eq(0),
+                ]
+                m.next = "DONE_READY"
+
         with m.FSM():
             with m.State("IDLE"):
                 m.d.comb += rsp_status.eq(RSP_IDLE)
@@ -424,6 +513,8 @@ class JTAGHostInterface(Elaboratable):
                     ]
                     m.next = "BCP_WAIT"
 
+            # The first implication (or the done result, taken straight
+            # from the accelerator) is loaded in the bcp_done cycle itself.
             with m.State("BCP_WAIT"):
                 m.d.comb += rsp_status.eq(RSP_BUSY)
                 m.d.sync += in_bcp_wait.eq(1)
@@ -432,31 +523,30 @@ class JTAGHostInterface(Elaboratable):
                         conflict_reg.eq(self.bcp_conflict),
                         conflict_id_reg.eq(self.bcp_conflict_id),
                     ]
-                    m.next = "IMPL_CHECK"
+                    load_first(self.bcp_conflict_id)
 
+            # Reached after an ACK_IMPL: load the next implication(s)
             with m.State("IMPL_CHECK"):
+                m.d.comb += rsp_status.eq(RSP_BUSY)
+                load_first(conflict_id_reg)
+
+            with m.State("IMPL_PAIR"):
                 m.d.comb += rsp_status.eq(RSP_BUSY)
                 with m.If(self.impl_valid):
                     m.d.sync += [
-                        rsp_var.eq(self.impl_var),
-                        rsp_val.eq(self.impl_value),
-                        rsp_reason_id.eq(self.impl_reason),
+                        rsp_var2.eq(self.impl_var),
+                        rsp_val2.eq(self.impl_value),
+                        rsp_reason2.eq(self.impl_reason),
+                        rsp_count.eq(2),
                     ]
-                    m.next = "IMPL_READY"
-                with m.Else():
-                    m.d.sync += [
-                        rsp_var.eq(0),
-                        rsp_val.eq(0),
-                        rsp_reason_id.eq(conflict_id_reg),
-                    ]
-                    m.next = "DONE_READY"
+                    m.d.comb += self.impl_ready.eq(1)
+                m.next = "IMPL_READY"
 
             with m.State("IMPL_READY"):
                 m.d.comb += rsp_status.eq(RSP_IMPLICATION)
                 m.d.sync += in_impl_ready.eq(1)
                 with m.If(ack_impl_pending):
                     m.d.sync += ack_impl_pending.eq(0)
-                    m.d.comb += self.impl_ready.eq(1)
                     m.next = "IMPL_CHECK"
                 with m.Elif(any_cmd_processed):
                     m.next = "IDLE"
@@ -543,16 +633,21 @@ class JTAGHostInterface(Elaboratable):
         # ==================================================================
         # Store the command byte from the last received command
         last_cmd_byte = Signal(8)
-        cmd_hold_counter = Signal(28)  # ~2.6 seconds @ 100MHz
-        
+        # The hold time counts in units of 2^16 cycles: a free-running
+        # 16-bit prescaler enables the hold counter once per wrap, so the
+        # decrement only switches once every 655 us.
+        led_prescale = Signal(16)
+        cmd_hold_counter = Signal(12)  # 4095 × 2^16 cycles ≈ 2.7 s @ 100MHz
+        m.d.sync += led_prescale.eq(led_prescale + 1)
+
         # When command arrives, latch it and start hold counter
         with m.If(cmd_pending):
             m.d.sync += [
                 last_cmd_byte.eq(cmd_byte),
-                cmd_hold_counter.eq(268_435_455),  # Max value for 28-bit signal
+                cmd_hold_counter.eq(4095),  # Max value for 12-bit signal
             ]
-        # Otherwise, decrement hold counter
-        with m.Elif(cmd_hold_counter != 0):
+        # Otherwise, decrement hold counter once per prescaler wrap
+        with m.Elif((cmd_hold_counter != 0) & (led_prescale == 0)):
             m.d.sync += cmd_hold_counter.eq(cmd_hold_counter - 1)
         
         # ── LED assignments — binary display of command byte ──────────────
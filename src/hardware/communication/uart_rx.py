@@ -1,38 +1,51 @@
 """
 UART Receiver Module for the BCP Accelerator Host Interface.
 
-Standard 8N1 UART receiver. Samples the RX line at 16x the baud rate
-(oversampling for noise rejection), then shifts in 8 data bits, and
-pulses `rx_valid` for one cycle when a complete byte is ready.
+Standard 8N1 UART receiver. Samples the RX line every clock cycle and
+takes each bit as the 3-of-5 majority of the samples around its centre
+(noise rejection), then shifts in 8 data bits, and pulses `rx_valid` for
+one cycle when a complete byte is ready.
 
 Parameters
 ----------
 divisor : int
     Clock cycles per bit = clk_freq / baud_rate.
     At 12 MHz / 1 Mbaud = 12.
+baud : BaudGen or None
+    Bit-period counter shared with the transmitter (elaborated by the
+    parent).  None instantiates a private one.
 
 Ports
 -----
 rx_pin   : Signal(1), in   — raw serial input (idle high)
 rx_data  : Signal(8), out  — received byte (valid for one cycle)
 rx_valid : Signal(),  out  — pulsed for one cycle when rx_data is ready
-rx_err   : Signal(),  out  — framing error (stop bit was not 1)
+                             (registered, one cycle after the stop bit check)
+rx_err   : Signal(),  out  — framing error (stop bit was not 1), registered
 """
 
 from amaranth import *
 
+from .baud_gen import BaudGen
+
 
 class UARTReceiver(Elaboratable):
     """
     8N1 UART Receiver.
 
-    Detects the start bit (falling edge on rx_pin), waits half a bit
-    period to centre-sample the start bit, then samples each of the 8
-    data bits at the centre of their windows, then checks the stop bit.
+    Detects the start bit (falling edge on rx_pin), notes which phase of
+    the shared bit-period counter falls half a bit later, and samples the
+    start bit, the 8 data bits and the stop bit each time the counter
+    comes back round to that phase, i.e. at the centre of every bit.
+    Every "sample" is a majority vote over five consecutive cycles
+    centred on the bit centre, so a glitch shorter than three cycles is
+    ignored.  Needs divisor >= 8.
     """
 
-    def __init__(self, divisor: int = 12):
+    def __init__(self, divisor: int = 12, baud=None):
+        assert baud is None or baud.divisor == divisor
         self.divisor = divisor
+        self.baud    = baud
 
         self.rx_pin   = Signal(reset=1)   # idle high
         self.rx_data  = Signal(8)
@@ -45,6 +58,10 @@ class UARTReceiver(Elaboratable):
         divisor   = self.divisor
         half_div  = divisor // 2
 
+        baud = self.baud
+        if baud is None:
+            m.submodules.baud = baud = BaudGen(divisor)
+
         # Synchronise the async rx_pin into the clock domain (2-FF sync)
         rx_sync0 = Signal(reset=1)
         rx_sync1 = Signal(reset=1)
@@ -56,62 +73,84 @@ class UARTReceiver(Elaboratable):
         ]
 
         # Internal state
-        bit_timer = Signal(range(divisor))
         bit_count = Signal(range(9))       # 0..7 = data bits
         shift_reg = Signal(8)
 
         falling_edge = rx_prev & ~rx_sync1  # idle→start transition
 
-        # rx_data is combinational from shift_reg so it is already valid
-        # in the same cycle that rx_valid is asserted (no off-by-one).
+        # Bit centres are the cycles in which baud.count equals
+        # sample_phase.  The first, for the start bit, lies half a period
+        # (plus two cycles for the vote window) after the edge, so the
+        # phase is the count that far ahead, wrapped at divisor.
+        lead         = half_div + 2
+        sample_phase = Signal(range(divisor))
+        edge_phase   = Signal(range(divisor))
+        m.d.comb += edge_phase.eq(Mux(baud.count >= lead,
+                                      baud.count - lead,
+                                      baud.count + (divisor - lead)))
+        at_centre = Signal()
+        m.d.comb += at_centre.eq(baud.count == sample_phase)
+
+        # The last five synchronised samples, newest = rx_sync1.  The
+        # sampling point is pushed two cycles past the bit centre so the
+        # window is centred on it; a bit's value is the majority vote.
+        history = Signal(4, init=0b1111)
+        m.d.sync += history.eq(Cat(rx_sync1, history[:-1]))
+        window = Cat(rx_sync1, history)
+        sample = Signal()
+        m.d.comb += sample.eq(sum(window[i] for i in range(5)) >= 3)
+
+        # rx_data is combinational from shift_reg, which holds still in
+        # IDLE, so it is valid in the cycle the registered rx_valid pulses.
         m.d.comb += self.rx_data.eq(shift_reg)
 
-        with m.FSM():
+        # rx_valid / rx_err are registered one-cycle pulses: cleared every
+        # cycle unless the STOP state sets them below.
+        m.d.sync += [
+            self.rx_valid.eq(0),
+            self.rx_err.eq(0),
+        ]
+
+        with m.FSM() as fsm:
             with m.State("IDLE"):
                 with m.If(falling_edge):
-                    # Start bit detected — wait half a period to centre-sample
-                    m.d.sync += bit_timer.eq(half_div - 1)
+                    # Start bit detected — latch the bit-centre phase
+                    m.d.sync += sample_phase.eq(edge_phase)
                     m.next = "START"
 
             with m.State("START"):
-                # Count down to the centre of the start bit
-                with m.If(bit_timer == 0):
+                # Wait for the centre of the start bit
+                with m.If(at_centre):
                     # Verify start bit is still low
-                    with m.If(rx_sync1):
+                    with m.If(sample):
                         # False start — return to IDLE
                         m.next = "IDLE"
                     with m.Else():
-                        m.d.sync += [
-                            bit_timer.eq(divisor - 1),
-                            bit_count.eq(0),
-                        ]
+                        m.d.sync += bit_count.eq(0)
                         m.next = "DATA"
-                with m.Else():
-                    m.d.sync += bit_timer.eq(bit_timer - 1)
 
             with m.State("DATA"):
-                with m.If(bit_timer == 0):
+                with m.If(at_centre):
                     m.d.sync += [
                         # Shift in LSB-first (standard UART bit order)
-                        shift_reg.eq(Cat(shift_reg[1:], rx_sync1)),
-                        bit_timer.eq(divisor - 1),
+                        shift_reg.eq(Cat(shift_reg[1:], sample)),
                         bit_count.eq(bit_count + 1),
                     ]
                     with m.If(bit_count == 7):
                         m.next = "STOP"
-                with m.Else():
-                    m.d.sync += bit_timer.eq(bit_timer - 1)
 
             with m.State("STOP"):
-                with m.If(bit_timer == 0):
-                    with m.If(rx_sync1):
+                with m.If(at_centre):
+                    with m.If(sample):
                         # Valid stop bit — rx_data already reflects shift_reg
-                        m.d.comb += self.rx_valid.eq(1)
+                        m.d.sync += self.rx_valid.eq(1)
                     with m.Else():
                         # Framing error
-                        m.d.comb += self.rx_err.eq(1)
+                        m.d.sync += self.rx_err.eq(1)
                     m.next = "IDLE"
-                with m.Else():
-                    m.d.sync += bit_timer.eq(bit_timer - 1)
+
+        # One-hot state register, as in HostInterface: each state test is
+        # a single flop.
+        fsm.state.attrs["fsm_encoding"] = "one-hot"
 
         return m
@@ -9,17 +9,23 @@ Parameters
 divisor : int
     Clock cycles per bit = clk_freq / baud_rate.
     At 12 MHz / 1 Mbaud = 12.
+baud : BaudGen or None
+    Bit-period counter shared with the receiver (elaborated by the
+    parent).  None instantiates a private one.
 
 Ports
 -----
-tx_pin   : Signal(1), out  — serial output (idle high)
+tx_pin   : Signal(1), out  — serial output (idle high), registered
 tx_data  : Signal(8), in   — byte to transmit
 tx_valid : Signal(),  in   — asserted by producer when tx_data is valid
-tx_ready : Signal(),  out  — asserted when transmitter can accept a new byte
+tx_ready : Signal(),  out  — asserted when transmitter can accept a new byte;
+                             pulses once per bit period, on the baud tick
 """
 
 from amaranth import *
 
+from .baud_gen import BaudGen
+
 
 class UARTTransmitter(Elaboratable):
     """
@@ -27,11 +33,15 @@ class UARTTransmitter(Elaboratable):
 
     When tx_valid & tx_ready, the byte on tx_data is latched and
     serialised: start bit (0), 8 data bits LSB-first, stop bit (1).
-    tx_ready goes low for the duration of the transmission.
+    Every bit boundary is a tick of the shared bit-period counter, so a
+    byte is only accepted on a tick; the last tick of a stop bit can
+    accept the next byte, keeping back-to-back bytes gap-free.
     """
 
-    def __init__(self, divisor: int = 12):
+    def __init__(self, divisor: int = 12, baud=None):
+        assert baud is None or baud.divisor == divisor
         self.divisor = divisor
+        self.baud    = baud
 
         self.tx_pin   = Signal(reset=1)   # idle high
         self.tx_data  = Signal(8)
@@ -41,54 +51,61 @@ class UARTTransmitter(Elaboratable):
     def elaborate(self, platform):
         m = Module()
 
-        divisor = self.divisor
+        baud = self.baud
+        if baud is None:
+            m.submodules.baud = baud = BaudGen(self.divisor)
 
-        bit_timer = Signal(range(divisor))
         bit_count = Signal(range(9))      # 0..7 = data bits, 8 = done
         shift_reg = Signal(8)
 
-        with m.FSM():
-            with m.State("IDLE"):
-                m.d.comb += self.tx_ready.eq(1)
-                m.d.comb += self.tx_pin.eq(1)          # idle high
+        # tx_pin is a register fed by the state decode below, so the pad is
+        # driven glitch-free straight from a flop.  Every edge moves one
+        # cycle later, which leaves the bit periods unchanged.
+        tx_next = Signal()
+        m.d.sync += self.tx_pin.eq(tx_next)
 
+        def accept():
+            """On a tick, latch the byte on tx_data if one is offered."""
+            with m.If(baud.tick):
+                m.d.comb += self.tx_ready.eq(1)
                 with m.If(self.tx_valid):
                     m.d.sync += [
                         shift_reg.eq(self.tx_data),
-                        bit_timer.eq(divisor - 1),
                         bit_count.eq(0),
                     ]
                     m.next = "START"
 
+        with m.FSM() as fsm:
+            with m.State("IDLE"):
+                m.d.comb += tx_next.eq(1)             # idle high
+                accept()
+
             with m.State("START"):
                 # Drive start bit (logic 0) for one full bit period
-                m.d.comb += self.tx_pin.eq(0)
-                with m.If(bit_timer == 0):
-                    m.d.sync += bit_timer.eq(divisor - 1)
+                m.d.comb += tx_next.eq(0)
+                with m.If(baud.tick):
                     m.next = "DATA"
-                with m.Else():
-                    m.d.sync += bit_timer.eq(bit_timer - 1)
 
             with m.State("DATA"):
                 # Drive current LSB; shift on each bit boundary
-                m.d.comb += self.tx_pin.eq(shift_reg[0])
-                with m.If(bit_timer == 0):
+                m.d.comb += tx_next.eq(shift_reg[0])
+                with m.If(baud.tick):
                     m.d.sync += [
                         shift_reg.eq(Cat(shift_reg[1:], 0)),
-                        bit_timer.eq(divisor - 1),
                         bit_count.eq(bit_count + 1),
                     ]
                     with m.If(bit_count == 7):
                         m.next = "STOP"
-                with m.Else():
-                    m.d.sync += bit_timer.eq(bit_timer - 1)
 
             with m.State("STOP"):
                 # Drive stop bit (logic 1) for one full bit period
-                m.d.comb += self.tx_pin.eq(1)
-                with m.If(bit_timer == 0):
+                m.d.comb += tx_next.eq(1)
+                with m.If(baud.tick):
                     m.next = "IDLE"
-                with m.Else():
-                    m.d.sync += bit_timer.eq(bit_timer - 1)
+                accept()
+
+        # One-hot state register: the tx_pin register is fed straight off
+        # the state flops rather than through a binary state decoder.
+        fsm.state.attrs["fsm_encoding"] = "one-hot"
 
         return m
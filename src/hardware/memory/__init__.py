@@ -1,9 +1,12 @@
 """Memory subsystem modules for the BCP Accelerator."""
 
-from .assignment_memory import AssignmentMemory, MAX_VARS, UNASSIGNED, FALSE, TRUE
+from .assignment_memory import (
+    AssignmentMemory, MAX_VARS, WORD_VARS, UNASSIGNED, FALSE, TRUE,
+)
 from .clause_memory import (
     ClauseMemory, MAX_CLAUSES, MAX_K, LIT_WIDTH, CLAUSE_WORD_WIDTH,
 )
 from .watch_list_memory import (
-    WatchListMemory, NUM_LITERALS, MAX_WATCH_LEN, CLAUSE_ID_WIDTH, LENGTH_WIDTH,
+    WatchListMemory, NUM_LITERALS, MAX_WATCH_LEN, MAX_WATCH_LEN_LOG2,
+    CLAUSE_ID_WIDTH, LENGTH_WIDTH,
 )
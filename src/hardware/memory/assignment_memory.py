@@ -4,6 +4,10 @@ Variable Assignment Memory Module for the BCP Accelerator.
 Stores the current assignment state (UNASSIGNED, FALSE, TRUE) for each variable.
 Used by the Clause Evaluator to determine literal truth values during BCP.
 
+Variables are packed WORD_VARS to a memory word (2 bits each), which keeps
+the RAM 32 bits wide and shallow; each read port picks its own variable out
+of the addressed word.
+
 See: Hardware Description/BCP_Accelerator_System_Architecture.md, Memory Module 3
 """
 
@@ -18,6 +22,7 @@ TRUE = 2
 
 # Default configuration
 MAX_VARS = 512
+WORD_VARS = 16          # variables per memory word (32 bits)
 
 
 class AssignmentMemory(Elaboratable):
@@ -28,6 +33,10 @@ class AssignmentMemory(Elaboratable):
     ----------
     max_vars : int
         Maximum number of variables (default 512).
+    num_rd_ports : int
+        Number of independent read ports (default 1).  Every port is an
+        asynchronous read of the same distributed RAM, which synthesis
+        replicates per port.
 
     Ports
     -----
@@ -35,47 +44,95 @@ class AssignmentMemory(Elaboratable):
         Variable ID to read.
     rd_data : Signal(2), out
         Assignment value for the addressed variable (0=UNASSIGNED, 1=FALSE, 2=TRUE).
+    rd_addrs, rd_datas : lists of num_rd_ports Signals
+        All read ports; rd_addr/rd_data are rd_addrs[0]/rd_datas[0].
     wr_addr : Signal(range(max_vars)), in
         Variable ID to write.
     wr_data : Signal(2), in
         Assignment value to write.
     wr_en : Signal(), in
         Write enable.
+    clear_all : Signal(), in
+        One-cycle strobe that resets every variable to UNASSIGNED.  A write
+        in the same cycle still takes effect for its own address.
     """
 
-    def __init__(self, max_vars=MAX_VARS):
+    def __init__(self, max_vars=MAX_VARS, num_rd_ports=1):
         self.max_vars = max_vars
+        self.num_rd_ports = num_rd_ports
 
-        # Read port (to Clause Evaluator)
-        self.rd_addr = Signal(range(max_vars))
-        self.rd_data = Signal(2)
+        # Read ports (to Clause Evaluator)
+        self.rd_addrs = [Signal(range(max_vars), name=f"rd_addr{i}")
+                         for i in range(num_rd_ports)]
+        self.rd_datas = [Signal(2, name=f"rd_data{i}")
+                         for i in range(num_rd_ports)]
+        self.rd_addr = self.rd_addrs[0]
+        self.rd_data = self.rd_datas[0]
 
         # Write port (from software when variables are assigned)
         self.wr_addr = Signal(range(max_vars))
         self.wr_data = Signal(2)
         self.wr_en = Signal()
 
+        # Bulk reset
+        self.clear_all = Signal()
+
     def elaborate(self, platform):
         m = Module()
 
-        # Instantiate the memory: 2-bit entries, one per variable
+        # Instantiate the memory: WORD_VARS 2-bit lanes per word.  At
+        # 512 × 2 bits it would fill a fraction of a block RAM, and the read
+        # port is asynchronous, so ask for distributed (LUT) RAM; Yosys and
+        # Vivado both honour ram_style.
+        word_bits = (WORD_VARS - 1).bit_length()
+        depth = -(-self.max_vars // WORD_VARS)
         m.submodules.mem = mem = Memory(
-            shape=2, depth=self.max_vars, init=[]
+            shape=2 * WORD_VARS, depth=depth, init=[],
+            attrs={"ram_style": "distributed"},
         )
 
-        # Read port - combinational (transparent) for single-cycle reads
-        rd_port = mem.read_port(domain="comb")
-        m.d.comb += [
-            rd_port.addr.eq(self.rd_addr),
-            self.rd_data.eq(rd_port.data),
-        ]
-
-        # Write port - synchronous
-        wr_port = mem.write_port()
+        # One valid bit per variable, held in registers so clear_all can
+        # drop them all in a single cycle; the RAM lane of a variable whose
+        # bit is clear is stale and reads as UNASSIGNED.
+        valid = Signal(depth * WORD_VARS)
+        with m.If(self.clear_all):
+            m.d.sync += valid.eq(0)
+        with m.If(self.wr_en):
+            m.d.sync += valid.bit_select(self.wr_addr, 1).eq(1)
+
+        # Read ports - combinational (transparent) for single-cycle reads.
+        # Each port addresses a word by the high address bits and picks its
+        # variable's lane out by the low ones, masked by its valid bit.
+        # Ports beyond the first replicate the distributed RAM (32 × 32 bits
+        # per copy) rather than banking it by variable ID: banks would need
+        # an address/data crossbar of about the same size plus a stall on
+        # every bank collision, where replicas never stall.
+        for addr, data in zip(self.rd_addrs, self.rd_datas):
+            port = mem.read_port(domain="comb")
+            m.d.comb += [
+                port.addr.eq(addr[word_bits:]),
+                data.eq(Mux(valid.bit_select(addr, 1),
+                            port.data.word_select(addr[:word_bits], 2),
+                            UNASSIGNED)),
+            ]
+
+        # Write port - synchronous, one enable per 2-bit lane, so a write
+        # updates its own variable without a read-modify-write.  The
+        # address follows wr_addr only while a write is pending and
+        # otherwise holds the last one written, so the RAM address inputs
+        # stay still between writes.
+        wr_port = mem.write_port(granularity=2)
+        last_wr_addr = Signal(range(depth))
         m.d.comb += [
-            wr_port.addr.eq(self.wr_addr),
-            wr_port.data.eq(self.wr_data),
-            wr_port.en.eq(self.wr_en),
+            wr_port.data.eq(self.wr_data.replicate(WORD_VARS)),
+            wr_port.en.eq(Mux(self.wr_en,
+                              C(1, WORD_VARS) << self.wr_addr[:word_bits],
+                              0)),
         ]
+        with m.If(self.wr_en):
+            m.d.comb += wr_port.addr.eq(self.wr_addr[word_bits:])
+            m.d.sync += last_wr_addr.eq(self.wr_addr[word_bits:])
+        with m.Else():
+            m.d.comb += wr_port.addr.eq(last_wr_addr)
 
         return m
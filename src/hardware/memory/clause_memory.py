@@ -1,8 +1,10 @@
 """
 Clause Database Memory Module for the BCP Accelerator.
 
-Stores all CNF clauses (original + learned) as 84-bit entries.
-Read by the Clause Prefetcher during BCP with 2-cycle read latency.
+Stores all CNF clauses (original + learned) as 88-bit (11-byte) entries
+with one write enable per byte, so a single field can be rewritten without
+the rest of the clause.  Read by the Clause Prefetcher during BCP with
+1-cycle read latency.
 
 See: Hardware Description/BCP_Accelerator_System_Architecture.md, Memory Module 1
 """
@@ -16,17 +18,19 @@ MAX_CLAUSES = 8192
 MAX_K = 5
 LIT_WIDTH = 16
 
-# Derived
-CLAUSE_WORD_WIDTH = 1 + 3 + MAX_K * LIT_WIDTH  # 84 bits
+# Derived: sat_bit + size share byte 0 (4 bits padding), literals follow
+# byte-aligned so that every field owns whole byte lanes
+CLAUSE_WORD_WIDTH = 8 + MAX_K * LIT_WIDTH      # 88 bits
+CLAUSE_WORD_BYTES = CLAUSE_WORD_WIDTH // 8     # 11 byte lanes
 
 
 class ClauseMemory(Elaboratable):
     """
     Clause Database Memory.
 
-    Packing (84-bit word, LSB-first):
-        sat_bit [0]    | size [1:4] | lit0 [4:20] | lit1 [20:36] |
-        lit2 [36:52]   | lit3 [52:68] | lit4 [68:84]
+    Packing (88-bit word, LSB-first; byte lane k is bits [8k:8k+8]):
+        sat_bit [0]    | size [1:4] | (pad) [4:8] | lit0 [8:24] |
+        lit1 [24:40]   | lit2 [40:56] | lit3 [56:72] | lit4 [72:88]
 
     Parameters
     ----------
@@ -46,7 +50,7 @@ class ClauseMemory(Elaboratable):
     rd_data_lit0..lit4 : Signal(16), out
         Literal encodings.
     rd_valid : Signal(), out
-        Data valid (asserted 2 cycles after rd_en).
+        Data valid (asserted 1 cycle after rd_en).
     wr_addr : Signal(range(max_clauses)), in
         Clause ID to write.
     wr_data_sat_bit : Signal(), in
@@ -54,6 +58,9 @@ class ClauseMemory(Elaboratable):
     wr_data_lit0..lit4 : Signal(16), in
     wr_en : Signal(), in
         Write enable.
+    wr_byte_en : Signal(11), in
+        Byte lanes written when wr_en is high (resets to all ones, so a
+        write port that leaves it undriven writes the whole clause).
     """
 
     def __init__(self, max_clauses=MAX_CLAUSES):
@@ -81,63 +88,74 @@ class ClauseMemory(Elaboratable):
         self.wr_data_lit3 = Signal(LIT_WIDTH)
         self.wr_data_lit4 = Signal(LIT_WIDTH)
         self.wr_en = Signal()
+        self.wr_byte_en = Signal(CLAUSE_WORD_BYTES,
+                                 init=(1 << CLAUSE_WORD_BYTES) - 1)
 
     def elaborate(self, platform):
         m = Module()
 
-        # Instantiate the memory: 84-bit entries, one per clause
+        # Instantiate the memory: 88-bit entries, one per clause
         m.submodules.mem = mem = Memory(
             shape=CLAUSE_WORD_WIDTH, depth=self.max_clauses, init=[]
         )
 
-        # --- Write port (synchronous) ---
-        wr_port = mem.write_port()
+        # --- Write port (port A, synchronous, one enable per byte lane) ---
+        # The address follows wr_addr only while wr_en is high and otherwise
+        # holds the last written clause, so the BRAM address inputs don't
+        # toggle with unrelated host-interface traffic.
+        wr_port = mem.write_port(granularity=8)
         wr_word = Signal(CLAUSE_WORD_WIDTH)
+        last_wr_addr = Signal.like(self.wr_addr)
+        with m.If(self.wr_en):
+            m.d.comb += wr_port.addr.eq(self.wr_addr)
+            m.d.sync += last_wr_addr.eq(self.wr_addr)
+        with m.Else():
+            m.d.comb += wr_port.addr.eq(last_wr_addr)
         m.d.comb += [
-            # Pack fields into 84-bit word
+            # Pack fields into 88-bit word
             wr_word[0].eq(self.wr_data_sat_bit),
             wr_word[1:4].eq(self.wr_data_size),
-            wr_word[4:20].eq(self.wr_data_lit0),
-            wr_word[20:36].eq(self.wr_data_lit1),
-            wr_word[36:52].eq(self.wr_data_lit2),
-            wr_word[52:68].eq(self.wr_data_lit3),
-            wr_word[68:84].eq(self.wr_data_lit4),
-            # Drive write port
-            wr_port.addr.eq(self.wr_addr),
-            wr_port.data.eq(wr_word),
-            wr_port.en.eq(self.wr_en),
+            wr_word[8:24].eq(self.wr_data_lit0),
+            wr_word[24:40].eq(self.wr_data_lit1),
+            wr_word[40:56].eq(self.wr_data_lit2),
+            wr_word[56:72].eq(self.wr_data_lit3),
+            wr_word[72:88].eq(self.wr_data_lit4),
+            wr_port.en.eq(Mux(self.wr_en, self.wr_byte_en, 0)),
         ]
+        # Each byte lane's data reaches the BRAM only while that lane is
+        # being written and is held at zero otherwise, so unrelated changes
+        # on wr_data_* don't toggle the data inputs of idle lanes.
+        for k in range(CLAUSE_WORD_BYTES):
+            with m.If(wr_port.en[k]):
+                m.d.comb += wr_port.data[8 * k:8 * k + 8].eq(
+                    wr_word[8 * k:8 * k + 8])
 
         # --- Read port (synchronous, 1-cycle latency from BRAM) ---
-        rd_port = mem.read_port(domain="sync")
+        # The BRAM output register is the only pipeline stage: fields are
+        # sliced straight off rd_port.data.  Port B of a true dual-port
+        # BRAM: it is not transparent to the write port, so a read in the
+        # same cycle as a write to the same clause returns the old data,
+        # and host writes and BCP reads proceed independently.
+        rd_port = mem.read_port(domain="sync", transparent_for=())
         m.d.comb += [
             rd_port.addr.eq(self.rd_addr),
             rd_port.en.eq(self.rd_en),
         ]
 
-        # Stage 1: BRAM output available after 1 clock (sync read port).
-        # We register it once more to get the spec's 2-cycle latency.
-        stage2_data = Signal(CLAUSE_WORD_WIDTH)
-        m.d.sync += stage2_data.eq(rd_port.data)
-
-        # Unpack stage-2 data to output fields
+        # Unpack BRAM output to output fields
         m.d.comb += [
-            self.rd_data_sat_bit.eq(stage2_data[0]),
-            self.rd_data_size.eq(stage2_data[1:4]),
-            self.rd_data_lit0.eq(stage2_data[4:20]),
-            self.rd_data_lit1.eq(stage2_data[20:36]),
-            self.rd_data_lit2.eq(stage2_data[36:52]),
-            self.rd_data_lit3.eq(stage2_data[52:68]),
-            self.rd_data_lit4.eq(stage2_data[68:84]),
+            self.rd_data_sat_bit.eq(rd_port.data[0]),
+            self.rd_data_size.eq(rd_port.data[1:4]),
+            self.rd_data_lit0.eq(rd_port.data[8:24]),
+            self.rd_data_lit1.eq(rd_port.data[24:40]),
+            self.rd_data_lit2.eq(rd_port.data[40:56]),
+            self.rd_data_lit3.eq(rd_port.data[56:72]),
+            self.rd_data_lit4.eq(rd_port.data[72:88]),
         ]
 
-        # rd_valid: 2-stage shift register on rd_en
+        # rd_valid: rd_en delayed by one cycle
         rd_en_pipe1 = Signal()
-        rd_en_pipe2 = Signal()
-        m.d.sync += [
-            rd_en_pipe1.eq(self.rd_en),
-            rd_en_pipe2.eq(rd_en_pipe1),
-        ]
-        m.d.comb += self.rd_valid.eq(rd_en_pipe2)
+        m.d.sync += rd_en_pipe1.eq(self.rd_en)
+        m.d.comb += self.rd_valid.eq(rd_en_pipe1)
 
         return m
@@ -2,11 +2,16 @@
 Watch List Memory Module for the BCP Accelerator.
 
 Maps each literal to its list of watching clause IDs.
-Read by the Watch List Manager during BCP with 2-cycle read latency.
+Read by the Watch List Manager during BCP with 1-cycle read latency.
 
 Two separate memories:
   - Length memory: 7-bit × NUM_LITERALS entries
-  - Clause ID memory: 13-bit × (NUM_LITERALS * MAX_WATCH_LEN) entries
+  - Clause ID memory: 13-bit × (NUM_LITERALS * MAX_WATCH_LEN) entries,
+    addressed by Cat(idx, lit) so no multiplier sits in front of the BRAM
+
+Both are true dual-port: writes use port A, reads use port B with
+old-data read-during-write (a read of the address being written returns
+the previous contents), so host writes never stall BCP reads.
 
 See: Hardware Description/BCP_Accelerator_System_Architecture.md, Memory Module 2
 """
@@ -17,7 +22,8 @@ from amaranth.lib.memory import Memory
 
 # Default configuration
 NUM_LITERALS = 1024
-MAX_WATCH_LEN = 100
+MAX_WATCH_LEN = 128
+MAX_WATCH_LEN_LOG2 = 7          # clause ID address = Cat(idx, lit)
 CLAUSE_ID_WIDTH = 13
 LENGTH_WIDTH = 7
 
@@ -34,7 +40,9 @@ class WatchListMemory(Elaboratable):
     num_literals : int
         Maximum number of literal encodings (default 1024).
     max_watch_len : int
-        Maximum watch list length per literal (default 100).
+        Maximum watch list length per literal (default 128).  Each
+        literal owns a power-of-two block of clause ID slots, so values
+        that are not a power of two are rounded up.
 
     Ports
     -----
@@ -45,11 +53,11 @@ class WatchListMemory(Elaboratable):
     rd_en : Signal(), in
         Read enable — reads both length and clause ID simultaneously.
     rd_len : Signal(LENGTH_WIDTH), out
-        Watch list length for rd_lit (valid 2 cycles after rd_en).
+        Watch list length for rd_lit (valid 1 cycle after rd_en).
     rd_data : Signal(CLAUSE_ID_WIDTH), out
-        Clause ID at rd_lit's watch list position rd_idx (valid 2 cycles after rd_en).
+        Clause ID at rd_lit's watch list position rd_idx (valid 1 cycle after rd_en).
     rd_valid : Signal(), out
-        Data valid (asserted 2 cycles after rd_en).
+        Data valid (asserted 1 cycle after rd_en).
     wr_lit : Signal(range(num_literals)), in
         Literal encoding to write.
     wr_idx : Signal(range(max_watch_len)), in
@@ -62,11 +70,20 @@ class WatchListMemory(Elaboratable):
         Write enable for clause ID memory.
     wr_len_en : Signal(), in
         Write enable for length memory.
+    wr_burst_start : Signal(), in
+        Begin a burst upload of wr_lit's watch list: writes wr_len to the
+        length memory and points the burst address at index 0 of wr_lit.
+    wr_burst_en : Signal(), in
+        Burst write enable — writes wr_burst_data at the burst address,
+        which then auto-increments.  Hold high for back-to-back entries.
+    wr_burst_data : Signal(CLAUSE_ID_WIDTH), in
+        Clause ID to write during a burst.
     """
 
     def __init__(self, num_literals=NUM_LITERALS, max_watch_len=MAX_WATCH_LEN):
         self.num_literals = num_literals
         self.max_watch_len = max_watch_len
+        self.idx_width = (max_watch_len - 1).bit_length()
 
         # Read port (to Watch List Manager)
         self.rd_lit = Signal(range(num_literals))
@@ -84,6 +101,11 @@ class WatchListMemory(Elaboratable):
         self.wr_en = Signal()
         self.wr_len_en = Signal()
 
+        # Burst write port (whole watch list, one entry per cycle)
+        self.wr_burst_start = Signal()
+        self.wr_burst_en = Signal()
+        self.wr_burst_data = Signal(CLAUSE_ID_WIDTH)
+
     def elaborate(self, platform):
         m = Module()
 
@@ -92,67 +114,83 @@ class WatchListMemory(Elaboratable):
             shape=LENGTH_WIDTH, depth=self.num_literals, init=[]
         )
 
-        # --- Clause ID memory: 13-bit × (num_literals * max_watch_len) ---
-        clause_id_depth = self.num_literals * self.max_watch_len
+        # --- Clause ID memory: 13-bit × (num_literals << idx_width) ---
+        clause_id_depth = self.num_literals << self.idx_width
         m.submodules.cid_mem = cid_mem = Memory(
             shape=CLAUSE_ID_WIDTH, depth=clause_id_depth, init=[]
         )
 
-        # Composite address for clause ID memory: lit * max_watch_len + idx
+        # Composite address for clause ID memory: lit in the high bits,
+        # idx in the low bits (a plain wire concat, no multiplier)
         rd_cid_addr = Signal(range(clause_id_depth))
         wr_cid_addr = Signal(range(clause_id_depth))
         m.d.comb += [
-            rd_cid_addr.eq(self.rd_lit * self.max_watch_len + self.rd_idx),
-            wr_cid_addr.eq(self.wr_lit * self.max_watch_len + self.wr_idx),
+            rd_cid_addr.eq(Cat(self.rd_idx[:self.idx_width], self.rd_lit)),
+            wr_cid_addr.eq(Cat(self.wr_idx[:self.idx_width], self.wr_lit)),
         ]
 
-        # --- Length memory write port ---
+        # --- Burst address: set by wr_burst_start, advanced per entry ---
+        burst_addr = Signal(range(clause_id_depth))
+        with m.If(self.wr_burst_start):
+            m.d.sync += burst_addr.eq(Cat(C(0, self.idx_width), self.wr_lit))
+        with m.Elif(self.wr_burst_en):
+            m.d.sync += burst_addr.eq(burst_addr + 1)
+
+        # Both write ports hold the last written address while no write is
+        # pending, so the BRAM address inputs don't toggle between writes.
+
+        # --- Length memory write port (port A) ---
         len_wr = len_mem.write_port()
+        last_len_addr = Signal.like(self.wr_lit)
         m.d.comb += [
-            len_wr.addr.eq(self.wr_lit),
             len_wr.data.eq(self.wr_len),
-            len_wr.en.eq(self.wr_len_en),
+            len_wr.en.eq(self.wr_len_en | self.wr_burst_start),
         ]
-
-        # --- Length memory read port (synchronous) ---
-        len_rd = len_mem.read_port(domain="sync")
+        with m.If(len_wr.en):
+            m.d.comb += len_wr.addr.eq(self.wr_lit)
+            m.d.sync += last_len_addr.eq(self.wr_lit)
+        with m.Else():
+            m.d.comb += len_wr.addr.eq(last_len_addr)
+
+        # --- Length memory read port (port B, synchronous, old data) ---
+        len_rd = len_mem.read_port(domain="sync", transparent_for=())
         m.d.comb += [
             len_rd.addr.eq(self.rd_lit),
             len_rd.en.eq(self.rd_en),
         ]
+        m.d.comb += self.rd_len.eq(len_rd.data)
 
-        # Stage 2 pipeline register for length
-        stage2_len = Signal(LENGTH_WIDTH)
-        m.d.sync += stage2_len.eq(len_rd.data)
-        m.d.comb += self.rd_len.eq(stage2_len)
-
-        # --- Clause ID memory write port ---
+        # --- Clause ID memory write port (port A) ---
         cid_wr = cid_mem.write_port()
-        m.d.comb += [
-            cid_wr.addr.eq(wr_cid_addr),
-            cid_wr.data.eq(self.wr_data),
-            cid_wr.en.eq(self.wr_en),
-        ]
-
-        # --- Clause ID memory read port (synchronous) ---
-        cid_rd = cid_mem.read_port(domain="sync")
+        last_cid_addr = Signal(range(clause_id_depth))
+        with m.If(self.wr_burst_en):
+            m.d.comb += [
+                cid_wr.addr.eq(burst_addr),
+                cid_wr.data.eq(self.wr_burst_data),
+                cid_wr.en.eq(1),
+            ]
+            m.d.sync += last_cid_addr.eq(burst_addr)
+        with m.Elif(self.wr_en):
+            m.d.comb += [
+                cid_wr.addr.eq(wr_cid_addr),
+                cid_wr.data.eq(self.wr_data),
+                cid_wr.en.eq(1),
+            ]
+            m.d.sync += last_cid_addr.eq(wr_cid_addr)
+        with m.Else():
+            m.d.comb += cid_wr.addr.eq(last_cid_addr)
+
+        # --- Clause ID memory read port (port B, synchronous, old data) ---
+        cid_rd = cid_mem.read_port(domain="sync", transparent_for=())
         m.d.comb += [
             cid_rd.addr.eq(rd_cid_addr),
             cid_rd.en.eq(self.rd_en),
         ]
+        m.d.comb += self.rd_data.eq(cid_rd.data)
 
-        # Stage 2 pipeline register for clause ID
-        stage2_data = Signal(CLAUSE_ID_WIDTH)
-        m.d.sync += stage2_data.eq(cid_rd.data)
-        m.d.comb += self.rd_data.eq(stage2_data)
-
-        # --- rd_valid: 2-stage shift register on rd_en ---
+        # --- rd_valid: rd_en delayed by one cycle ---
         rd_en_pipe1 = Signal()
-        rd_en_pipe2 = Signal()
-        m.d.sync += [
-            rd_en_pipe1.eq(self.rd_en),
-            rd_en_pipe2.eq(rd_en_pipe1),
-        ]
-        m.d.comb += self.rd_valid.eq(rd_en_pipe2)
+        m.d.sync += rd_en_pipe1.eq(self.rd_en)
+        m.d.comb += self.rd_valid.eq(rd_en_pipe1)
 
         return m
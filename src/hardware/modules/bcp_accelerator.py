@@ -13,7 +13,8 @@ See: Hardware Description/BCP_Accelerator_System_Architecture.md
 
 from amaranth import *
 
-from memory.clause_memory import ClauseMemory, MAX_CLAUSES, LIT_WIDTH
+from memory.clause_memory import (ClauseMemory, MAX_CLAUSES, MAX_K, LIT_WIDTH,
+                                  CLAUSE_WORD_BYTES)
 from memory.watch_list_memory import (WatchListMemory, NUM_LITERALS,
                                       MAX_WATCH_LEN, CLAUSE_ID_WIDTH, LENGTH_WIDTH)
 from memory.assignment_memory import AssignmentMemory, MAX_VARS
@@ -82,6 +83,8 @@ class BCPAccelerator(Elaboratable):
         self.clause_wr_lit3    = Signal(LIT_WIDTH)
         self.clause_wr_lit4    = Signal(LIT_WIDTH)
         self.clause_wr_en      = Signal()
+        self.clause_wr_byte_en = Signal(CLAUSE_WORD_BYTES,
+                                        init=(1 << CLAUSE_WORD_BYTES) - 1)
 
         # Watch list write port
         self.wl_wr_lit    = Signal(range(NUM_LITERALS))
@@ -90,16 +93,20 @@ class BCPAccelerator(Elaboratable):
         self.wl_wr_len    = Signal(LENGTH_WIDTH)
         self.wl_wr_en     = Signal()
         self.wl_wr_len_en = Signal()
+        self.wl_wr_burst_start = Signal()
+        self.wl_wr_burst_en    = Signal()
+        self.wl_wr_burst_data  = Signal(CLAUSE_ID_WIDTH)
 
         # Assignment memory write port
         self.assign_wr_addr = Signal(range(MAX_VARS))
         self.assign_wr_data = Signal(2)
         self.assign_wr_en   = Signal()
+        self.assign_clear_all = Signal()
 
         # --- Sub-modules (created here for external / test access) ---
         self.clause_mem = ClauseMemory()
         self.watch_mem = WatchListMemory()
-        self.assign_mem = AssignmentMemory()
+        self.assign_mem = AssignmentMemory(num_rd_ports=MAX_K)
         self.watch_mgr = WatchListManager()
         self.prefetcher = ClausePrefetcher()
         self.evaluator = ClauseEvaluator()
@@ -120,11 +127,18 @@ class BCPAccelerator(Elaboratable):
         m.submodules.clause_mem = clause_mem
         m.submodules.watch_mem = watch_mem
         m.submodules.assign_mem = assign_mem
-        m.submodules.watch_mgr = watch_mgr
+        # Once a conflict is latched the rest of the watch list is
+        # irrelevant, so the manager is held in reset until the round ends.
+        wlm_stop = Signal()
+        m.submodules.watch_mgr = ResetInserter(wlm_stop)(watch_mgr)
         m.submodules.prefetcher = prefetcher
         m.submodules.evaluator = evaluator
         m.submodules.impl_fifo = impl_fifo
 
+        fsm_starting = Signal()
+        conflict_reg = Signal()
+        wlm_valid = Signal()
+
         # =============================================================
         # Pipeline wiring
         # =============================================================
@@ -144,8 +158,9 @@ class BCPAccelerator(Elaboratable):
 
         # Watch List Manager → Clause Prefetcher
         m.d.comb += [
+            wlm_valid.eq(watch_mgr.clause_id_valid & ~wlm_stop),
             prefetcher.clause_id_in.eq(watch_mgr.clause_id),
-            prefetcher.clause_id_valid.eq(watch_mgr.clause_id_valid),
+            prefetcher.clause_id_valid.eq(wlm_valid),
         ]
 
         # Clause Prefetcher ↔ Clause Memory
@@ -163,9 +178,14 @@ class BCPAccelerator(Elaboratable):
         ]
 
         # Clause Prefetcher → Clause Evaluator
+        # The evaluator accepts a clause every cycle, so the BRAM output is
+        # evaluated in the cycle it arrives: the literals never leave the
+        # BRAM output register, and only the reduced result (clause_id,
+        # satisfied, two unassigned-count flags and the last unassigned
+        # literal) is registered in the evaluator.
         m.d.comb += [
-            evaluator.clause_id_in.eq(prefetcher.clause_id_out),
             evaluator.meta_valid.eq(prefetcher.meta_valid),
+            evaluator.clause_id_in.eq(prefetcher.clause_id_out),
             evaluator.sat_bit.eq(prefetcher.out_sat_bit),
             evaluator.size.eq(prefetcher.out_size),
             evaluator.lit0.eq(prefetcher.out_lit0),
@@ -175,16 +195,42 @@ class BCPAccelerator(Elaboratable):
             evaluator.lit4.eq(prefetcher.out_lit4),
         ]
 
-        # Clause Evaluator ↔ Assignment Memory
+        # Implication write-back: each UNIT result the FIFO accepts is also
+        # written into Assignment Memory, so later clauses in the same BCP
+        # round are evaluated against it instead of a stale snapshot
+        # (no duplicate or contradictory implications).  Results that
+        # arrive after a conflict, or outside a round, are dropped: the
+        # software backtracks on a conflict and never sees them.
+        impl_push = Signal()
+        impl_wr_en = Signal()
+        impl_wr_var = Signal(range(MAX_VARS))
+        impl_wr_data = Signal(2)
         m.d.comb += [
-            assign_mem.rd_addr.eq(evaluator.assign_rd_addr),
-            evaluator.assign_rd_data.eq(assign_mem.rd_data),
+            impl_push.eq(evaluator.result_valid
+                         & (evaluator.result_status == UNIT)
+                         & self.busy & ~conflict_reg),
+            impl_wr_en.eq(impl_push & ~impl_fifo.fifo_full),
+            impl_wr_var.eq(evaluator.result_implied_var),
+            # 0 (FALSE) → 1, 1 (TRUE) → 2
+            impl_wr_data.eq(evaluator.result_implied_val + 1),
         ]
 
+        # Clause Evaluator ↔ Assignment Memory, one read port per literal.
+        # The evaluator accepts the next clause in the same cycle it
+        # presents the previous result, so a write-back landing this cycle
+        # is forwarded onto any lane reading the same variable.
+        for i in range(MAX_K):
+            m.d.comb += assign_mem.rd_addrs[i].eq(evaluator.assign_rd_addr[i])
+            with m.If(impl_wr_en
+                      & (evaluator.assign_rd_addr[i] == impl_wr_var)):
+                m.d.comb += evaluator.assign_rd_data[i].eq(impl_wr_data)
+            with m.Else():
+                m.d.comb += evaluator.assign_rd_data[i].eq(
+                    assign_mem.rd_datas[i])
+
         # Clause Evaluator → Implication FIFO (UNIT results)
         m.d.comb += [
-            impl_fifo.push_valid.eq(
-                evaluator.result_valid & (evaluator.result_status == UNIT)),
+            impl_fifo.push_valid.eq(impl_push),
             impl_fifo.push_var.eq(evaluator.result_implied_var),
             impl_fifo.push_value.eq(evaluator.result_implied_val),
             impl_fifo.push_reason.eq(evaluator.result_clause_id),
@@ -214,6 +260,7 @@ class BCPAccelerator(Elaboratable):
             clause_mem.wr_data_lit3.eq(self.clause_wr_lit3),
             clause_mem.wr_data_lit4.eq(self.clause_wr_lit4),
             clause_mem.wr_en.eq(self.clause_wr_en),
+            clause_mem.wr_byte_en.eq(self.clause_wr_byte_en),
 
             # Watch lists
             watch_mem.wr_lit.eq(self.wl_wr_lit),
@@ -222,24 +269,35 @@ class BCPAccelerator(Elaboratable):
             watch_mem.wr_len.eq(self.wl_wr_len),
             watch_mem.wr_en.eq(self.wl_wr_en),
             watch_mem.wr_len_en.eq(self.wl_wr_len_en),
-
-            # Assignments
-            assign_mem.wr_addr.eq(self.assign_wr_addr),
-            assign_mem.wr_data.eq(self.assign_wr_data),
-            assign_mem.wr_en.eq(self.assign_wr_en),
+            watch_mem.wr_burst_start.eq(self.wl_wr_burst_start),
+            watch_mem.wr_burst_en.eq(self.wl_wr_burst_en),
+            watch_mem.wr_burst_data.eq(self.wl_wr_burst_data),
         ]
 
+        # Assignments — implication write-back takes priority over the host
+        m.d.comb += assign_mem.clear_all.eq(self.assign_clear_all)
+        with m.If(impl_wr_en):
+            m.d.comb += [
+                assign_mem.wr_addr.eq(impl_wr_var),
+                assign_mem.wr_data.eq(impl_wr_data),
+                assign_mem.wr_en.eq(1),
+            ]
+        with m.Else():
+            m.d.comb += [
+                assign_mem.wr_addr.eq(self.assign_wr_addr),
+                assign_mem.wr_data.eq(self.assign_wr_data),
+                assign_mem.wr_en.eq(self.assign_wr_en),
+            ]
+
         # =============================================================
         # Control logic
         # =============================================================
 
         in_flight = Signal(range(MAX_WATCH_LEN + 1))
-        conflict_reg = Signal()
         conflict_cid_reg = Signal(range(MAX_CLAUSES))
         wlm_done_seen = Signal()
-        fsm_starting = Signal()
 
-        do_inc = watch_mgr.clause_id_valid
+        do_inc = wlm_valid
         do_dec = evaluator.result_valid
 
         # --- In-flight counter ---
@@ -276,8 +334,7 @@ class BCPAccelerator(Elaboratable):
             m.d.sync += wlm_done_seen.eq(1)
 
         # --- Top-level FSM ---
-        detect_conflict = (evaluator.result_valid
-                           & (evaluator.result_status == CONFLICT))
+        round_idle = (wlm_done_seen | watch_mgr.done) & (in_flight == 0)
 
         with m.FSM():
             with m.State("IDLE"):
@@ -291,14 +348,19 @@ class BCPAccelerator(Elaboratable):
             with m.State("ACTIVE"):
                 m.d.comb += self.busy.eq(1)
 
-                with m.If(conflict_reg | detect_conflict):
-                    m.next = "DONE"
-                with m.Elif((wlm_done_seen | watch_mgr.done)
-                            & (in_flight == 0)):
-                    m.next = "DONE"
-
-            with m.State("DONE"):
-                m.d.comb += self.done.eq(1)
-                m.next = "IDLE"
+                # done is pulsed on the last ACTIVE cycle itself (no
+                # separate DONE state); conflict_reg is already latched by
+                # then because round_idle trails the last result by a cycle.
+                # On a conflict the manager is stopped and the clauses
+                # already in flight are drained (their results discarded)
+                # first, so none of them lands in the next round.
+                with m.If(conflict_reg):
+                    m.d.comb += wlm_stop.eq(1)
+                    with m.If(in_flight == 0):
+                        m.d.comb += self.done.eq(1)
+                        m.next = "IDLE"
+                with m.Elif(round_idle):
+                    m.d.comb += self.done.eq(1)
+                    m.next = "IDLE"
 
         return m
@@ -5,10 +5,13 @@ Receives a prefetched clause and evaluates it against current variable
 assignments to determine clause status: SATISFIED, UNIT, CONFLICT, or
 UNRESOLVED.  This is Module 3 in the BCP pipeline.
 
-FSM: IDLE → EVAL → OUTPUT
+All MAX_K literals look up their assignments in parallel, one assignment
+memory read port each, so a clause is evaluated in the cycle it is
+accepted.
 
-Latency: 1 cycle (latch) + size cycles (eval) + 1 cycle (output).
-Sat-bit early exit: 2 cycles total.
+Pipelined: one clause accepted per cycle, result presented the next cycle.
+
+Latency: 2 cycles for every clause (accept + evaluate, then output).
 
 See: Hardware Description/BCP_Accelerator_System_Architecture.md, Module 3
 """
@@ -26,6 +29,13 @@ UNIT       = 1
 CONFLICT   = 2
 UNRESOLVED = 3
 
+# Per-lane truth tables indexed by Cat(assign_val, polarity), i.e.
+# assign_val | polarity << 2: a positive literal is true when its variable
+# is TRUE and a negative one when it is FALSE; either is unassigned when
+# its variable is.
+LIT_TRUE_TABLE       = (1 << TRUE) | (1 << (4 | FALSE))
+LIT_UNASSIGNED_TABLE = (1 << UNASSIGNED) | (1 << (4 | UNASSIGNED))
+
 
 class ClauseEvaluator(Elaboratable):
     """
@@ -45,11 +55,15 @@ class ClauseEvaluator(Elaboratable):
     sat_bit      : Signal(), in
     size         : Signal(3), in
     lit0–lit4    : Signal(LIT_WIDTH), in
+    ready        : Signal(), out
+        Always high: a clause presented with meta_valid is accepted in
+        every cycle, including the one presenting the previous result.
 
-    Ports — assignment memory interface
-    ------------------------------------
-    assign_rd_addr : Signal(range(max_vars)), out
-    assign_rd_data : Signal(2), in
+    Ports — assignment memory interface (one read port per literal)
+    ----------------------------------------------------------------
+    assign_rd_addr : list of MAX_K Signal(range(max_vars)), out
+        assign_rd_addr[i] is the variable of lit<i>.
+    assign_rd_data : list of MAX_K Signal(2), in
 
     Ports — outputs (evaluation result)
     ------------------------------------
@@ -74,10 +88,13 @@ class ClauseEvaluator(Elaboratable):
         self.lit2 = Signal(LIT_WIDTH)
         self.lit3 = Signal(LIT_WIDTH)
         self.lit4 = Signal(LIT_WIDTH)
+        self.ready = Signal()
 
-        # Assignment memory read interface
-        self.assign_rd_addr = Signal(range(max_vars))
-        self.assign_rd_data = Signal(2)
+        # Assignment memory read interface, one lane per literal
+        self.assign_rd_addr = [Signal(range(max_vars), name=f"assign_rd_addr{i}")
+                               for i in range(MAX_K)]
+        self.assign_rd_data = [Signal(2, name=f"assign_rd_data{i}")
+                               for i in range(MAX_K)]
 
         # Evaluation result outputs
         self.result_status = Signal(2)
@@ -90,107 +107,94 @@ class ClauseEvaluator(Elaboratable):
         m = Module()
 
         # Internal registers
+        result_valid_reg = Signal()
         clause_id_reg = Signal(range(self.max_clauses))
-        size_reg = Signal(3)
         satisfied = Signal()
-        unassigned_count = Signal(range(MAX_K + 1))
+        none_unassigned = Signal()
+        one_unassigned = Signal()
         last_unassigned_lit = Signal(LIT_WIDTH)
-        lit_idx = Signal(range(MAX_K))
-
-        # Literal register array for muxing
-        lit_regs = Array([Signal(LIT_WIDTH, name=f"lit_reg{i}") for i in range(MAX_K)])
-        current_lit = Signal(LIT_WIDTH)
-        m.d.comb += current_lit.eq(lit_regs[lit_idx])
-
-        # Drive assignment memory read address from current literal
-        # Variable ID = literal >> 1 (strip polarity bit)
-        m.d.comb += self.assign_rd_addr.eq(current_lit >> 1)
-
-        with m.FSM(name="eval"):
-            with m.State("IDLE"):
-                m.d.comb += self.result_valid.eq(0)
-                with m.If(self.meta_valid):
-                    # Latch all clause fields
-                    m.d.sync += [
-                        clause_id_reg.eq(self.clause_id_in),
-                        size_reg.eq(self.size),
-                        lit_regs[0].eq(self.lit0),
-                        lit_regs[1].eq(self.lit1),
-                        lit_regs[2].eq(self.lit2),
-                        lit_regs[3].eq(self.lit3),
-                        lit_regs[4].eq(self.lit4),
-                        # Reset accumulators
-                        unassigned_count.eq(0),
-                        last_unassigned_lit.eq(0),
-                    ]
-                    with m.If(self.sat_bit):
-                        # Early exit: clause already satisfied
-                        m.d.sync += satisfied.eq(1)
-                        m.next = "OUTPUT"
-                    with m.Else():
-                        m.d.sync += [
-                            satisfied.eq(0),
-                            lit_idx.eq(0),
-                        ]
-                        m.next = "EVAL"
-
-            with m.State("EVAL"):
-                # current_lit is driven combinationally from lit_regs[lit_idx]
-                # assign_rd_addr is driven combinationally from current_lit >> 1
-                # assign_rd_data is available combinationally (comb read port)
-
-                # Determine expected truth value for this literal
-                # Literal encoding: bit[0] = polarity (0 = positive, 1 = negative)
-                # Positive literal is TRUE when variable is TRUE
-                # Negative literal is TRUE when variable is FALSE
-                lit_polarity = current_lit[0]
-                assign_val = self.assign_rd_data
-
-                # Check if literal is satisfied
-                lit_true = Signal()
-                m.d.comb += lit_true.eq(
-                    ((~lit_polarity) & (assign_val == TRUE)) |
-                    (lit_polarity & (assign_val == FALSE))
-                )
-
-                lit_unassigned = Signal()
-                m.d.comb += lit_unassigned.eq(assign_val == UNASSIGNED)
-
-                with m.If(lit_true):
-                    m.d.sync += satisfied.eq(1)
-                with m.If(lit_unassigned):
-                    m.d.sync += [
-                        unassigned_count.eq(unassigned_count + 1),
-                        last_unassigned_lit.eq(current_lit),
-                    ]
-
-                # Advance or finish
-                with m.If(lit_idx == size_reg - 1):
-                    m.next = "OUTPUT"
-                with m.Else():
-                    m.d.sync += lit_idx.eq(lit_idx + 1)
-
-            with m.State("OUTPUT"):
+
+        # Per-literal lanes, evaluated straight off the inputs.  Literal
+        # encoding: bit[0] = polarity (0 = positive, 1 = negative); the
+        # variable ID is literal >> 1.  Lanes at or past size are masked.
+        lits = Signal(ArrayLayout(unsigned(LIT_WIDTH), MAX_K))
+        m.d.comb += lits.eq(Cat(self.lit0, self.lit1, self.lit2,
+                                self.lit3, self.lit4))
+        lit_true = Signal(MAX_K)
+        lit_unassigned = Signal(MAX_K)
+
+        # Lane mask decoded from size by an explicit case per value, so the
+        # lanes see one thermometer-code lookup rather than MAX_K separate
+        # magnitude compares against size.  Sizes past MAX_K keep all lanes.
+        in_clause = Signal(MAX_K)
+        with m.Switch(self.size):
+            for k in range(MAX_K):
+                with m.Case(k):
+                    m.d.comb += in_clause.eq((1 << k) - 1)
+            with m.Default():
+                m.d.comb += in_clause.eq((1 << MAX_K) - 1)
+
+        for i in range(MAX_K):
+            lit = lits[i]
+            assign_val = self.assign_rd_data[i]
+            # One 3-input lookup per flag instead of compares and a mux
+            table_idx = Cat(assign_val, lit[0])
+            m.d.comb += [
+                self.assign_rd_addr[i].eq(lit >> 1),
+                lit_true[i].eq(in_clause[i] & C(LIT_TRUE_TABLE, 8)
+                               .bit_select(table_idx, 1)),
+                lit_unassigned[i].eq(in_clause[i] & C(LIT_UNASSIGNED_TABLE, 8)
+                                     .bit_select(table_idx, 1)),
+            ]
+
+        # Reduction: any true literal satisfies the clause.  The status only
+        # needs to know whether zero, one or more lanes are unassigned, so
+        # instead of a popcount the mask is tested with x & (x - 1), which
+        # clears the lowest set bit and is zero iff at most one bit is set.
+        # The highest unassigned lane is picked by a priority chain (it is
+        # the only one whenever the clause turns out UNIT).
+        unassigned_lit = Signal(LIT_WIDTH)
+        for i in range(MAX_K):
+            with m.If(lit_unassigned[i]):
+                m.d.comb += unassigned_lit.eq(lits[i])
+
+        # One pipeline stage: a clause presented with meta_valid is
+        # evaluated and latched this cycle and its result is presented the
+        # next, while the following clause is already being accepted.
+        m.d.comb += self.ready.eq(1)
+        m.d.sync += result_valid_reg.eq(self.meta_valid)
+        with m.If(self.meta_valid):
+            # sat_bit is an early exit: the clause is satisfied whatever
+            # the lanes say
+            m.d.sync += [
+                clause_id_reg.eq(self.clause_id_in),
+                satisfied.eq(self.sat_bit | lit_true.any()),
+                none_unassigned.eq(lit_unassigned == 0),
+                one_unassigned.eq((lit_unassigned != 0)
+                                  & ((lit_unassigned
+                                      & (lit_unassigned - 1)) == 0)),
+                last_unassigned_lit.eq(unassigned_lit),
+            ]
+
+        with m.If(result_valid_reg):
+            m.d.comb += [
+                self.result_valid.eq(1),
+                self.result_clause_id.eq(clause_id_reg),
+            ]
+
+            with m.If(satisfied):
+                m.d.comb += self.result_status.eq(SATISFIED)
+            with m.Elif(none_unassigned):
+                m.d.comb += self.result_status.eq(CONFLICT)
+            with m.Elif(one_unassigned):
                 m.d.comb += [
-                    self.result_valid.eq(1),
-                    self.result_clause_id.eq(clause_id_reg),
+                    self.result_status.eq(UNIT),
+                    self.result_implied_var.eq(last_unassigned_lit >> 1),
+                    # Positive literal (pol=0) → assign TRUE (1)
+                    # Negative literal (pol=1) → assign FALSE (0)
+                    self.result_implied_val.eq(~last_unassigned_lit[0]),
                 ]
-
-                with m.If(satisfied):
-                    m.d.comb += self.result_status.eq(SATISFIED)
-                with m.Elif(unassigned_count == 0):
-                    m.d.comb += self.result_status.eq(CONFLICT)
-                with m.Elif(unassigned_count == 1):
-                    m.d.comb += [
-                        self.result_status.eq(UNIT),
-                        self.result_implied_var.eq(last_unassigned_lit >> 1),
-                        # Positive literal (pol=0) → assign TRUE (1)
-                        # Negative literal (pol=1) → assign FALSE (0)
-                        self.result_implied_val.eq(~last_unassigned_lit[0]),
-                    ]
-                with m.Else():
-                    m.d.comb += self.result_status.eq(UNRESOLVED)
-
-                m.next = "IDLE"
+            with m.Else():
+                m.d.comb += self.result_status.eq(UNRESOLVED)
 
         return m
@@ -1,10 +1,10 @@
 """
 Clause Prefetcher Module for the BCP Accelerator.
 
-Pipelines clause memory reads to hide the 2-cycle BRAM latency.
+Pipelines clause memory reads to hide the 1-cycle BRAM latency.
 Fetches clause i+1 while clause i is being evaluated downstream.
 
-The clause_id is pipelined through two registers so it arrives at the
+The clause_id is pipelined through one register so it arrives at the
 output at the same time as the memory data.
 
 Source: FYalSAT §III-C (prefetching optimization)
@@ -88,23 +88,19 @@ class ClausePrefetcher(Elaboratable):
             self.clause_rd_en.eq(self.clause_id_valid),
         ]
 
-        # Pipeline clause_id through 2 registers to match memory latency
+        # Pipeline clause_id through 1 register to match memory latency
         stage1_cid = Signal(range(self.max_clauses))
         stage1_valid = Signal()
-        stage2_cid = Signal(range(self.max_clauses))
-        stage2_valid = Signal()
 
         m.d.sync += [
             stage1_cid.eq(self.clause_id_in),
             stage1_valid.eq(self.clause_id_valid),
-            stage2_cid.eq(stage1_cid),
-            stage2_valid.eq(stage1_valid),
         ]
 
-        # --- Stage 2: forward memory data + delayed clause_id ---
+        # --- Stage 1: forward memory data + delayed clause_id ---
         m.d.comb += [
-            self.meta_valid.eq(stage2_valid),
-            self.clause_id_out.eq(stage2_cid),
+            self.meta_valid.eq(stage1_valid),
+            self.clause_id_out.eq(stage1_cid),
             self.out_sat_bit.eq(self.clause_rd_sat_bit),
             self.out_size.eq(self.clause_rd_size),
             self.out_lit0.eq(self.clause_rd_lit0),
@@ -13,11 +13,15 @@ from amaranth.lib.memory import Memory
 
 from memory.assignment_memory import MAX_VARS
 from memory.clause_memory import MAX_CLAUSES
+from memory.watch_list_memory import MAX_WATCH_LEN
 
 
 # Entry packing: var_id (9-bit) + value (1-bit) + reason (13-bit) = 23 bits
 ENTRY_WIDTH = 23
-DEFAULT_FIFO_DEPTH = 16
+# The pipeline never stalls on a full FIFO (the push is dropped), so the
+# default holds a whole watch list's worth of implications: one BCP round
+# cannot overflow it however slowly the host drains it.
+DEFAULT_FIFO_DEPTH = MAX_WATCH_LEN
 
 
 
@@ -30,7 +34,7 @@ class ImplicationFIFO(Elaboratable):
     Parameters
     ----------
     fifo_depth : int
-        Number of entries the FIFO can hold (default 16).
+        Number of entries the FIFO can hold (default MAX_WATCH_LEN = 128).
 
     Ports
     -----
@@ -43,7 +47,9 @@ class ImplicationFIFO(Elaboratable):
     push_reason : Signal(range(MAX_CLAUSES)), in
         Clause ID that caused the implication.
     pop_valid : Signal(), out
-        Asserted when the FIFO has data available to pop.
+        Asserted when the FIFO has data available to pop.  While the FIFO
+        is empty, a push is presented here in its own cycle, and is not
+        stored if pop_ready takes it in that cycle.
     pop_var : Signal(range(MAX_VARS)), out
         Variable ID at the head of the FIFO.
     pop_value : Signal(), out
@@ -53,7 +59,7 @@ class ImplicationFIFO(Elaboratable):
     pop_ready : Signal(), in
         Asserted by the consumer to acknowledge and pop the head entry.
     fifo_empty : Signal(), out
-        High when the FIFO contains no entries.
+        High when the FIFO holds no stored entries.
     fifo_full : Signal(), out
         High when the FIFO cannot accept more entries.
     """
@@ -93,18 +99,23 @@ class ImplicationFIFO(Elaboratable):
         rd_ptr = Signal(range(depth))
         count = Signal(range(depth + 1))
 
-        # Status flags
+        # Status flags.  An empty FIFO passes a push straight through to
+        # the pop side in the same cycle (bypass), so an implication is
+        # visible downstream without a cycle spent in storage.
         m.d.comb += [
             self.fifo_empty.eq(count == 0),
             self.fifo_full.eq(count == depth),
-            self.pop_valid.eq(~self.fifo_empty),
+            self.pop_valid.eq(~self.fifo_empty | self.push_valid),
         ]
 
-        # Internal handshake signals
+        # Internal handshake signals.  A bypassed entry that is popped in
+        # the same cycle is never written.
+        bypass = Signal()
         do_push = Signal()
         do_pop = Signal()
         m.d.comb += [
-            do_push.eq(self.push_valid & ~self.fifo_full),
+            bypass.eq(self.fifo_empty & self.push_valid & self.pop_ready),
+            do_push.eq(self.push_valid & ~self.fifo_full & ~bypass),
             do_pop.eq(self.pop_ready & ~self.fifo_empty),
         ]
 
@@ -121,14 +132,16 @@ class ImplicationFIFO(Elaboratable):
             wr_port.en.eq(do_push),
         ]
 
-        # --- Read port (combinational) ---
+        # --- Read port (combinational), bypassed while empty ---
         rd_port = mem.read_port(domain="comb")
+        head_word = Signal(ENTRY_WIDTH)
         m.d.comb += [
             rd_port.addr.eq(rd_ptr),
+            head_word.eq(Mux(self.fifo_empty, push_word, rd_port.data)),
             # Unpack head entry
-            self.pop_var.eq(rd_port.data[0:9]),
-            self.pop_value.eq(rd_port.data[9]),
-            self.pop_reason.eq(rd_port.data[10:23]),
+            self.pop_var.eq(head_word[0:9]),
+            self.pop_value.eq(head_word[9]),
+            self.pop_reason.eq(head_word[10:23]),
         ]
 
         # --- Pointer and count update (synchronous) ---
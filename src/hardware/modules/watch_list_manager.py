@@ -2,10 +2,10 @@
 Watch List Manager Module for the BCP Accelerator.
 
 Fetches and streams clause IDs from the watch list for a given false_lit.
-Interfaces with the Watch List Memory (2-cycle read latency) using pipelined
+Interfaces with the Watch List Memory (1-cycle read latency) using pipelined
 reads to achieve one clause ID per cycle throughput during streaming.
 
-FSM: IDLE → FETCH_LEN → STREAM → DONE → IDLE
+FSM: IDLE → STREAM → DONE → IDLE
 
 See: Hardware Description/BCP_Accelerator_System_Architecture.md, Sub-Module 1
 """
@@ -21,7 +21,7 @@ class WatchListManager(Elaboratable):
     Watch List Manager.
 
     Streams clause IDs from the watch list for a given literal.  Pipelined
-    reads hide the Watch List Memory's 2-cycle latency so that clause IDs
+    reads hide the Watch List Memory's 1-cycle latency so that clause IDs
     are output at one per cycle once streaming begins.
 
     Parameters
@@ -31,7 +31,7 @@ class WatchListManager(Elaboratable):
     max_clauses : int
         Maximum clause count (default 8192).
     max_watch_len : int
-        Maximum entries per watch list (default 100).
+        Maximum entries per watch list (default 128).
 
     Ports
     -----
@@ -103,19 +103,7 @@ class WatchListManager(Elaboratable):
                         pipe_idx.eq(1),
                         output_count.eq(0),
                     ]
-                    m.next = "FETCH_LEN"
-
-            # -----------------------------------------------------------
-            # FETCH_LEN: issue speculative read for idx=1 (pipeline fill)
-            # -----------------------------------------------------------
-            with m.State("FETCH_LEN"):
-                m.d.comb += [
-                    self.wl_rd_lit.eq(stored_lit),
-                    self.wl_rd_idx.eq(pipe_idx),
-                    self.wl_rd_en.eq(1),
-                ]
-                m.d.sync += pipe_idx.eq(pipe_idx + 1)
-                m.next = "STREAM"
+                    m.next = "STREAM"
 
             # -----------------------------------------------------------
             # STREAM: output clause IDs as they arrive from the pipeline
@@ -11,12 +11,15 @@ Wires together the four main submodules and connects them to FPGA I/O:
         │                                    │
         └─ tx_pin ◄── UARTTransmitter ◄──────┘
 
+Both UART halves time their bits off one shared BaudGen counter.
+
 Build target: Lattice ECP5-5G Evaluation Board (12 MHz system clock).
 Baud rate: 1 Mbaud → divisor = 12.
 """
 
 from amaranth import *
 
+from communication.baud_gen import BaudGen
 from communication.uart_rx import UARTReceiver
 from communication.uart_tx import UARTTransmitter
 from communication.host_interface import HostInterface
@@ -25,8 +28,9 @@ from modules.bcp_accelerator import BCPAccelerator
 
 class BCPTop(Elaboratable):
     def __init__(self):
-        self.uart_rx = UARTReceiver(divisor=12)
-        self.uart_tx = UARTTransmitter(divisor=12)
+        self.baud    = BaudGen(divisor=12)
+        self.uart_rx = UARTReceiver(divisor=12, baud=self.baud)
+        self.uart_tx = UARTTransmitter(divisor=12, baud=self.baud)
         self.host_if = HostInterface()
         self.bcp     = BCPAccelerator()
 
@@ -39,6 +43,7 @@ class BCPTop(Elaboratable):
         host_if = self.host_if
         bcp     = self.bcp
 
+        m.submodules.baud    = self.baud
         m.submodules.uart_rx = uart_rx
         m.submodules.uart_tx = uart_tx
         m.submodules.host_if = host_if
@@ -59,6 +64,10 @@ class BCPTop(Elaboratable):
             m.d.sync += heartbeat.eq(heartbeat + 1)
             m.d.comb += led.o.eq(heartbeat[-1])
 
+            # LED 1 — lit after the host sent a byte the interface could
+            # not accept (see HostInterface.rx_overrun)
+            m.d.comb += platform.request("led", 1).o.eq(host_if.rx_overrun)
+
         # ── UART RX → HostInterface ─────────────────────────────────────
         m.d.comb += [
             host_if.rx_data.eq(uart_rx.rx_data),
@@ -105,6 +114,7 @@ class BCPTop(Elaboratable):
             bcp.clause_wr_lit3.eq(host_if.clause_wr_lit3),
             bcp.clause_wr_lit4.eq(host_if.clause_wr_lit4),
             bcp.clause_wr_en.eq(host_if.clause_wr_en),
+            bcp.clause_wr_byte_en.eq(host_if.clause_wr_byte_en),
         ]
 
         # ── HostInterface → BCP write ports (watch lists) ───────────────
@@ -122,6 +132,7 @@ class BCPTop(Elaboratable):
             bcp.assign_wr_addr.eq(host_if.assign_wr_addr),
             bcp.assign_wr_data.eq(host_if.assign_wr_data),
             bcp.assign_wr_en.eq(host_if.assign_wr_en),
+            bcp.assign_clear_all.eq(host_if.assign_clear_all),
         ]
 
         return m
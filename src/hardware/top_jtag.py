@@ -84,6 +84,7 @@ class BCPTopJTAG(Elaboratable):
             bcp.assign_wr_addr.eq(host_if.assign_wr_addr),
             bcp.assign_wr_data.eq(host_if.assign_wr_data),
             bcp.assign_wr_en.eq(host_if.assign_wr_en),
+            bcp.assign_clear_all.eq(host_if.assign_clear_all),
         ]
 
         return m
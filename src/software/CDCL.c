@@ -25,22 +25,41 @@
 #include "hw_interface.h"
 #endif
 
+/* Length of the activity buffer: num_vars + 1 slots rounded up to a
+ * multiple of 4 so the VSIDS rescale loop needs no scalar tail. */
+#define ACTIVITY_PAD(num_vars) (((num_vars) + 4) & ~3)
+
+/* Learnt clause reduction schedule: first after REDUCE_FIRST conflicts,
+ * then each interval grows by REDUCE_INC. */
+#define REDUCE_FIRST 2000
+#define REDUCE_INC   300
+
+/* Restart schedule: restart i happens after RESTART_BASE * luby(i) conflicts. */
+#define RESTART_BASE 100
+
+/* Hot-path helpers are forced inline: they are called per literal in BCP
+ * and conflict analysis, where even a cheap call costs more than the body. */
+#define ALWAYS_INLINE inline __attribute__((always_inline))
+
 /* ========================================================================= */
 /*  Utility helpers                                                          */
 /* ========================================================================= */
 
 /* Convert a signed literal (1-based, negative = negated) to internal code. */
-static inline int lit_to_code(int lit) {
-    return (lit > 0) ? (2 * lit) : (2 * (-lit) + 1);
+static ALWAYS_INLINE int lit_to_code(int lit) {
+    /* Branchless: sign = 0 or -1; (lit ^ sign) - sign = |lit|, and the
+     * sign's low bit is the negation flag. */
+    int sign = lit >> 31;
+    return (((lit ^ sign) - sign) << 1) | (sign & 1);
 }
 
 /* Return the variable index for an internal literal code. */
-static inline int lit_var(int code) {
-    return code / 2;
+static ALWAYS_INLINE int lit_var(int code) {
+    return code >> 1;   /* codes are non-negative: shift, not signed divide */
 }
 
 /* Return the negation of an internal literal code. Does this by flipping least significant bit (+1/-1). */
-static inline int lit_neg(int code) {
+static ALWAYS_INLINE int lit_neg(int code) {
     return code ^ 1;
 }
 
@@ -57,17 +76,30 @@ CDCLSolver *cdcl_create(int num_vars) {
 
     /* Variable-indexed arrays (index 0 unused). */
     // Store assignment, decision level, reason (Clause that implied 'v'), and activity (VSIDS) for each variable (1-indexed).
-    s->assigns    = (int *)malloc((num_vars + 1) * sizeof(int));
+    s->assigns    = (signed char *)malloc((num_vars + 1) * sizeof(signed char));
     s->levels     = (int *)malloc((num_vars + 1) * sizeof(int));
     s->reasons    = (int *)malloc((num_vars + 1) * sizeof(int));
-    s->activity   = (double *)calloc(num_vars + 1, sizeof(double));
-    memset(s->assigns, 0xFF, (num_vars + 1) * sizeof(int)); /* UNASSIGNED = -1 (Two's complement: 0xFF)*/
+    s->activity   = (double *)calloc(ACTIVITY_PAD(num_vars), sizeof(double));
+    s->polarity   = (signed char *)calloc(num_vars + 1, sizeof(signed char));
+    s->seen       = (bool *)calloc(num_vars + 1, sizeof(bool));
+    memset(s->assigns, 0xFF, (num_vars + 1) * sizeof(signed char)); /* UNASSIGNED = -1 (Two's complement: 0xFF)*/
     memset(s->levels, 0, (num_vars + 1) * sizeof(int));
     for (int i = 0; i <= num_vars; i++) s->reasons[i] = -1;
 
+    /* VSIDS order heap — every variable starts in it (all activities 0). */
+    s->heap      = (int *)malloc((num_vars + 1) * sizeof(int));
+    s->heap_pos  = (int *)malloc((num_vars + 1) * sizeof(int));
+    s->heap_size = 0;
+    s->heap_pos[0] = -1;
+    for (int v = 1; v <= num_vars; v++) {
+        s->heap_pos[v] = s->heap_size;
+        s->heap[s->heap_size++] = v;
+    }
+
     /* Propagation trail. */
     s->trail      = (int *)malloc((num_vars + 1) * sizeof(int));
     s->trail_size = 0;
+    s->trail_cleared = 0;
     s->trail_delimiters = (int *)malloc((num_vars + 1) * sizeof(int));
     s->num_decisions    = 0;
 
@@ -75,15 +107,31 @@ CDCLSolver *cdcl_create(int num_vars) {
     s->watch_cap  = (int *)calloc(lits, sizeof(int));
     s->watch_size = (int *)calloc(lits, sizeof(int));
     s->watches    = (int **)calloc(lits, sizeof(int *));
-
-    /* Clause database — start with room for 1024 clauses. */
-    s->clause_cap = 1024;
-    s->clause_count = 0;
-    s->clauses = (Clause **)calloc(s->clause_cap, sizeof(Clause *));
+    s->bin_cap     = (int *)calloc(lits, sizeof(int));
+    s->bin_size    = (int *)calloc(lits, sizeof(int));
+    s->bin_watches = (int **)calloc(lits, sizeof(int *));
+
+    /* Clause database — start with room for 1024 clauses of ~4 literals. */
+    s->clause_cap    = 1024;
+    s->clause_count  = 0;
+    s->lits_cap      = 4 * s->clause_cap;
+    s->clause_lits   = (int *)malloc(s->lits_cap * sizeof(int));
+    s->clause_off    = (int *)malloc((s->clause_cap + 1) * sizeof(int));
+    s->clause_learnt = (unsigned char *)malloc(s->clause_cap);
+    s->clause_lbd    = (int *)malloc(s->clause_cap * sizeof(int));
+    s->clause_off[0] = 0;
 
     /* VSIDS decay factor. (Baseline Conflict Bump) */
     s->var_inc = 1.0;
 
+    /* Learnt clause reduction schedule (Glucose: 2000 + 300 * k). */
+    s->level_stamp = (int *)calloc(num_vars + 1, sizeof(int));
+    s->lbd_stamp   = 0;
+    s->conflicts   = 0;
+    s->next_reduce = REDUCE_FIRST;
+    s->reductions  = 0;
+    s->restarts    = 0;
+
     return s;
 }
 
@@ -93,14 +141,25 @@ void cdcl_destroy(CDCLSolver *s) {
     free(s->watches);
     free(s->watch_cap);
     free(s->watch_size);
-    for (int i = 0; i < s->clause_count; i++) free(s->clauses[i]);
-    free(s->clauses);
+    for (int i = 0; i < lits; i++) free(s->bin_watches[i]);
+    free(s->bin_watches);
+    free(s->bin_cap);
+    free(s->bin_size);
+    free(s->clause_lits);
+    free(s->clause_off);
+    free(s->clause_learnt);
+    free(s->clause_lbd);
+    free(s->level_stamp);
     free(s->trail);
     free(s->trail_delimiters);
     free(s->assigns);
     free(s->levels);
     free(s->reasons);
     free(s->activity);
+    free(s->polarity);
+    free(s->seen);
+    free(s->heap);
+    free(s->heap_pos);
     free(s);
 }
 
@@ -108,81 +167,161 @@ void cdcl_destroy(CDCLSolver *s) {
 /*  Watched-literal helpers                                                  */
 /* ========================================================================= */
 
+/* Grow the watch list of literal `lit`. Kept out of line so the common
+ * append path in watch_add() stays a compare and a store. */
+static void __attribute__((noinline)) watch_grow(CDCLSolver *s, int lit) {
+    // Starts w/ capacity 4 and doubles as needed.
+    s->watch_cap[lit] = s->watch_cap[lit] ? s->watch_cap[lit] * 2 : 4;
+    // reallocates, preserving existing contents.
+    s->watches[lit] = (int *)realloc(s->watches[lit],
+                                     s->watch_cap[lit] * sizeof(int));
+}
+
 /* Add clause index `ci` to the watch list of literal `lit`. */
-static void watch_add(CDCLSolver *s, int lit, int ci) {
-    // Dynamically grows the watch list if needed. Starts w/ capacity 4 and doubles as needed.
-    if (s->watch_size[lit] == s->watch_cap[lit]) {
-        s->watch_cap[lit] = s->watch_cap[lit] ? s->watch_cap[lit] * 2 : 4;
-        // reallocates, preserving existing contents.
-        s->watches[lit] = (int *)realloc(s->watches[lit],
-                                         s->watch_cap[lit] * sizeof(int));
-    }
+static ALWAYS_INLINE void watch_add(CDCLSolver *s, int lit, int ci) {
+    // Dynamically grows the watch list if needed (rare: capacity doubles).
+    if (__builtin_expect(s->watch_size[lit] == s->watch_cap[lit], 0))
+        watch_grow(s, lit);
     // Add the clause index to the watch list and increment the size.
     s->watches[lit][s->watch_size[lit]++] = ci;
 }
 
+/* Record binary clause `ci` = (lit v other) in the binary list of `lit`. */
+static void bin_watch_add(CDCLSolver *s, int lit, int other, int ci) {
+    if (s->bin_size[lit] == s->bin_cap[lit]) {
+        s->bin_cap[lit] = s->bin_cap[lit] ? s->bin_cap[lit] * 2 : 4;
+        s->bin_watches[lit] = (int *)realloc(s->bin_watches[lit],
+                                             2 * s->bin_cap[lit] * sizeof(int));
+    }
+    int *entry = s->bin_watches[lit] + 2 * s->bin_size[lit]++;
+    entry[0] = other;
+    entry[1] = ci;
+}
+
+/* Attach a freshly added clause: binaries go to the binary lists, longer
+ * clauses watch their first two literals. Unit and empty clauses are
+ * handled at the start of cdcl_solve(). */
+static void clause_attach(CDCLSolver *s, const int *lits, int len, int ci) {
+    if (len == 2) {
+        bin_watch_add(s, lits[0], lits[1], ci);
+        bin_watch_add(s, lits[1], lits[0], ci);
+    } else if (len > 2) {
+        watch_add(s, lits[0], ci);
+        watch_add(s, lits[1], ci);
+    }
+}
+
 /* ========================================================================= */
 /*  Clause addition                                                          */
 /* ========================================================================= */
 
+/* Resize the per-clause tables to hold `cap` clauses. */
+static void clause_table_resize(CDCLSolver *s, int cap) {
+    s->clause_cap    = cap;
+    s->clause_off    = (int *)realloc(s->clause_off, (cap + 1) * sizeof(int));
+    s->clause_learnt = (unsigned char *)realloc(s->clause_learnt, cap);
+    s->clause_lbd    = (int *)realloc(s->clause_lbd, cap * sizeof(int));
+}
+
+/* Resize the shared literal buffer to hold `cap` literals. */
+static void clause_lits_resize(CDCLSolver *s, int cap) {
+    s->lits_cap    = cap;
+    s->clause_lits = (int *)realloc(s->clause_lits, cap * sizeof(int));
+}
+
+/*
+ * Append a clause slot of `len` literals to the database and return a
+ * pointer to its literal storage.  Both the offset table and the shared
+ * literal buffer grow geometrically, so learnt clauses amortize to O(1).
+ * The new clause index is s->clause_count - 1.
+ */
+static int *clause_alloc(CDCLSolver *s, int len, unsigned char kind) {
+    if (s->clause_count == s->clause_cap)
+        clause_table_resize(s, s->clause_cap * 2);
+    int start = s->clause_off[s->clause_count];
+    if (start + len > s->lits_cap) {
+        int cap = s->lits_cap;
+        while (start + len > cap) cap *= 2;
+        clause_lits_resize(s, cap);
+    }
+    int ci = s->clause_count++;
+    s->clause_off[ci + 1] = start + len;
+    s->clause_learnt[ci]  = kind;
+    s->clause_lbd[ci]     = len;
+    return s->clause_lits + start;
+}
+
+/*
+ * Preallocate room for `num_clauses` clauses (plus half again for learnt
+ * clauses) holding `num_lits` literals in total, and give every watch list an
+ * initial capacity matching the average number of watches per literal.
+ * Purely an optimization: the database still grows on demand.
+ */
+void cdcl_reserve(CDCLSolver *s, int num_clauses, int num_lits) {
+    if (num_clauses < 0 || num_lits < 0) return;
+    int clause_cap = num_clauses + num_clauses / 2 + 1;
+    if (clause_cap > s->clause_cap) clause_table_resize(s, clause_cap);
+    if (num_lits > s->lits_cap) clause_lits_resize(s, num_lits);
+
+    /* Two watches per clause spread over 2 * num_vars literal codes. */
+    int num_codes = 2 * s->num_vars + 2;
+    int per_lit   = (2 * num_clauses + num_codes - 1) / num_codes;
+    if (per_lit < 4) return; /* the default first growth step already fits */
+    for (int lit = 2; lit < num_codes; lit++) {
+        if (s->watch_cap[lit] >= per_lit) continue;
+        s->watch_cap[lit] = per_lit;
+        s->watches[lit]   = (int *)realloc(s->watches[lit], per_lit * sizeof(int));
+    }
+}
+
 /*
  * Add a clause given as an array of signed literals (1-based, negated = negative).
  * Returns the clause index, or -1 if the clause is a tautology / empty.
  */
 int cdcl_add_clause(CDCLSolver *s, int *signed_lits, int len) {
-    /* Grow clause database if necessary. */
-    if (s->clause_count == s->clause_cap) {
-        s->clause_cap *= 2;
-        s->clauses = (Clause **)realloc(s->clauses,
-                                        s->clause_cap * sizeof(Clause *));
-    }
-
     /* Allocate and populate clause. */
-    Clause *c = (Clause *)malloc(sizeof(Clause) + len * sizeof(int));
-    c->size = len;
-    c->learnt = false;
+    int *lits = clause_alloc(s, len, CLAUSE_ORIGINAL);
     for (int i = 0; i < len; i++) {
-        c->lits[i] = lit_to_code(signed_lits[i]);
+        lits[i] = lit_to_code(signed_lits[i]);
     }
 
-    int ci = s->clause_count;
-    s->clauses[ci] = c;
-    s->clause_count++;
+    int ci = s->clause_count - 1;
 
     /* Set up watched literals: watch the first two literals (if >= 2). */
-    if (len >= 2) {
-        watch_add(s, c->lits[0], ci);
-        watch_add(s, c->lits[1], ci);
-    }
+    clause_attach(s, lits, len, ci);
 
     return ci;
 }
 
+/*
+ * Add a clause whose literals are already internal codes (2*x for x,
+ * 2*x+1 for ~x), e.g. straight from the DIMACS parser.  Skips the
+ * per-literal conversion of cdcl_add_clause().
+ */
+int cdcl_add_clause_codes(CDCLSolver *s, const int *codes, int len) {
+    int *lits = clause_alloc(s, len, CLAUSE_ORIGINAL);
+    memcpy(lits, codes, len * sizeof(int));
+
+    int ci = s->clause_count - 1;
+    clause_attach(s, lits, len, ci);
+    return ci;
+}
+
 /* ========================================================================= */
 /*  Assignment / trail management                                            */
 /* ========================================================================= */
 
-/* Return the current truth value of an internal literal code. */
-static inline int lit_value(CDCLSolver *s, int code) {
-    int var = lit_var(code);
-    if (s->assigns[var] == UNASSIGNED) return UNASSIGNED;
+/* Return the current truth value of an internal literal code.
+ * Takes the assignment array directly so the BCP loop can pass a cached
+ * local pointer instead of reloading s->assigns on every call. */
+static ALWAYS_INLINE int lit_value(const signed char *assigns, int code) {
+    int a = assigns[lit_var(code)];
     /* Positive literal (even code): value matches assignment.
        Negative literal (odd code): value is flipped.
-       Returns 0 for FALSE, 1 for TRUE, -1 for UNASSIGNED */
-    if (code & 1)
-        return s->assigns[var] ^ 1; /* flip 0<->1 */
-    else
-        return s->assigns[var];
-}
-
-/* Enqueue a literal assignment at the current decision level.
- * `reason` is the clause index that implied this assignment, or -1 for decisions. */
-static void enqueue(CDCLSolver *s, int code, int reason) {
-    int var = lit_var(code);
-    s->assigns[var] = (code & 1) ? 0 : 1;  /* even code -> TRUE, odd -> FALSE */
-    s->levels[var]  = s->num_decisions;
-    s->reasons[var] = reason;
-    s->trail[s->trail_size++] = code;
+       Returns 0 for FALSE, 1 for TRUE, -1 for UNASSIGNED.
+       Branchless: a >> 31 is all-ones only for UNASSIGNED (-1), which masks
+       the polarity bit to 0 so -1 passes through the XOR unchanged. */
+    return a ^ ((code & 1) & ~(a >> 31));
 }
 
 /* ========================================================================= */
@@ -194,12 +333,45 @@ static void enqueue(CDCLSolver *s, int code, int reason) {
  * Returns -1 if no conflict, otherwise returns the index of a conflicting clause.
  */
 static int propagate(CDCLSolver *s) {
+    /* Cache the solver arrays in locals: the watch-list and clause writes
+     * below may alias any int field of *s, so without this the compiler
+     * reloads s->assigns / s->trail / s->trail_size on every iteration. */
+    signed char *assigns    = s->assigns;
+    int         *levels     = s->levels;
+    int         *reasons    = s->reasons;
+    int         *trail      = s->trail;
+    int         *cl_lits    = s->clause_lits;
+    int         *cl_off     = s->clause_off;
+    int          level      = s->num_decisions;
+    int          trail_size = s->trail_size;
+    int          prop_head  = s->prop_head;
+
     /* Process from the current propagation pointer to the end of the trail. */
-    while (s->prop_head < s->trail_size) 
+    while (prop_head < trail_size) 
     {
         /* The literal that just became true; we need to look at watchers of
          * its negation (those clauses might now be unit or conflicting). */
-        int false_lit = lit_neg(s->trail[s->prop_head++]);
+        int false_lit = lit_neg(trail[prop_head++]);
+
+        /* Binary clauses first: the other literal is stored inline, so each
+         * one is a single value check with no clause fetch or watch move. */
+        const int *blist = s->bin_watches[false_lit];
+        int        blen  = s->bin_size[false_lit];
+        for (int i = 0; i < blen; i++) {
+            int other = blist[2 * i];
+            int v = lit_value(assigns, other);
+            if (v == 1) continue;                   /* satisfied */
+            if (v == 0) {                           /* both literals false */
+                s->trail_size = trail_size;
+                s->prop_head  = prop_head;
+                return blist[2 * i + 1];
+            }
+            int var = lit_var(other);               /* unit: inlined enqueue_lit() */
+            assigns[var] = (other & 1) ? 0 : 1;
+            levels[var]  = level;
+            reasons[var] = blist[2 * i + 1];
+            trail[trail_size++] = other;
+        }
 
         /* ============== HARDWARE CALLED HERE ==============*/
         int *wlist = s->watches[false_lit];
@@ -212,20 +384,21 @@ static int propagate(CDCLSolver *s) {
         for (int i = 0; i < wlen; i++) {
             // Pipeline 1 and 2 by prefetching the next clause index while the current clause is being processed. Source: FYalSAT (Choi & Kim, 2024) — Section III-C, unsatisfied clause prefetching to overlap DRAM access with computation.
             int ci = wlist[i]; // 1
-            Clause *c = s->clauses[ci]; //2 
+            int *lits = cl_lits + cl_off[ci]; //2 
+            int  size = cl_off[ci + 1] - cl_off[ci];
 
             /* Make sure the false literal is in position 1. Always check first literal and swap the two literals.
             (Simplifies logic so we never need to iterate over the clause) */
             // Optimization: Remove Swap and utilize hardware multiplexer to select the other watched literal: Source: SAT-Accel (Lo et al., 2025) — Section V, signature-based clause representation eliminates positional literal dependency entirely, removing the need for this normalization.
-            if (c->lits[0] == false_lit) {
-                int tmp = c->lits[0];
-                c->lits[0] = c->lits[1];
-                c->lits[1] = tmp;
+            if (lits[0] == false_lit) {
+                int tmp = lits[0];
+                lits[0] = lits[1];
+                lits[1] = tmp;
             }
 
             /* If the other watched literal is already true, clause is satisfied. */
             // Optimization: Remove in favor of a satisfaction bit we store with the clause in memory to avoid checking literal value. Source: FYalSAT (Choi & Kim, 2024) — Section IV-B, Partial SAT Evaluator module (Stage C) using precomputed satisfaction status per clause.
-            if (lit_value(s, c->lits[0]) == 1) {
+            if (lit_value(assigns, lits[0]) == 1) {
                 wlist[j++] = ci; /* keep watching */
                 continue;
             }
@@ -233,25 +406,42 @@ static int propagate(CDCLSolver *s) {
             /* Try to find a new literal to watch in place of lits[1]. */
             // Optimization Option 1: Compute each in parallel (Unroll Loop Fully). Source: FYalSAT (Choi & Kim, 2024) — Section IV-B3, Sub Clause Evaluator units evaluating all literals in a clause simultaneously.
             // Optimization Option 2: Use state-based approach (ucnt + XOR signature) eliminates this search entirely. Source: SAT-Accel (Lo et al., 2025) — Section V-A, signature-based clause representation with ucnt and XOR of unassigned variable indices.
-            bool found = false;
-            for (int k = 2; k < c->size; k++) {
-                if (lit_value(s, c->lits[k]) != 0) { /* not false */
-                    /* Swap lits[1] and lits[k]. */
-                    int tmp = c->lits[1];
-                    c->lits[1] = c->lits[k];
-                    c->lits[k] = tmp;
-                    watch_add(s, c->lits[1], ci);
-                    found = true;
+            // Clauses of up to 5 literals (the accelerator's MAX_K) take a fully
+            // unrolled, branch-free search: each candidate's "not false" test
+            // sets one bit of `m`, and a count-trailing-zeros picks the lowest
+            // such index, matching the loop's choice. Longer learnt clauses
+            // fall back to the loop.
+            int k = 0; /* index of the replacement watch, 0 if none */
+            unsigned m = 0;
+            switch (size) {
+            case 5: m |= (unsigned)(lit_value(assigns, lits[4]) != 0) << 2; /* fallthrough */
+            case 4: m |= (unsigned)(lit_value(assigns, lits[3]) != 0) << 1; /* fallthrough */
+            case 3: m |= (unsigned)(lit_value(assigns, lits[2]) != 0);
+                    k = m ? 2 + __builtin_ctz(m) : 0;
                     break;
+            case 2: break;
+            default:
+                for (int q = 2; q < size; q++) {
+                    if (lit_value(assigns, lits[q]) != 0) { /* not false */
+                        k = q;
+                        break;
+                    }
                 }
             }
-            if (found) continue; /* don't keep in this watch list */
+            if (k) {
+                /* Swap lits[1] and lits[k]. */
+                int tmp = lits[1];
+                lits[1] = lits[k];
+                lits[k] = tmp;
+                watch_add(s, lits[1], ci);
+                continue; /* don't keep in this watch list */
+            }
 
             /* No replacement found — clause is either unit or conflicting. */
             // Optimization: Defer Watch List Update to after processing all clauses (Removes Loop Dependency). Source: FYalSAT (Choi & Kim, 2024) — Section III-B, deferred break score aggregation as a general technique for decoupling dependent writes from parallel reads.
             wlist[j++] = ci;
 
-            if (lit_value(s, c->lits[0]) == 0) {
+            if (lit_value(assigns, lits[0]) == 0) {
                 /* CONFLICT: all literals are false. */
                 /* Copy remaining watches and update size. */
                 // Optimization: priority-encoded reduction — all clauses evaluate simultaneously, and a conflict anywhere triggers a single combined result without sequential drain. Source: SAT-Accel (Lo et al., 2025) — Section IV-B, conflict detection unit operating across all parallel processing elements with priority encoding.  
@@ -260,17 +450,28 @@ static int propagate(CDCLSolver *s) {
                 }
                 // Optimization: Defer Watch List Update to after processing all clauses (Removes Loop Dependency). Source: FYalSAT (Choi & Kim, 2024) — Section III-B, deferred break score aggregation as a general technique for decoupling dependent writes from parallel reads.
                 s->watch_size[false_lit] = j;
+                s->trail_size = trail_size;
+                s->prop_head  = prop_head;
                 return ci;
             }
 
             /* Unit clause: lits[0] is the only unassigned literal. */
             // Optimization: Implement as FIFO in hardware to pipeline with (Prefetch, Evaluation, Enqueue). Source: SAT-Accel (Lo et al., 2025) — Section IV-B, pipelined BCP with overlapped implication propagation and clause evaluation.
-            enqueue(s, c->lits[0], ci);
+            {
+                int code = lits[0];
+                int var  = lit_var(code);
+                assigns[var] = (code & 1) ? 0 : 1;  /* inlined enqueue_lit() */
+                levels[var]  = level;
+                reasons[var] = ci;
+                trail[trail_size++] = code;
+            }
         }
 
         s->watch_size[false_lit] = j;
         /* ============== HARDWARE CALLED HERE ==============*/
     }
+    s->trail_size = trail_size;
+    s->prop_head  = prop_head;
     return -1; /* no conflict */
 }
 
@@ -280,15 +481,84 @@ static int propagate(CDCLSolver *s) {
 
 #define VSIDS_DECAY 0.95
 
+/* Sift the variable at heap slot `i` towards the root. */
+static void heap_up(CDCLSolver *s, int i) {
+    int    *heap = s->heap;
+    int     v    = heap[i];
+    double  act  = s->activity[v];
+    while (i > 0) {
+        int parent = (i - 1) >> 1;
+        if (s->activity[heap[parent]] >= act) break;
+        heap[i] = heap[parent];
+        s->heap_pos[heap[i]] = i;
+        i = parent;
+    }
+    heap[i] = v;
+    s->heap_pos[v] = i;
+}
+
+/* Sift the variable at heap slot `i` towards the leaves. */
+static void heap_down(CDCLSolver *s, int i) {
+    int    *heap = s->heap;
+    int     v    = heap[i];
+    double  act  = s->activity[v];
+    while (true) {
+        int child = 2 * i + 1;
+        if (child >= s->heap_size) break;
+        if (child + 1 < s->heap_size &&
+            s->activity[heap[child + 1]] > s->activity[heap[child]])
+            child++;
+        if (s->activity[heap[child]] <= act) break;
+        heap[i] = heap[child];
+        s->heap_pos[heap[i]] = i;
+        i = child;
+    }
+    heap[i] = v;
+    s->heap_pos[v] = i;
+}
+
+/* Insert `var` into the order heap if it is not already there. */
+static void heap_insert(CDCLSolver *s, int var) {
+    if (s->heap_pos[var] >= 0) return;
+    int i = s->heap_size++;
+    s->heap[i] = var;
+    s->heap_pos[var] = i;
+    heap_up(s, i);
+}
+
+/* Remove and return the variable with the highest activity. */
+static int heap_pop(CDCLSolver *s) {
+    int top = s->heap[0];
+    s->heap_pos[top] = -1;
+    if (--s->heap_size > 0) {
+        s->heap[0] = s->heap[s->heap_size];
+        s->heap_pos[s->heap[0]] = 0;
+        heap_down(s, 0);
+    }
+    return top;
+}
+
 /* Bump the activity score of a variable (called during conflict analysis). */
 static void var_bump_activity(CDCLSolver *s, int var) {
     s->activity[var] += s->var_inc;
     /* Rescale if activity gets too large to prevent overflow. */
     if (s->activity[var] > 1e100) {
-        for (int i = 1; i <= s->num_vars; i++)
-            s->activity[i] *= 1e-100;
+        /* The activity buffer is padded to a multiple of 4 (see
+         * ACTIVITY_PAD), so rescale in unrolled chunks of 4 with no scalar
+         * tail; the compiler packs each chunk into SIMD multiplies even at
+         * -O2.  Uniform scaling keeps the heap order intact. */
+        double *act = s->activity;
+        int     n   = ACTIVITY_PAD(s->num_vars);
+        for (int i = 0; i < n; i += 4) {
+            act[i]     *= 1e-100;
+            act[i + 1] *= 1e-100;
+            act[i + 2] *= 1e-100;
+            act[i + 3] *= 1e-100;
+        }
         s->var_inc *= 1e-100;
     }
+    /* Activity only grows, so the heap invariant is restored by sifting up. */
+    if (s->heap_pos[var] >= 0) heap_up(s, s->heap_pos[var]);
 }
 
 /* Decay all activities (called once per conflict). */
@@ -302,32 +572,36 @@ static void var_decay_activity(CDCLSolver *s) {
 
 /*
  * Analyze a conflict clause and produce a learned clause.
- * Sets `out_bt_level` to the backtrack level.
+ * Sets `out_bt_level` to the backtrack level and `out_lbd` to the clause's LBD.
  * Returns the number of literals in the learned clause stored in `learnt_buf`.
  */
 static int analyze(CDCLSolver *s, int conflict_ci,
-                   int *learnt_buf, int *out_bt_level) {
+                   int *learnt_buf, int *out_bt_level, int *out_lbd) {
     int current_level = s->num_decisions;
     // Logs variables we have already processed in the current analysis.
-    bool *seen = (bool *)calloc(s->num_vars + 1, sizeof(bool));
+    // Preallocated and all-clear between calls; only touched entries are reset.
+    bool *seen = s->seen;
 
     // Size of learned clause.
     int learnt_count = 0;
     int counter = 0; /* number of literals at current decision level still to resolve */
 
     /* Start with the conflict clause. (Fetches clause with only false literals) */
-    Clause *c = s->clauses[conflict_ci];
-    for (int i = 0; i < c->size; i++) {
-        int var = lit_var(c->lits[i]);
-        if (!seen[var]) {
+    int *c_lits = clause_lits(s, conflict_ci);
+    int  c_size = clause_size(s, conflict_ci);
+    for (int i = 0; i < c_size; i++) {
+        int var = lit_var(c_lits[i]);
+        // Level-0 variables are fixed forever: they never enter the learned
+        // clause, so they are never marked and never need clearing.
+        if (!seen[var] && s->levels[var] > 0) {
             seen[var] = true;
             // Variable activity bumps as it is involved in more conflicts (VSIDS).
             var_bump_activity(s, var);
             if (s->levels[var] == current_level) {
                 // If the variable occurred at the current decision level, it is part of the reason for the conflict. We add to the count of needed resolutions and do not add to the learned clause.
                 counter++;
-            } else if (s->levels[var] > 0) {
-                learnt_buf[learnt_count++] = c->lits[i];
+            } else {
+                learnt_buf[learnt_count++] = c_lits[i];
             }
         }
     }
@@ -353,16 +627,20 @@ static int analyze(CDCLSolver *s, int conflict_ci,
             /* Resolve with the reason clause. Same as conflict loop earlier at line 311. */
             int reason_ci = s->reasons[var];
             assert(reason_ci >= 0);
-            Clause *rc = s->clauses[reason_ci];
-            for (int i = 0; i < rc->size; i++) {
-                int rvar = lit_var(rc->lits[i]);
-                if (!seen[rvar]) {
+            int *rc_lits = clause_lits(s, reason_ci);
+            int  rc_size = clause_size(s, reason_ci);
+            for (int i = 0; i < rc_size; i++) {
+                int rvar = lit_var(rc_lits[i]);
+                /* Skip the implied literal itself: it was just resolved out and
+                 * its seen flag cleared, so it must not be counted again. */
+                if (rvar == var) continue;
+                if (!seen[rvar] && s->levels[rvar] > 0) {
                     seen[rvar] = true;
                     var_bump_activity(s, rvar);
                     if (s->levels[rvar] == current_level) {
                         counter++;
-                    } else if (s->levels[rvar] > 0) {
-                        learnt_buf[learnt_count++] = rc->lits[i];
+                    } else {
+                        learnt_buf[learnt_count++] = rc_lits[i];
                     }
                 }
             }
@@ -395,7 +673,23 @@ static int analyze(CDCLSolver *s, int conflict_ci,
     }
 
     *out_bt_level = bt_level;
-    free(seen);
+
+    /* LBD: number of distinct decision levels in the learned clause. */
+    int stamp = ++s->lbd_stamp;
+    int lbd = 0;
+    for (int i = 0; i < learnt_count; i++) {
+        int lv = s->levels[lit_var(learnt_buf[i])];
+        if (s->level_stamp[lv] != stamp) {
+            s->level_stamp[lv] = stamp;
+            lbd++;
+        }
+    }
+    *out_lbd = lbd;
+
+    /* Current-level marks were cleared during the UIP walk; the only marks
+     * left belong to the lower-level literals of the learned clause. */
+    for (int i = 1; i < learnt_count; i++)
+        seen[lit_var(learnt_buf[i])] = false;
 
     var_decay_activity(s);
 
@@ -408,25 +702,26 @@ static int analyze(CDCLSolver *s, int conflict_ci,
 
 /* Undo all assignments above the given decision level. */
 static void backtrack(CDCLSolver *s, int level) {
-    while (s->trail_size > 0) {
-        /* If we've unwound past the target level, stop. */
-        if (s->num_decisions <= level) break;
-
-        /* Check if the top of the trail is a decision boundary. */
-        if (s->num_decisions > level &&
-            s->trail_size <= s->trail_delimiters[s->num_decisions - 1]) {
-            s->num_decisions--;
-            continue;
+    /* The truncated entries stay in the trail buffer, so recording the old
+     * end is enough for callers (hw_sync_assigns) to see what was undone. */
+    s->trail_cleared = s->trail_size;
+    if (s->num_decisions > level) {
+        /* Everything assigned at levels > `level` sits at or above the
+         * delimiter of level+1, so unwind that suffix in one pass and
+         * truncate the trail once instead of popping entry by entry. */
+        int  target  = s->trail_delimiters[level];
+        int *trail   = s->trail;
+        signed char *assigns = s->assigns;
+        int *reasons = s->reasons;
+        for (int k = s->trail_size - 1; k >= target; k--) {
+            int var = lit_var(trail[k]);
+            s->polarity[var] = assigns[var]; /* phase saving */
+            assigns[var] = UNASSIGNED;
+            reasons[var] = -1;
+            heap_insert(s, var);
         }
-
-        int code = s->trail[--s->trail_size];
-        int var = lit_var(code);
-        s->assigns[var] = UNASSIGNED;
-        s->reasons[var] = -1;
-    }
-    /* Also pop any remaining decision-level markers. */
-    while (s->num_decisions > level) {
-        s->num_decisions--;
+        s->trail_size    = target;
+        s->num_decisions = level;
     }
     /* Reset the propagation pointer so BCP re-processes from the new trail end. */
     s->prop_head = s->trail_size;
@@ -437,43 +732,111 @@ static void backtrack(CDCLSolver *s, int level) {
 /* ========================================================================= */
 
 /* Pick the unassigned variable with the highest activity score.
+ * Assigned variables are removed from the heap lazily as they surface.
  * Returns 0 if all variables are assigned (SAT). */
 static int pick_decision_var(CDCLSolver *s) {
-    int best_var = 0;
-    double best_act = -1.0;
-    for (int v = 1; v <= s->num_vars; v++) {
-        if (s->assigns[v] == UNASSIGNED && s->activity[v] > best_act) {
-            best_act = s->activity[v];
-            best_var = v;
-        }
+    /* Every variable is on the trail: nothing left to decide. */
+    if (s->trail_size == s->num_vars) return 0;
+    while (s->heap_size > 0) {
+        int v = heap_pop(s);
+        if (s->assigns[v] == UNASSIGNED) return v;
     }
-    return best_var;
+    return 0;
 }
 
 /* ========================================================================= */
 /*  Add a learned clause to the database                                     */
 /* ========================================================================= */
 
-static int add_learnt_clause(CDCLSolver *s, int *lits, int len) {
-    if (s->clause_count == s->clause_cap) {
-        s->clause_cap *= 2;
-        s->clauses = (Clause **)realloc(s->clauses,
-                                        s->clause_cap * sizeof(Clause *));
+static int add_learnt_clause(CDCLSolver *s, int *lits, int len, int lbd) {
+    int *dst = clause_alloc(s, len, CLAUSE_LEARNT);
+    memcpy(dst, lits, len * sizeof(int));
+
+    int ci = s->clause_count - 1;
+    s->clause_lbd[ci] = lbd;
+    clause_attach(s, dst, len, ci);
+    return ci;
+}
+
+/* ========================================================================= */
+/*  Learnt clause database reduction                                         */
+/* ========================================================================= */
+
+/* Reduction candidate: a learnt clause and its LBD. */
+typedef struct {
+    int lbd;
+    int ci;
+} ReduceEntry;
+
+/* Worst first: higher LBD, then older clause. */
+static int reduce_cmp(const void *a, const void *b) {
+    const ReduceEntry *x = (const ReduceEntry *)a;
+    const ReduceEntry *y = (const ReduceEntry *)b;
+    if (x->lbd != y->lbd) return y->lbd - x->lbd;
+    return x->ci - y->ci;
+}
+
+/*
+ * Glucose-style reduction: delete the worst half (by LBD) of the learnt
+ * clauses.  Glue clauses (LBD <= 2, which includes every binary) and
+ * clauses that are the reason for a current assignment are kept.
+ * Deleted clauses are only marked and unhooked from the watch lists;
+ * clause indices are never reused, so reasons[] stays valid.
+ */
+static void reduce_db(CDCLSolver *s) {
+    ReduceEntry *cand = (ReduceEntry *)malloc(s->clause_count * sizeof(ReduceEntry));
+    int n = 0;
+    for (int ci = 0; ci < s->clause_count; ci++) {
+        if (s->clause_learnt[ci] != CLAUSE_LEARNT || s->clause_lbd[ci] <= 2)
+            continue;
+        /* Locked: propagate() keeps the implied literal in lits[0]. */
+        int var0 = lit_var(clause_lits(s, ci)[0]);
+        if (s->assigns[var0] != UNASSIGNED && s->reasons[var0] == ci)
+            continue;
+        cand[n].lbd = s->clause_lbd[ci];
+        cand[n].ci  = ci;
+        n++;
     }
-    Clause *c = (Clause *)malloc(sizeof(Clause) + len * sizeof(int));
-    c->size = len;
-    c->learnt = true;
-    memcpy(c->lits, lits, len * sizeof(int));
-
-    int ci = s->clause_count;
-    s->clauses[ci] = c;
-    s->clause_count++;
-
-    if (len >= 2) {
-        watch_add(s, c->lits[0], ci);
-        watch_add(s, c->lits[1], ci);
+    qsort(cand, n, sizeof(ReduceEntry), reduce_cmp);
+    for (int i = 0; i < n / 2; i++)
+        s->clause_learnt[cand[i].ci] = CLAUSE_DELETED;
+    free(cand);
+
+    /* Rewrite every watch list in one pass, dropping deleted clauses. */
+    int lits = 2 * s->num_vars + 2;
+    for (int lit = 0; lit < lits; lit++) {
+        int *wlist = s->watches[lit];
+        int  j = 0;
+        for (int i = 0; i < s->watch_size[lit]; i++) {
+            if (s->clause_learnt[wlist[i]] != CLAUSE_DELETED)
+                wlist[j++] = wlist[i];
+        }
+        s->watch_size[lit] = j;
     }
-    return ci;
+
+    s->reductions++;
+    s->next_reduce = s->conflicts + REDUCE_FIRST + REDUCE_INC * s->reductions;
+}
+
+/* ========================================================================= */
+/*  Restarts                                                                 */
+/* ========================================================================= */
+
+/* i-th element (0-based) of the Luby sequence 1,1,2,1,1,2,4,1,1,2,... */
+static long luby(int i) {
+    /* Find the finite subsequence that contains index i, and its size. */
+    int size = 1, seq = 0;
+    while (size < i + 1) {
+        seq++;
+        size = 2 * size + 1;
+    }
+    /* Descend into the copy of the prefix that i falls in. */
+    while (size - 1 != i) {
+        size = (size - 1) >> 1;
+        seq--;
+        i = i % size;
+    }
+    return 1L << seq;
 }
 
 /* ========================================================================= */
@@ -488,18 +851,22 @@ static int add_learnt_clause(CDCLSolver *s, int *lits, int len) {
 int cdcl_solve(CDCLSolver *s) {
     /* Handle any unit clauses present at the start. */
     for (int i = 0; i < s->clause_count; i++) {
-        Clause *c = s->clauses[i];
-        if (c->size == 0) return UNSAT;
-        if (c->size == 1) {
-            if (lit_value(s, c->lits[0]) == 0) return UNSAT; /* contradictory unit */
-            if (lit_value(s, c->lits[0]) == UNASSIGNED)
-                enqueue(s, c->lits[0], i);
+        int size = clause_size(s, i);
+        int lit0 = s->clause_lits[s->clause_off[i]];
+        if (size == 0) return UNSAT;
+        if (size == 1) {
+            if (lit_value(s->assigns, lit0) == 0) return UNSAT; /* contradictory unit */
+            if (lit_value(s->assigns, lit0) == UNASSIGNED)
+                enqueue_lit(s, lit0, i);
         }
     }
 
     /* Buffer for learned clauses (max possible size = num_vars). */
     int *learnt_buf = (int *)malloc((s->num_vars + 1) * sizeof(int));
 
+    /* Conflicts left before the next restart. */
+    long restart_budget = RESTART_BASE * luby(s->restarts);
+
 #ifdef USE_HW_BCP
     if (hw_open(hw_port) < 0) {
         fprintf(stderr, "cdcl_solve: failed to open hardware interface\n");
@@ -528,8 +895,8 @@ int cdcl_solve(CDCLSolver *s) {
             }
 
             /* Analyze the conflict and derive a learned clause. */
-            int bt_level = 0;
-            int learnt_len = analyze(s, conflict, learnt_buf, &bt_level);
+            int bt_level = 0, lbd = 0;
+            int learnt_len = analyze(s, conflict, learnt_buf, &bt_level, &lbd);
 
             /* Backtrack to the computed level. */
             backtrack(s, bt_level);
@@ -540,10 +907,24 @@ int cdcl_solve(CDCLSolver *s) {
             /* Add the learned clause and propagate the asserting literal. */
             if (learnt_len == 1) {
                 /* Unit learned clause — enqueue at level 0. */
-                enqueue(s, learnt_buf[0], -1);
+                enqueue_lit(s, learnt_buf[0], -1);
             } else {
-                int ci = add_learnt_clause(s, learnt_buf, learnt_len);
-                enqueue(s, learnt_buf[0], ci);
+                int ci = add_learnt_clause(s, learnt_buf, learnt_len, lbd);
+                enqueue_lit(s, learnt_buf[0], ci);
+            }
+
+            /* Periodically drop the least useful half of the learnt clauses. */
+            if (++s->conflicts >= s->next_reduce) reduce_db(s);
+
+            /* Luby restart: return to level 0, keeping learnt clauses,
+             * activities and saved phases. */
+            if (--restart_budget <= 0) {
+                backtrack(s, 0);
+#ifdef USE_HW_BCP
+                hw_sync_assigns(s, 0);
+#endif
+                s->restarts++;
+                restart_budget = RESTART_BASE * luby(s->restarts);
             }
         } else {
             /* NO CONFLICT — make a decision. */
@@ -561,9 +942,10 @@ int cdcl_solve(CDCLSolver *s) {
             s->trail_delimiters[s->num_decisions] = s->trail_size;
             s->num_decisions++;
 
-            /* Decide: assign the variable to FALSE (arbitrary polarity). */
-            int dec_lit = lit_to_code(-dec_var); /* negative literal = assign FALSE */
-            enqueue(s, dec_lit, -1);
+            /* Decide: reuse the variable's last polarity (phase saving);
+             * variables never assigned before start FALSE. */
+            int dec_lit = 2 * dec_var + (s->polarity[dec_var] != 1);
+            enqueue_lit(s, dec_lit, -1);
 #ifdef USE_HW_BCP
             hw_write_assign(dec_var, s->assigns[dec_var]);
 #endif
@@ -20,21 +20,24 @@
 #define UNSAT      0
 #define UNASSIGNED (-1)
 
+/* Clause kinds stored in CDCLSolver.clause_learnt. */
+#define CLAUSE_ORIGINAL 0
+#define CLAUSE_LEARNT   1
+#define CLAUSE_DELETED  2   /* learnt clause dropped by reduce_db */
+
 /* ========================================================================= */
 /*  Data structures                                                          */
 /* ========================================================================= */
 
 /*
- * Clause: a disjunction of literals.
- * Stored with a flexible array member for the literal list.
+ * Clause database layout (structure of arrays, CSR style).
+ * All literals of all clauses live back to back in one contiguous
+ * `clause_lits` buffer; clause `ci` occupies
+ *   clause_lits[clause_off[ci] .. clause_off[ci+1])
+ * so a BCP walk over a clause touches a single cache-linear run of ints
+ * instead of chasing a per-clause heap pointer.
  * Literals use the internal encoding: positive x -> 2*x, negative x -> 2*x+1.
  */
-typedef struct {
-    int  size;      /* number of literals                     */
-    bool learnt;    /* true if this clause was learned         */
-    int  lits[];    /* flexible array of internal literal codes */
-} Clause;
-
 /*
  * CDCLSolver: the main solver state.
  */
@@ -42,10 +45,17 @@ typedef struct {
     int num_vars;           /* number of variables (1-indexed)       */
 
     /* Per-variable data (indexed 1..num_vars). */
-    int    *assigns;        /* current assignment: 0=FALSE, 1=TRUE, -1=UNASSIGNED */
+    signed char *assigns;   /* current assignment: 0=FALSE, 1=TRUE, -1=UNASSIGNED */
     int    *levels;         /* decision level at which variable was assigned       */
     int    *reasons;        /* clause index that implied the assignment, or -1     */
     double *activity;       /* VSIDS activity score                               */
+    signed char *polarity;  /* saved phase: last value assigned (0=FALSE, 1=TRUE) */
+    bool   *seen;           /* conflict-analysis marks (all false between calls)   */
+
+    /* VSIDS order heap: binary max-heap of variables keyed on activity. */
+    int *heap;              /* heap[i] = variable at heap slot i       */
+    int *heap_pos;          /* heap_pos[v] = slot of v, or -1          */
+    int  heap_size;         /* number of variables in the heap         */
 
     /* Propagation trail. */
     int *trail;             /* sequence of assigned literal codes      */
@@ -53,21 +63,64 @@ typedef struct {
     int  prop_head;         /* propagation queue head pointer          */
     int *trail_delimiters;  /* trail_size at the start of each decision level */
     int  num_decisions;     /* current decision level                  */
+    int  trail_cleared;     /* trail_size before the last backtrack: the
+                             * entries in [trail_size, trail_cleared) are
+                             * the literals it just unassigned          */
 
     /* Two-watched-literal scheme: one watch list per literal code. */
     int **watches;          /* watches[lit] = array of clause indices  */
     int  *watch_size;       /* current size of each watch list         */
     int  *watch_cap;        /* allocated capacity of each watch list   */
 
-    /* Clause database. */
-    Clause **clauses;       /* array of clause pointers    */
-    int      clause_count;  /* number of clauses           */
-    int      clause_cap;    /* allocated capacity          */
+    /* Binary clauses bypass the generic watch lists: bin_watches[lit] holds
+     * (other literal, clause index) pairs, interleaved, for every binary
+     * clause containing `lit`. */
+    int **bin_watches;      /* bin_watches[lit] = {other0, ci0, other1, ci1, ...} */
+    int  *bin_size;         /* number of pairs in each binary list     */
+    int  *bin_cap;          /* allocated capacity (pairs)              */
+
+    /* Clause database (SoA / CSR, see above). */
+    int           *clause_lits;   /* all clause literals, concatenated       */
+    int            lits_cap;      /* allocated capacity of clause_lits       */
+    int           *clause_off;    /* clause_off[ci] = start of clause ci     */
+    unsigned char *clause_learnt; /* CLAUSE_ORIGINAL / _LEARNT / _DELETED     */
+    int           *clause_lbd;    /* literal block distance (learnt clauses) */
+    int            clause_count;  /* number of clauses                       */
+    int            clause_cap;    /* allocated capacity (clauses)            */
 
     /* VSIDS increment (grows on each decay). */
     double var_inc;
+
+    /* Learnt-clause database reduction. */
+    int *level_stamp;       /* per-level marks for LBD computation     */
+    int  lbd_stamp;         /* current mark value                      */
+    long conflicts;         /* conflicts seen so far                   */
+    long next_reduce;       /* conflict count that triggers reduce_db  */
+    int  reductions;        /* number of reductions performed          */
+    int  restarts;          /* number of restarts performed            */
 } CDCLSolver;
 
+/* Number of literals in clause `ci`. */
+static inline int clause_size(const CDCLSolver *s, int ci) {
+    return s->clause_off[ci + 1] - s->clause_off[ci];
+}
+
+/* Pointer to the first literal of clause `ci` (valid until the next add). */
+static inline int *clause_lits(const CDCLSolver *s, int ci) {
+    return s->clause_lits + s->clause_off[ci];
+}
+
+/* Assign literal `code` at the current decision level and push it on the
+ * trail.  `reason` is the implying clause index, or -1 for decisions.
+ * Shared by the software BCP and the hardware drivers. */
+static inline void enqueue_lit(CDCLSolver *s, int code, int reason) {
+    int var = code >> 1;
+    s->assigns[var] = (signed char)!(code & 1);  /* even code -> TRUE */
+    s->levels[var]  = s->num_decisions;
+    s->reasons[var] = reason;
+    s->trail[s->trail_size++] = code;
+}
+
 /* ========================================================================= */
 /*  Public API                                                               */
 /* ========================================================================= */
@@ -78,6 +131,12 @@ CDCLSolver *cdcl_create(int num_vars);
 /* Free all memory associated with the solver. */
 void cdcl_destroy(CDCLSolver *s);
 
+/*
+ * Optional: preallocate space for `num_clauses` clauses with `num_lits`
+ * literals in total (e.g. from the DIMACS header) before adding them.
+ */
+void cdcl_reserve(CDCLSolver *s, int num_clauses, int num_lits);
+
 /*
  * Add a clause to the formula.
  * `signed_lits` is an array of signed integers: positive = var, negative = ~var.
@@ -86,6 +145,12 @@ void cdcl_destroy(CDCLSolver *s);
  */
 int cdcl_add_clause(CDCLSolver *s, int *signed_lits, int len);
 
+/*
+ * Same as cdcl_add_clause(), but `codes` already uses the internal literal
+ * encoding: variable x -> 2*x, negated x -> 2*x+1.
+ */
+int cdcl_add_clause_codes(CDCLSolver *s, const int *codes, int len);
+
 /*
  * Solve the formula.
  * Returns SAT (1) if satisfiable, UNSAT (0) if unsatisfiable.
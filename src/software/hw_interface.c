@@ -11,11 +11,16 @@
  *   0x03 WRITE_WL_LEN   [lit:2][len:1]                             3 bytes
  *   0x04 WRITE_ASSIGN   [var:2][val:1]                             3 bytes
  *   0x05 BCP_START      [false_lit:2]                              2 bytes
+ *   0x06 RESET_STATE    (none)                                     0 bytes
+ *   0x08 WRITE_CLAUSE_BURST [count:2][clause_id:2]                 4 bytes
+ *        then count × [size:1][sat:1][lit0..4:10]           12 bytes each
+ *   0x0A WRITE_BATCH    [cmd:1][count:1]                           2 bytes
+ *        then count × the payload of cmd (0x01..0x04), no command bytes
  *
  * Protocol (FPGA → Host):
  *   0xB0 [var:2][val:1][reason:2]  — implication  (6 bytes)
- *   0xC0 [clause_id:2][0x00]       — done, no conflict (4 bytes)
- *   0xC1 [clause_id:2][0x00]       — done, conflict    (4 bytes)
+ *   0xC0 [clause_id:2]             — done, no conflict (3 bytes)
+ *   0xC1 [clause_id:2]             — done, conflict    (3 bytes)
  */
 
 #ifdef USE_HW_BCP
@@ -41,6 +46,9 @@
 #define CMD_WRITE_WL_LEN   0x03
 #define CMD_WRITE_ASSIGN   0x04
 #define CMD_BCP_START      0x05
+#define CMD_RESET_STATE    0x06
+#define CMD_WRITE_CLAUSE_BURST 0x08
+#define CMD_WRITE_BATCH    0x0A
 
 /* ── Response bytes ─────────────────────────────────────────────────────── */
 #define RSP_IMPLICATION    0xB0
@@ -60,14 +68,32 @@
 /* ── Global port path (set by main before cdcl_solve) ──────────────────── */
 const char *hw_port = NULL;
 
+/* Bytes of queued commands held back before a single write() */
+#define TX_BUF_SIZE 4096
+
+/* Clauses per WRITE_CLAUSE_BURST; one burst fits in the TX buffer */
+#define CLAUSE_BURST 256
+
 /* ── Static state ───────────────────────────────────────────────────────── */
 static int serial_fd = -1;
+static unsigned char tx_buf[TX_BUF_SIZE];
+static int tx_len = 0;
+
+/* Last queued command, for merging runs of it into one WRITE_BATCH:
+ * its offset in tx_buf (-1 if none), opcode and payload count */
+static int last_off = -1;
+static unsigned char last_cmd = 0;
+static int last_count = 0;
+
+/* hw_wl_loaded[lit] is set when hw_init uploaded a non-empty watch list
+ * for lit; rounds on the other literals cannot imply anything. */
+static unsigned char *hw_wl_loaded = NULL;
 
 /* ── Helper: map software assign value → hardware encoding ──────────────── */
+static const unsigned char sw_to_hw_lut[3] = { HW_UNASSIGNED, HW_FALSE, HW_TRUE };
+
 static inline unsigned char sw_to_hw_assign(int val) {
-    if (val == 1)  return HW_TRUE;
-    if (val == 0)  return HW_FALSE;
-    return HW_UNASSIGNED;  /* UNASSIGNED = -1 */
+    return sw_to_hw_lut[val + 1];  /* -1/0/1 → UNASSIGNED/FALSE/TRUE */
 }
 
 /* ── Helper: map hardware assign value → software encoding ──────────────── */
@@ -77,6 +103,12 @@ static inline int hw_to_sw_assign(unsigned char val) {
     return UNASSIGNED;
 }
 
+/* ── Helper: enqueue an implication reported by the accelerator ─────────── */
+static inline void apply_implication(CDCLSolver *s, int var, int hw_val, int reason) {
+    /* HW_TRUE → positive literal (even code), HW_FALSE → negative (odd) */
+    enqueue_lit(s, 2 * var + (hw_val != HW_TRUE), reason);
+}
+
 /* ── Serial I/O helpers ─────────────────────────────────────────────────── */
 
 static int send_bytes(const unsigned char *buf, int len) {
@@ -90,7 +122,9 @@ static int send_bytes(const unsigned char *buf, int len) {
         }
         total += n;
     }
-    tcdrain(serial_fd);
+    /* No tcdrain(): write() returns once the bytes are in the kernel TX
+     * buffer, so packing the next batch overlaps with the UART sending
+     * this one.  Byte order on the wire is unchanged. */
     return 0;
 }
 
@@ -112,9 +146,46 @@ static int recv_bytes(unsigned char *buf, int len) {
     return 0;
 }
 
-static int send_cmd(unsigned char cmd, const unsigned char *payload, int payload_len) {
-    if (send_bytes(&cmd, 1) < 0) return -1;
-    if (payload_len > 0 && send_bytes(payload, payload_len) < 0) return -1;
+/* Queued commands go out in one write() instead of one per packet.
+ * Used for bulk uploads where nothing is read back in between. */
+static int flush_cmds(void) {
+    if (tx_len == 0) return 0;
+    int rc = send_bytes(tx_buf, tx_len);
+    tx_len = 0;
+    last_off = -1;
+    return rc;
+}
+
+/* Single-payload writes that WRITE_BATCH may repeat */
+static inline int batchable(unsigned char cmd) {
+    return cmd >= CMD_WRITE_CLAUSE && cmd <= CMD_WRITE_ASSIGN;
+}
+
+static int queue_cmd(unsigned char cmd, const unsigned char *payload, int payload_len) {
+    /* A run of the same write becomes one WRITE_BATCH, so each payload
+     * after the first costs no command byte: the first repeat rewrites
+     * the previous command into a batch header in place. */
+    if (batchable(cmd) && cmd == last_cmd && last_off >= 0 && last_count < 255
+        && tx_len + 2 + payload_len <= TX_BUF_SIZE) {
+        if (last_count == 1) {
+            memmove(tx_buf + last_off + 3, tx_buf + last_off + 1, payload_len);
+            tx_buf[last_off]     = CMD_WRITE_BATCH;
+            tx_buf[last_off + 1] = cmd;
+            tx_len += 2;
+        }
+        tx_buf[last_off + 2] = (unsigned char)++last_count;
+        memcpy(tx_buf + tx_len, payload, payload_len);
+        tx_len += payload_len;
+        return 0;
+    }
+
+    if (tx_len + 1 + payload_len > TX_BUF_SIZE && flush_cmds() < 0) return -1;
+    last_off = tx_len;
+    last_cmd = cmd;
+    last_count = 1;
+    tx_buf[tx_len++] = cmd;
+    if (payload_len > 0) memcpy(tx_buf + tx_len, payload, payload_len);
+    tx_len += payload_len;
     return 0;
 }
 
@@ -186,64 +257,92 @@ void hw_close(void) {
         close(serial_fd);
         serial_fd = -1;
     }
+
+    free(hw_wl_loaded);
+    hw_wl_loaded = NULL;
 }
 
 void hw_init(CDCLSolver *s) {
     unsigned char payload[14];
-
-    /* 1. Upload clauses */
-    for (int ci = 0; ci < s->clause_count; ci++) {
-        Clause *c = s->clauses[ci];
-        int size = c->size;
-        if (size > 5) size = 5;  /* hardware supports max 5 literals */
-
-        /* clause_id big-endian */
-        payload[0] = (ci >> 8) & 0xFF;
-        payload[1] = ci & 0xFF;
-        /* size */
-        payload[2] = (unsigned char)size;
-        /* sat bit (0 at init) */
-        payload[3] = 0;
-        /* literals 0..4, big-endian 2 bytes each */
-        for (int k = 0; k < 5; k++) {
-            int lit = (k < size) ? c->lits[k] : 0;
-            payload[4 + k * 2]     = (lit >> 8) & 0xFF;
-            payload[4 + k * 2 + 1] = lit & 0xFF;
+    unsigned char burst[4 + CLAUSE_BURST * 12];
+
+    /* 1. Upload clauses as WRITE_CLAUSE_BURSTs of consecutive clause ids:
+     * one command byte and header per CLAUSE_BURST clauses */
+    for (int first = 0; first < s->clause_count; first += CLAUSE_BURST) {
+        int n = s->clause_count - first;
+        if (n > CLAUSE_BURST) n = CLAUSE_BURST;
+
+        /* count and first clause_id, big-endian */
+        burst[0] = (n >> 8) & 0xFF;
+        burst[1] = n & 0xFF;
+        burst[2] = (first >> 8) & 0xFF;
+        burst[3] = first & 0xFF;
+
+        for (int j = 0; j < n; j++) {
+            int ci = first + j;
+            const int *lits = clause_lits(s, ci);
+            int size = clause_size(s, ci);
+            unsigned char *body = burst + 4 + j * 12;
+
+            /* Clauses already satisfied by a level-0 unit are marked with
+             * the sat bit so the evaluator skips them for the whole solve. */
+            int sat = 0;
+            for (int k = 0; k < size; k++)
+                sat |= s->assigns[lits[k] >> 1] == ((lits[k] & 1) ^ 1);
+            if (size > 5) size = 5;  /* hardware supports max 5 literals */
+
+            body[0] = (unsigned char)size;
+            body[1] = (unsigned char)sat;
+            /* literals 0..size-1, big-endian 2 bytes each */
+            memset(body + 2, 0, 10);  /* unused literal slots are 0 */
+            for (int k = 0; k < size; k++) {
+                body[2 + k * 2]     = (lits[k] >> 8) & 0xFF;
+                body[2 + k * 2 + 1] = lits[k] & 0xFF;
+            }
         }
-        send_cmd(CMD_WRITE_CLAUSE, payload, 14);
+        queue_cmd(CMD_WRITE_CLAUSE_BURST, burst, 4 + n * 12);
     }
+    flush_cmds();
 
-    /* 2. Upload watch lists */
+    /* 2. Upload watch lists, batched like the clauses */
     int num_lits = 2 * s->num_vars + 2;
+    free(hw_wl_loaded);
+    hw_wl_loaded = calloc(num_lits, 1);
     for (int lit = 0; lit < num_lits; lit++) {
-        int wlen = s->watch_size[lit];
+        /* The hardware has a single watch list per literal: generic
+         * watches first, then the binary clauses the solver keeps apart. */
+        int nlong = s->watch_size[lit];
+        int wlen  = nlong + s->bin_size[lit];
         if (wlen == 0) continue;
+        if (hw_wl_loaded) hw_wl_loaded[lit] = 1;
+        const int *wl = s->watches[lit];
+        const int *bl = s->bin_watches[lit];
 
         /* Send watch list length */
         payload[0] = (lit >> 8) & 0xFF;
         payload[1] = lit & 0xFF;
         payload[2] = (unsigned char)wlen;
-        send_cmd(CMD_WRITE_WL_LEN, payload, 3);
+        queue_cmd(CMD_WRITE_WL_LEN, payload, 3);
 
-        /* Send each watch entry */
+        /* Send each watch entry; lit bytes are shared by the whole list */
         for (int j = 0; j < wlen; j++) {
-            int clause_id = s->watches[lit][j];
-            payload[0] = (lit >> 8) & 0xFF;
-            payload[1] = lit & 0xFF;
+            int clause_id = (j < nlong) ? wl[j] : bl[2 * (j - nlong) + 1];
             payload[2] = (unsigned char)j;
             payload[3] = (clause_id >> 8) & 0xFF;
             payload[4] = clause_id & 0xFF;
-            send_cmd(CMD_WRITE_WL_ENTRY, payload, 5);
+            queue_cmd(CMD_WRITE_WL_ENTRY, payload, 5);
         }
     }
+    flush_cmds();
 
-    /* 3. Upload variable assignments */
+    /* 3. Upload variable assignments: RESET_STATE clears every variable
+     * to UNASSIGNED in one cycle, so only the level-0 units need sending */
+    queue_cmd(CMD_RESET_STATE, NULL, 0);
     for (int var = 1; var <= s->num_vars; var++) {
-        payload[0] = (var >> 8) & 0xFF;
-        payload[1] = var & 0xFF;
-        payload[2] = sw_to_hw_assign(s->assigns[var]);
-        send_cmd(CMD_WRITE_ASSIGN, payload, 3);
+        if (s->assigns[var] != UNASSIGNED)
+            hw_write_assign(var, s->assigns[var]);
     }
+    flush_cmds();
 }
 
 void hw_write_assign(int var, int val) {
@@ -251,18 +350,19 @@ void hw_write_assign(int var, int val) {
     payload[0] = (var >> 8) & 0xFF;
     payload[1] = var & 0xFF;
     payload[2] = sw_to_hw_assign(val);
-    send_cmd(CMD_WRITE_ASSIGN, payload, 3);
+    /* Held in the TX buffer; hw_propagate sends it with the next BCP_START */
+    queue_cmd(CMD_WRITE_ASSIGN, payload, 3);
 }
 
 void hw_sync_assigns(CDCLSolver *s, int from_level) {
-    /* After backtracking, any variable no longer on the trail should be
-     * marked UNASSIGNED on the FPGA.  We just re-send the current state
-     * for all variables — the solver has already unassigned them. */
-    for (int var = 1; var <= s->num_vars; var++) {
-        if (s->assigns[var] == UNASSIGNED) {
-            hw_write_assign(var, UNASSIGNED);
-        }
+    /* After backtracking, only the variables the backtrack just cleared
+     * need to be marked UNASSIGNED on the FPGA: they are the trail slice
+     * [trail_size, trail_cleared) that backtrack() cut off. */
+    (void)from_level;
+    for (int k = s->trail_size; k < s->trail_cleared; k++) {
+        hw_write_assign(s->trail[k] >> 1, UNASSIGNED);
     }
+    s->trail_cleared = s->trail_size;
 }
 
 int hw_propagate(CDCLSolver *s) {
@@ -274,10 +374,18 @@ int hw_propagate(CDCLSolver *s) {
         int true_lit = s->trail[s->prop_head];
         int false_lit = true_lit ^ 1;
 
-        /* Send BCP_START with false_lit (big-endian) */
+        /* Empty watch list on the FPGA: skip the BCP_START round trip */
+        if (hw_wl_loaded && !hw_wl_loaded[false_lit]) {
+            s->prop_head++;
+            continue;
+        }
+
+        /* Send BCP_START with false_lit (big-endian), behind any queued
+         * assignment writes so they land in the same write() */
         payload[0] = (false_lit >> 8) & 0xFF;
         payload[1] = false_lit & 0xFF;
-        send_cmd(CMD_BCP_START, payload, 2);
+        queue_cmd(CMD_BCP_START, payload, 2);
+        if (flush_cmds() < 0) return -1;
 
         /* Read response packets */
         int conflict_ci = -1;
@@ -296,35 +404,22 @@ int hw_propagate(CDCLSolver *s) {
                 int hw_val = resp[3];
                 int reason = (resp[4] << 8) | resp[5];
 
-                /* Convert hardware value to literal code:
-                 * HW_TRUE (2) → positive lit = 2*var (even)
-                 * HW_FALSE (1) → negative lit = 2*var+1 (odd) */
-                int code;
-                if (hw_val == HW_TRUE)
-                    code = 2 * var;       /* assign TRUE → even code */
-                else
-                    code = 2 * var + 1;   /* assign FALSE → odd code */
-
                 /* Enqueue into the solver */
-                s->assigns[var] = (code & 1) ? 0 : 1;
-                s->levels[var]  = s->num_decisions;
-                s->reasons[var] = reason;
-                s->trail[s->trail_size++] = code;
-
-                /* Also sync this new assignment to the FPGA so subsequent
-                 * BCP rounds see it */
-                hw_write_assign(var, s->assigns[var]);
+                apply_implication(s, var, hw_val, reason);
+
+                /* No WRITE_ASSIGN needed: the accelerator writes its own
+                 * implications back into assignment memory. */
                 break;
             }
             case RSP_DONE_OK:
-                /* Read 3 more bytes: clause_id(2) + padding(1) */
-                if (recv_bytes(resp + 1, 3) < 0) return -1;
+                /* Read 2 more bytes: clause_id(2) */
+                if (recv_bytes(resp + 1, 2) < 0) return -1;
                 done = 1;
                 break;
 
             case RSP_DONE_CONFLICT:
-                /* Read 3 more bytes: clause_id(2) + padding(1) */
-                if (recv_bytes(resp + 1, 3) < 0) return -1;
+                /* Read 2 more bytes: clause_id(2) */
+                if (recv_bytes(resp + 1, 2) < 0) return -1;
                 conflict_ci = (resp[1] << 8) | resp[2];
                 done = 1;
                 break;
@@ -30,16 +30,19 @@ void hw_close(void);
  * to the FPGA so the hardware memories match the solver's state. */
 void hw_init(CDCLSolver *s);
 
-/* Send a single WRITE_ASSIGN command to update one variable on the FPGA.
- * `val` uses the software encoding: 0=FALSE, 1=TRUE, -1=UNASSIGNED. */
+/* Queue a WRITE_ASSIGN command to update one variable on the FPGA.
+ * `val` uses the software encoding: 0=FALSE, 1=TRUE, -1=UNASSIGNED.
+ * Queued writes are sent in one batch ahead of the next BCP_START. */
 void hw_write_assign(int var, int val);
 
-/* After backtracking to `from_level`, unassign all variables on the FPGA
- * that are no longer on the trail. */
+/* After backtracking to `from_level`, unassign on the FPGA the variables
+ * that backtrack just removed from the trail (s->trail_cleared marks the
+ * old trail end). */
 void hw_sync_assigns(CDCLSolver *s, int from_level);
 
 /* Run BCP on the hardware accelerator.
- * Processes trail entries from s->prop_head to s->trail_size.
+ * Processes trail entries from s->prop_head to s->trail_size; literals
+ * whose watch list was empty at hw_init are skipped without a round trip.
  * Enqueues implications into the solver and returns:
  *   -1 if no conflict, or the conflicting clause index. */
 int  hw_propagate(CDCLSolver *s);
@@ -17,7 +17,11 @@
  *   [119:104] var         (16 bits)
  *   [103:96]  val         (8 bits)
  *   [95:80]   reason/clause_id (16 bits)
- *   [79:8]    reserved
+ *   [79:64]   var2        (second implication, valid when count == 2)
+ *   [63:56]   val2
+ *   [55:40]   reason2
+ *   [39:32]   count       (implications in this IMPL word: 1 or 2)
+ *   [31:8]    reserved
  *   [7:0]     ack_seq
  */
 
@@ -63,6 +67,19 @@
 #define OPENOCD_HOST     "127.0.0.1"
 #define TCL_TERMINATOR   '\x1a'  /* OpenOCD TCL protocol terminator */
 
+/* Write commands chained into a single TCL round trip */
+#define SCAN_BATCH       8
+
+/* ── Trace output ──────────────────────────────────────────────────────── */
+/* Per-scan TX/RX/poll/propagate logging.  Compiled out unless built with
+ * -DJTAG_TRACE: the if (0) keeps the format arguments type-checked but
+ * they are never evaluated or formatted. */
+#ifdef JTAG_TRACE
+#define jtag_trace(...) fprintf(stderr, __VA_ARGS__)
+#else
+#define jtag_trace(...) do { if (0) fprintf(stderr, __VA_ARGS__); } while (0)
+#endif
+
 /* ── Global port path (unused for JTAG, kept for API compat) ──────────── */
 const char *hw_port = NULL;
 
@@ -70,12 +87,20 @@ const char *hw_port = NULL;
 static int tcl_sock = -1;
 static pid_t openocd_pid = -1;
 static unsigned char seq_num = 0;
+static char scan_batch[32 + SCAN_BATCH * 64];
+static int  scan_batch_len = 0;
+static int  scan_batch_count = 0;
+static int  tcl_pending = 0;  /* batch replies sent for but not yet read */
+
+/* hw_wl_loaded[lit] is set when hw_init uploaded a non-empty watch list
+ * for lit; rounds on the other literals cannot imply anything. */
+static unsigned char *hw_wl_loaded = NULL;
 
 /* ── Helper: map software assign value → hardware encoding ──────────────── */
+static const unsigned char sw_to_hw_lut[3] = { HW_UNASSIGNED, HW_FALSE, HW_TRUE };
+
 static inline unsigned char sw_to_hw_assign(int val) {
-    if (val == 1)  return HW_TRUE;
-    if (val == 0)  return HW_FALSE;
-    return HW_UNASSIGNED;
+    return sw_to_hw_lut[val + 1];  /* -1/0/1 → UNASSIGNED/FALSE/TRUE */
 }
 
 /* ── Helper: map hardware assign value → software encoding ──────────────── */
@@ -85,6 +110,12 @@ static inline int hw_to_sw_assign(unsigned char val) {
     return UNASSIGNED;
 }
 
+/* ── Helper: enqueue an implication reported by the accelerator ─────────── */
+static inline void apply_implication(CDCLSolver *s, int var, int hw_val, int reason) {
+    /* HW_TRUE → positive literal (even code), HW_FALSE → negative (odd) */
+    enqueue_lit(s, 2 * var + (hw_val != HW_TRUE), reason);
+}
+
 /* ── TCL socket I/O helpers ─────────────────────────────────────────────── */
 
 static int tcl_send(const char *cmd) {
@@ -122,6 +153,16 @@ static int tcl_recv(char *buf, int bufsize) {
     return total;
 }
 
+/* Read and discard the replies of batches still in flight. */
+static int tcl_sync(void) {
+    char resp_buf[256];
+    while (tcl_pending > 0) {
+        if (tcl_recv(resp_buf, sizeof(resp_buf)) < 0) return -1;
+        tcl_pending--;
+    }
+    return 0;
+}
+
 /* ── Build 128-bit command as hex string for drscan ──────────────────── */
 
 static const char *cmd_name(unsigned char cmd) {
@@ -173,13 +214,12 @@ static void build_cmd_hex(char *hex_out, unsigned char cmd_byte,
     }
     hex_out[32] = '\0';
 
-    /* Debug: print command being sent */
-    fprintf(stderr, "[JTAG TX] cmd=0x%02X (%s) seq=%u payload(%d)=[",
-            cmd_byte, cmd_name(cmd_byte), seq_num, payload_len);
+    jtag_trace("[JTAG TX] cmd=0x%02X (%s) seq=%u payload(%d)=[",
+               cmd_byte, cmd_name(cmd_byte), seq_num, payload_len);
     for (int i = 0; i < payload_len; i++) {
-        fprintf(stderr, "%s0x%02X", i ? " " : "", payload[i]);
+        jtag_trace("%s0x%02X", i ? " " : "", payload[i]);
     }
-    fprintf(stderr, "] hex=%s\n", hex_out);
+    jtag_trace("] hex=%s\n", hex_out);
 }
 
 /* ── Perform a 128-bit drscan and parse response ────────────────────── */
@@ -189,6 +229,10 @@ typedef struct {
     unsigned int  var;
     unsigned char val;
     unsigned int  reason_id;
+    unsigned int  var2;
+    unsigned char val2;
+    unsigned int  reason2;
+    unsigned char count;
     unsigned char ack_seq;
 } JTAGResponse;
 
@@ -209,6 +253,8 @@ static int jtag_drscan(unsigned char cmd_byte,
              "irscan ecp5.tap 0x32; drscan ecp5.tap 128 0x%s", hex_cmd);
 
     if (tcl_send(tcl_cmd) < 0) return -1;
+    /* OpenOCD answers in order: earlier batch replies come first */
+    if (tcl_sync() < 0) return -1;
 
     char resp_buf[256];
     if (tcl_recv(resp_buf, sizeof(resp_buf)) < 0) return -1;
@@ -235,22 +281,25 @@ static int jtag_drscan(unsigned char cmd_byte,
         while (*p == ' ') p++;  /* skip spaces between hex bytes */
     }
 
-    /* Debug: print raw response */
-    fprintf(stderr, "[JTAG RX] raw_hex=");
-    for (int i = 0; i < 16; i++) fprintf(stderr, "%02x", rsp_bytes[i]);
-    fprintf(stderr, " raw_tcl=\"%s\"\n", hex_start);
+    jtag_trace("[JTAG RX] raw_hex=");
+    for (int i = 0; i < 16; i++) jtag_trace("%02x", rsp_bytes[i]);
+    jtag_trace(" raw_tcl=\"%s\"\n", hex_start);
 
     if (rsp) {
         rsp->status    = rsp_bytes[0];
         rsp->var       = (rsp_bytes[1] << 8) | rsp_bytes[2];
         rsp->val       = rsp_bytes[3];
         rsp->reason_id = (rsp_bytes[4] << 8) | rsp_bytes[5];
+        rsp->var2      = (rsp_bytes[6] << 8) | rsp_bytes[7];
+        rsp->val2      = rsp_bytes[8];
+        rsp->reason2   = (rsp_bytes[9] << 8) | rsp_bytes[10];
+        rsp->count     = rsp_bytes[11];
         rsp->ack_seq   = rsp_bytes[15];
 
-        fprintf(stderr, "[JTAG RX] status=0x%02X (%s) var=%u val=%u "
-                "reason_id=%u ack_seq=%u\n",
-                rsp->status, rsp_name(rsp->status),
-                rsp->var, rsp->val, rsp->reason_id, rsp->ack_seq);
+        jtag_trace("[JTAG RX] status=0x%02X (%s) var=%u val=%u "
+                   "reason_id=%u ack_seq=%u\n",
+                   rsp->status, rsp_name(rsp->status),
+                   rsp->var, rsp->val, rsp->reason_id, rsp->ack_seq);
     }
 
     return 0;
@@ -271,15 +320,37 @@ static int jtag_read_response(JTAGResponse *rsp) {
     return jtag_nop_scan(rsp);
 }
 
-/* ── Send command and wait for completion ──────────────────────────── */
+/* ── Batched write commands ───────────────────────────────────────── */
 
-static int jtag_send_cmd(unsigned char cmd_byte,
-                         const unsigned char *payload, int payload_len) {
-    JTAGResponse rsp;
-    if (jtag_drscan(cmd_byte, payload, payload_len, &rsp) < 0) return -1;
-    /* For write commands (not BCP_START), just return.
-     * The 1-scan delay means the response we just read is stale,
-     * but write commands are fire-and-forget. */
+/* Fire-and-forget writes don't need their responses, so up to SCAN_BATCH
+ * drscans are chained into one TCL command and cost one socket round
+ * trip.  OpenOCD only returns the result of the last scan.  One batch is
+ * left in flight: its reply is read after the next batch has been sent,
+ * so building a batch overlaps with OpenOCD scanning the previous one. */
+static int jtag_flush_cmds(void) {
+    if (scan_batch_count == 0) return 0;
+    scan_batch_len = 0;
+    scan_batch_count = 0;
+    if (tcl_send(scan_batch) < 0) return -1;
+
+    char resp_buf[256];
+    if (tcl_pending > 0 && tcl_recv(resp_buf, sizeof(resp_buf)) < 0) return -1;
+    tcl_pending = 1;
+    return 0;
+}
+
+static int jtag_queue_cmd(unsigned char cmd_byte,
+                          const unsigned char *payload, int payload_len) {
+    char hex_cmd[33];
+    build_cmd_hex(hex_cmd, cmd_byte, payload, payload_len);
+
+    if (scan_batch_count == 0)
+        scan_batch_len = snprintf(scan_batch, sizeof(scan_batch),
+                                  "irscan ecp5.tap 0x32");
+    scan_batch_len += snprintf(scan_batch + scan_batch_len,
+                               sizeof(scan_batch) - scan_batch_len,
+                               "; drscan ecp5.tap 128 0x%s", hex_cmd);
+    if (++scan_batch_count == SCAN_BATCH) return jtag_flush_cmds();
     return 0;
 }
 
@@ -291,10 +362,10 @@ static int jtag_poll_status(JTAGResponse *rsp) {
     int max_polls = 10000;
     for (int i = 0; i < max_polls; i++) {
         if (jtag_read_response(rsp) < 0) return -1;
-        fprintf(stderr, "[JTAG POLL] iter=%d status=0x%02X (%s) var=%u "
-                "val=%u reason=%u ack_seq=%u\n",
-                i, rsp->status, rsp_name(rsp->status),
-                rsp->var, rsp->val, rsp->reason_id, rsp->ack_seq);
+        jtag_trace("[JTAG POLL] iter=%d status=0x%02X (%s) var=%u "
+                   "val=%u reason=%u ack_seq=%u\n",
+                   i, rsp->status, rsp_name(rsp->status),
+                   rsp->var, rsp->val, rsp->reason_id, rsp->ack_seq);
         if (rsp->status != RSP_BUSY && rsp->status != RSP_IDLE) {
             return 0;
         }
@@ -361,6 +432,7 @@ int hw_open(const char *port) {
                 "TCL server on port %d\n", OPENOCD_TCL_PORT);
         close(tcl_sock);
         tcl_sock = -1;
+        tcl_pending = 0;
         return -1;
     }
 
@@ -387,58 +459,77 @@ void hw_close(void) {
         }
         openocd_pid = -1;
     }
+
+    free(hw_wl_loaded);
+    hw_wl_loaded = NULL;
 }
 
 void hw_init(CDCLSolver *s) {
     unsigned char payload[14];
 
-    /* 1. Upload clauses */
+    /* 1. Upload clauses, SCAN_BATCH per TCL round trip */
     for (int ci = 0; ci < s->clause_count; ci++) {
-        Clause *c = s->clauses[ci];
-        int size = c->size;
+        const int *lits = clause_lits(s, ci);
+        int size = clause_size(s, ci);
+
+        /* Clauses already satisfied by a level-0 unit are marked with the
+         * sat bit so the evaluator skips them for the whole solve. */
+        int sat = 0;
+        for (int k = 0; k < size; k++)
+            sat |= s->assigns[lits[k] >> 1] == ((lits[k] & 1) ^ 1);
         if (size > 5) size = 5;
 
         payload[0] = (ci >> 8) & 0xFF;
         payload[1] = ci & 0xFF;
         payload[2] = (unsigned char)size;
-        payload[3] = 0;  /* sat bit = 0 at init */
-        for (int k = 0; k < 5; k++) {
-            int lit = (k < size) ? c->lits[k] : 0;
-            payload[4 + k * 2]     = (lit >> 8) & 0xFF;
-            payload[4 + k * 2 + 1] = lit & 0xFF;
+        payload[3] = (unsigned char)sat;
+        memset(payload + 4, 0, 10);  /* unused literal slots are 0 */
+        for (int k = 0; k < size; k++) {
+            payload[4 + k * 2]     = (lits[k] >> 8) & 0xFF;
+            payload[4 + k * 2 + 1] = lits[k] & 0xFF;
         }
-        jtag_send_cmd(CMD_WRITE_CLAUSE, payload, 14);
+        jtag_queue_cmd(CMD_WRITE_CLAUSE, payload, 14);
     }
+    jtag_flush_cmds();
 
-    /* 2. Upload watch lists */
+    /* 2. Upload watch lists, batched like the clauses */
     int num_lits = 2 * s->num_vars + 2;
+    free(hw_wl_loaded);
+    hw_wl_loaded = calloc(num_lits, 1);
     for (int lit = 0; lit < num_lits; lit++) {
-        int wlen = s->watch_size[lit];
+        /* The hardware has a single watch list per literal: generic
+         * watches first, then the binary clauses the solver keeps apart. */
+        int nlong = s->watch_size[lit];
+        int wlen  = nlong + s->bin_size[lit];
         if (wlen == 0) continue;
+        if (hw_wl_loaded) hw_wl_loaded[lit] = 1;
+        const int *wl = s->watches[lit];
+        const int *bl = s->bin_watches[lit];
 
         payload[0] = (lit >> 8) & 0xFF;
         payload[1] = lit & 0xFF;
         payload[2] = (unsigned char)wlen;
-        jtag_send_cmd(CMD_WRITE_WL_LEN, payload, 3);
+        jtag_queue_cmd(CMD_WRITE_WL_LEN, payload, 3);
 
+        /* lit bytes stay in payload[0..1] for the whole list */
         for (int j = 0; j < wlen; j++) {
-            int clause_id = s->watches[lit][j];
-            payload[0] = (lit >> 8) & 0xFF;
-            payload[1] = lit & 0xFF;
+            int clause_id = (j < nlong) ? wl[j] : bl[2 * (j - nlong) + 1];
             payload[2] = (unsigned char)j;
             payload[3] = (clause_id >> 8) & 0xFF;
             payload[4] = clause_id & 0xFF;
-            jtag_send_cmd(CMD_WRITE_WL_ENTRY, payload, 5);
+            jtag_queue_cmd(CMD_WRITE_WL_ENTRY, payload, 5);
         }
     }
+    jtag_flush_cmds();
 
-    /* 3. Upload variable assignments */
+    /* 3. Upload variable assignments: RESET_STATE clears every variable
+     * to UNASSIGNED in one cycle, so only the level-0 units need sending */
+    jtag_queue_cmd(CMD_RESET_STATE, NULL, 0);
     for (int var = 1; var <= s->num_vars; var++) {
-        payload[0] = (var >> 8) & 0xFF;
-        payload[1] = var & 0xFF;
-        payload[2] = sw_to_hw_assign(s->assigns[var]);
-        jtag_send_cmd(CMD_WRITE_ASSIGN, payload, 3);
+        if (s->assigns[var] != UNASSIGNED)
+            hw_write_assign(var, s->assigns[var]);
     }
+    jtag_flush_cmds();
 }
 
 void hw_write_assign(int var, int val) {
@@ -446,16 +537,19 @@ void hw_write_assign(int var, int val) {
     payload[0] = (var >> 8) & 0xFF;
     payload[1] = var & 0xFF;
     payload[2] = sw_to_hw_assign(val);
-    jtag_send_cmd(CMD_WRITE_ASSIGN, payload, 3);
+    /* Batched; hw_propagate flushes the queue before each BCP_START */
+    jtag_queue_cmd(CMD_WRITE_ASSIGN, payload, 3);
 }
 
 void hw_sync_assigns(CDCLSolver *s, int from_level) {
+    /* After backtracking, only the variables the backtrack just cleared
+     * need to be marked UNASSIGNED on the FPGA: they are the trail slice
+     * [trail_size, trail_cleared) that backtrack() cut off. */
     (void)from_level;
-    for (int var = 1; var <= s->num_vars; var++) {
-        if (s->assigns[var] == UNASSIGNED) {
-            hw_write_assign(var, UNASSIGNED);
-        }
+    for (int k = s->trail_size; k < s->trail_cleared; k++) {
+        hw_write_assign(s->trail[k] >> 1, UNASSIGNED);
     }
+    s->trail_cleared = s->trail_size;
 }
 
 int hw_propagate(CDCLSolver *s) {
@@ -466,12 +560,22 @@ int hw_propagate(CDCLSolver *s) {
         int true_lit = s->trail[s->prop_head];
         int false_lit = true_lit ^ 1;
 
+        /* Empty watch list on the FPGA: skip the BCP_START round trip */
+        if (hw_wl_loaded && !hw_wl_loaded[false_lit]) {
+            s->prop_head++;
+            continue;
+        }
+
         /* Send BCP_START */
-        fprintf(stderr, "[HW_PROP] BCP_START false_lit=%d (true_lit=%d, var=%d)\n",
-                false_lit, true_lit, true_lit / 2);
+        jtag_trace("[HW_PROP] BCP_START false_lit=%d (true_lit=%d, var=%d)\n",
+                   false_lit, true_lit, true_lit / 2);
         payload[0] = (false_lit >> 8) & 0xFF;
         payload[1] = false_lit & 0xFF;
-        jtag_drscan(CMD_BCP_START, payload, 2, NULL);
+        /* Its scan result is never looked at, so BCP_START rides at the
+         * end of the queued writes and its reply is read by the first
+         * poll scan instead of costing a round trip of its own */
+        jtag_queue_cmd(CMD_BCP_START, payload, 2);
+        if (jtag_flush_cmds() < 0) return -1;
 
         /* Poll until not BUSY */
         if (jtag_poll_status(&rsp) < 0) return -1;
@@ -486,39 +590,42 @@ int hw_propagate(CDCLSolver *s) {
                 int hw_val = rsp.val;
                 int reason = rsp.reason_id;
 
-                fprintf(stderr, "[HW_PROP] IMPL: var=%d val=%d (hw=%d) reason=%d\n",
-                        var, (hw_val == HW_TRUE) ? 1 : 0, hw_val, reason);
+                jtag_trace("[HW_PROP] IMPL: var=%d val=%d (hw=%d) reason=%d\n",
+                           var, (hw_val == HW_TRUE) ? 1 : 0, hw_val, reason);
 
-                int code;
-                if (hw_val == HW_TRUE)
-                    code = 2 * var;
-                else
-                    code = 2 * var + 1;
+                apply_implication(s, var, hw_val, reason);
 
-                s->assigns[var] = (code & 1) ? 0 : 1;
-                s->levels[var]  = s->num_decisions;
-                s->reasons[var] = reason;
-                s->trail[s->trail_size++] = code;
+                /* A second implication may share the response word;
+                 * one ACK covers both. */
+                if (rsp.count == 2) {
+                    jtag_trace("[HW_PROP] IMPL: var=%u val=%d (hw=%u) reason=%u\n",
+                               rsp.var2, (rsp.val2 == HW_TRUE) ? 1 : 0,
+                               rsp.val2, rsp.reason2);
+                    apply_implication(s, rsp.var2, rsp.val2, rsp.reason2);
+                }
 
-                hw_write_assign(var, s->assigns[var]);
+                /* The accelerator has already written this implication
+                 * back into its assignment memory. */
 
-                /* Send ACK_IMPL and read next response */
-                fprintf(stderr, "[HW_PROP] Sending ACK_IMPL\n");
-                jtag_drscan(CMD_ACK_IMPL, NULL, 0, NULL);
+                /* Send ACK_IMPL (no reply awaited, like BCP_START)
+                 * and read next response */
+                jtag_trace("[HW_PROP] Sending ACK_IMPL\n");
+                jtag_queue_cmd(CMD_ACK_IMPL, NULL, 0);
+                if (jtag_flush_cmds() < 0) return -1;
                 /* Wait a bit for FSM to process */
                 usleep(100);
                 if (jtag_poll_status(&rsp) < 0) return -1;
                 break;
             }
             case RSP_DONE_OK:
-                fprintf(stderr, "[HW_PROP] DONE_OK\n");
+                jtag_trace("[HW_PROP] DONE_OK\n");
                 done = 1;
                 break;
 
             case RSP_DONE_CONFLICT:
                 conflict_ci = rsp.reason_id;
-                fprintf(stderr, "[HW_PROP] DONE_CONFLICT clause_id=%d\n",
-                        conflict_ci);
+                jtag_trace("[HW_PROP] DONE_CONFLICT clause_id=%d\n",
+                           conflict_ci);
                 done = 1;
                 break;
 
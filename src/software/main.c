@@ -19,11 +19,29 @@
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
+#include <stdbool.h>
 
 #include "CDCL.h"
 
 #ifdef USE_HW_BCP
 #include "hw_interface.h"
+
+/* Accelerator capacity (see src/hardware/memory/). */
+#define HW_MAX_VARS      512
+#define HW_MAX_CLAUSES   8192
+#define HW_MAX_K         5
+#define HW_MAX_WATCH_LEN 127   /* 128 slots, but the length field is 7 bits */
+
+/* Count the clause's two initial watches so over-long hardware watch lists
+ * can be reported once parsing is done, without a second pass. */
+static void hw_count_watches(int *watch_counts, int num_vars,
+                             const int *codes, int len) {
+    if (len < 2) return;
+    for (int i = 0; i < 2; i++) {
+        if (codes[i] < 2 * num_vars + 2)
+            watch_counts[codes[i]]++;
+    }
+}
 #endif
 
 static void usage(const char *prog) {
@@ -32,6 +50,43 @@ static void usage(const char *prog) {
     exit(1);
 }
 
+/* Read the whole file into a NUL-terminated heap buffer and store its
+ * length in `out_len`.  Returns NULL (after printing the error) if the file
+ * cannot be read. */
+static char *read_file(const char *filename, long *out_len) {
+    FILE *fp = fopen(filename, "rb");
+    if (!fp) {
+        perror(filename);
+        return NULL;
+    }
+    fseek(fp, 0, SEEK_END);
+    long size = ftell(fp);
+    fseek(fp, 0, SEEK_SET);
+    if (size < 0) {
+        perror(filename);
+        fclose(fp);
+        return NULL;
+    }
+
+    char *buf = (char *)malloc(size + 1);
+    size_t got = fread(buf, 1, size, fp);
+    fclose(fp);
+    if (got != (size_t)size) {
+        perror(filename);
+        free(buf);
+        return NULL;
+    }
+    buf[size] = '\0';
+    *out_len = size;
+    return buf;
+}
+
+/* Skip to the character after the next newline (or the terminating NUL). */
+static char *skip_line(char *p) {
+    while (*p && *p != '\n') p++;
+    return *p ? p + 1 : p;
+}
+
 int main(int argc, char *argv[]) {
     const char *port = NULL;
     const char *filename = NULL;
@@ -58,82 +113,121 @@ int main(int argc, char *argv[]) {
     }
 #endif
 
-    /* Open the CNF file */
-    FILE *fp = fopen(filename, "r");
-    if (!fp) {
-        perror(filename);
-        return 1;
-    }
+    /* Read the CNF file in one go; parsing then runs over memory. */
+    long  data_len = 0;
+    char *data = read_file(filename, &data_len);
+    if (!data) return 1;
 
     int num_vars = 0, num_clauses = 0;
     int header_found = 0;
-    char line[4096];
+    char *p = data;
 
     /* Parse header */
-    while (fgets(line, sizeof(line), fp)) {
-        if (line[0] == 'c' || line[0] == '\n' || line[0] == '\r')
+    while (*p) {
+        if (*p == 'c' || *p == '\n' || *p == '\r') {
+            p = skip_line(p);
             continue;
-        if (line[0] == 'p') {
-            if (sscanf(line, "p cnf %d %d", &num_vars, &num_clauses) != 2) {
-                fprintf(stderr, "Error: malformed p-line: %s", line);
-                fclose(fp);
+        }
+        if (*p == 'p') {
+            if (sscanf(p, "p cnf %d %d", &num_vars, &num_clauses) != 2) {
+                char *eol = skip_line(p);
+                fprintf(stderr, "Error: malformed p-line: %.*s", (int)(eol - p), p);
+                free(data);
                 return 1;
             }
+            p = skip_line(p);
             header_found = 1;
             break;
         }
+        p = skip_line(p);
     }
 
     if (!header_found) {
         fprintf(stderr, "Error: no 'p cnf ...' header found\n");
-        fclose(fp);
+        free(data);
         return 1;
     }
 
 #ifdef USE_HW_BCP
-    if (num_vars > 512)
-        fprintf(stderr, "Warning: %d variables exceeds hardware limit (512)\n", num_vars);
-    if (num_clauses > 8192)
-        fprintf(stderr, "Warning: %d clauses exceeds hardware limit (8192)\n", num_clauses);
+    if (num_vars > HW_MAX_VARS)
+        fprintf(stderr, "Warning: %d variables exceeds hardware limit (%d)\n",
+                num_vars, HW_MAX_VARS);
+    if (num_clauses > HW_MAX_CLAUSES)
+        fprintf(stderr, "Warning: %d clauses exceeds hardware limit (%d)\n",
+                num_clauses, HW_MAX_CLAUSES);
+    int *watch_counts = (int *)calloc(2 * num_vars + 2, sizeof(int));
 #endif
 
-    /* Create solver */
+    /* Create solver and size the clause database up front.  Every literal
+     * takes at least two bytes ("1 "), which bounds the literal count. */
     CDCLSolver *s = cdcl_create(num_vars);
+    long body_len = data_len - (p - data);
+    cdcl_reserve(s, num_clauses, (int)(body_len / 2));
 
-    /* Parse clauses */
-    int *lits = (int *)malloc(num_vars * sizeof(int));
+    /* Parse clauses (literals are kept as internal codes) */
+    int  lits_cap = num_vars > 0 ? num_vars : 1;
+    int *lits = (int *)malloc(lits_cap * sizeof(int));
     int lit_count = 0;
     int clauses_read = 0;
-    int lit;
 
-    while (fscanf(fp, "%d", &lit) == 1) {
-        if (lit == 0) {
+    /* Hand-rolled integer scan: one pass over the buffer, no per-token
+     * library calls.  Stops at the first token that is not an integer
+     * (e.g. the '%' trailer in SATLIB files), as fscanf("%d") did. */
+    while (true) {
+        while (*p == ' ' || *p == '\t' || *p == '\n' || *p == '\r') p++;
+        if (*p == 'c') {                       /* comment between clauses */
+            p = skip_line(p);
+            continue;
+        }
+        int neg = (*p == '-');
+        if (neg) p++;
+        if (*p < '0' || *p > '9') break;       /* end of input / trailer */
+        int var = 0;
+        while (*p >= '0' && *p <= '9') var = var * 10 + (*p++ - '0');
+
+        if (var == 0) {
             /* End of clause */
 #ifdef USE_HW_BCP
-            if (lit_count > 5)
-                fprintf(stderr, "Warning: clause %d has %d literals (hardware max is 5)\n",
-                        clauses_read, lit_count);
+            if (lit_count > HW_MAX_K)
+                fprintf(stderr, "Warning: clause %d has %d literals (hardware max is %d)\n",
+                        clauses_read, lit_count, HW_MAX_K);
+            hw_count_watches(watch_counts, num_vars, lits, lit_count);
 #endif
-            cdcl_add_clause(s, lits, lit_count);
+            cdcl_add_clause_codes(s, lits, lit_count);
             lit_count = 0;
             clauses_read++;
         } else {
-            if (lit_count >= num_vars) {
+            if (lit_count >= lits_cap) {
                 /* Grow buffer if needed */
-                lits = (int *)realloc(lits, (lit_count + 1) * sizeof(int));
+                lits_cap *= 2;
+                lits = (int *)realloc(lits, lits_cap * sizeof(int));
             }
-            lits[lit_count++] = lit;
+            /* Store the solver's internal code directly: x -> 2x, ~x -> 2x+1. */
+            lits[lit_count++] = (var << 1) | neg;
         }
     }
 
     /* Handle trailing clause without final 0 */
     if (lit_count > 0) {
-        cdcl_add_clause(s, lits, lit_count);
+#ifdef USE_HW_BCP
+        hw_count_watches(watch_counts, num_vars, lits, lit_count);
+#endif
+        cdcl_add_clause_codes(s, lits, lit_count);
         clauses_read++;
     }
 
+#ifdef USE_HW_BCP
+    for (int code = 2; code < 2 * num_vars + 2; code++) {
+        if (watch_counts[code] > HW_MAX_WATCH_LEN)
+            fprintf(stderr, "Warning: literal %d is watched by %d clauses (hardware max is %d)\n",
+                    (code & 1) ? -(code >> 1) : (code >> 1),
+                    watch_counts[code], HW_MAX_WATCH_LEN);
+    }
+    free(watch_counts);
+#endif
+
     free(lits);
-    fclose(fp);
+    free(data);
 
     if (clauses_read != num_clauses) {
         fprintf(stderr, "Warning: header declared %d clauses, read %d\n",
@@ -8,9 +8,21 @@ side via bcp_done, impl_valid, impl_var, impl_value, impl_reason.
 Tests:
   1. WRITE_ASSIGN  — correct assign_wr_en pulse with right addr/data
   2. WRITE_CLAUSE  — correct clause_wr_en pulse with right addr and lits
-  3. BCP_START, no implications — 4-byte done-ok packet (0xC0)
+  3. BCP_START, no implications — 3-byte done-ok packet (0xC0)
   4. BCP_START, one implication + no conflict — 6-byte impl packet then done-ok
-  5. BCP_START, conflict — 4-byte done-conflict packet (0xC1) with clause id
+  5. BCP_START, conflict — 3-byte done-conflict packet (0xC1) with clause id
+  6. RESET_STATE   — one-cycle assign_clear_all pulse
+  7. Two implications with the UART stalled — both popped into the TX FIFO
+     before any byte is accepted, then all 15 bytes come out in order
+  8. WRITE_CLAUSE_BURST — two clauses written to consecutive ids, then the
+     FSM is back in CMD_WAIT for the next command
+  9. A WRITE_ASSIGN sent during BCP_WAIT — held in the RX buffer and
+     written after the done packet; a fifth byte finds the buffer full,
+     is dropped and sets rx_overrun; RESET_STATE clears it
+ 10. WRITE_CLAUSE_BYTE — clause write with only the addressed byte lane
+     enabled
+ 11. WRITE_BATCH of three WRITE_ASSIGNs — one write per payload, then the
+     FSM is back in CMD_WAIT for the next command
 """
 
 import sys, os
@@ -26,7 +38,8 @@ from amaranth.sim import Simulator
 from communication.host_interface import (
     HostInterface,
     CMD_WRITE_CLAUSE, CMD_WRITE_WL_ENTRY, CMD_WRITE_WL_LEN,
-    CMD_WRITE_ASSIGN, CMD_BCP_START, CMD_RESET_STATE,
+    CMD_WRITE_ASSIGN, CMD_BCP_START, CMD_RESET_STATE, CMD_WRITE_CLAUSE_BURST,
+    CMD_WRITE_CLAUSE_BYTE, CMD_WRITE_BATCH,
     RSP_IMPLICATION, RSP_DONE_OK, RSP_DONE_CONF,
 )
 
@@ -107,20 +120,17 @@ def test_host_interface():
         cycle_cnt = await send_byte(dut, ctx, 0x00, cycle_cnt)
         cycle_cnt = await send_byte(dut, ctx, 0x05, cycle_cnt)
 
-        # Last payload byte: only do the first tick so we can sample
-        # during CMD_EXEC before it transitions to CMD_WAIT.
+        # Last payload byte: the command is dispatched in the cycle the
+        # byte reaches the RX buffer head, one tick after its strobe.
         ctx.set(dut.rx_data, 0x02)
         ctx.set(dut.rx_valid, 1)
         await ctx.tick(); cycle_cnt += 1
         ctx.set(dut.rx_valid, 0)
-
-        # FSM just entered CMD_EXEC — combinational write enables are active
         results["t1_en"]   = (cycle_cnt, ctx.get(dut.assign_wr_en))
         results["t1_addr"] = (cycle_cnt, ctx.get(dut.assign_wr_addr))
         results["t1_data"] = (cycle_cnt, ctx.get(dut.assign_wr_data))
 
-
-        # Complete the gap tick to transition out of CMD_EXEC
+        # Complete the gap tick
         await ctx.tick(); cycle_cnt += 1
 
         # ──────────────────────────────────────────────────────────────
@@ -148,13 +158,11 @@ def test_host_interface():
         for b in payload_clause[:-1]:
             cycle_cnt = await send_byte(dut, ctx, b, cycle_cnt)
 
-        # Last payload byte: only first tick, then sample during CMD_EXEC
+        # Last payload byte: sample the dispatch once it leaves the buffer
         ctx.set(dut.rx_data, payload_clause[-1])
         ctx.set(dut.rx_valid, 1)
         await ctx.tick(); cycle_cnt += 1
         ctx.set(dut.rx_valid, 0)
-
-        # FSM just entered CMD_EXEC — combinational write enables are active
         results["t2_en"]   = (cycle_cnt, ctx.get(dut.clause_wr_en))
         results["t2_addr"] = (cycle_cnt, ctx.get(dut.clause_wr_addr))
         results["t2_lit0"] = (cycle_cnt, ctx.get(dut.clause_wr_lit0))
@@ -165,7 +173,7 @@ def test_host_interface():
 
         # ──────────────────────────────────────────────────────────────
         # Test 3: BCP_START false_lit=7, no implications, no conflict
-        # Expected TX output: [0xC0, 0x00, 0x00, 0x00]
+        # Expected TX output: [0xC0, 0x00, 0x00]
         # ──────────────────────────────────────────────────────────────
         await send_cmd(dut, ctx, CMD_BCP_START, [0x00, 0x07], cycle_cnt)
 
@@ -176,15 +184,15 @@ def test_host_interface():
         await ctx.tick(); cycle_cnt += 1
         ctx.set(dut.bcp_done, 0)
 
-        # FSM now in IMPL_CHECK: impl_valid=0 → go to DONE_SEND
-        # Collect 4 TX bytes
-        results["t3_tx"] = (cycle_cnt, await collect_tx_bytes(dut, ctx, 4, cycle_cnt))
+        # impl_valid=0 in the bcp_done cycle → done packet queued at once
+        # Collect 3 TX bytes
+        results["t3_tx"] = (cycle_cnt, await collect_tx_bytes(dut, ctx, 3, cycle_cnt))
 
         # ──────────────────────────────────────────────────────────────
         # Test 4: BCP_START false_lit=11, one implication (var=6, val=1
         #         reason=3), then done ok
         # Expected TX: [0xB0, 0x00, 0x06, 0x01, 0x00, 0x03,
-        #               0xC0, 0x00, 0x00, 0x00]
+        #               0xC0, 0x00, 0x00]
         # ──────────────────────────────────────────────────────────────
         for _ in range(4):
             await ctx.tick(); cycle_cnt += 1
@@ -196,39 +204,42 @@ def test_host_interface():
             await ctx.tick(); cycle_cnt += 1
 
         # Present one implication in the FIFO BEFORE bcp_done fires,
-        # so that IMPL_CHECK sees impl_valid=1 when it enters that state.
+        # so that the bcp_done cycle already sees impl_valid=1.
         ctx.set(dut.impl_valid,  1)
         ctx.set(dut.impl_var,    6)
         ctx.set(dut.impl_value,  1)
         ctx.set(dut.impl_reason, 3)
 
         ctx.set(dut.bcp_done,   1)
-        await ctx.tick();   cycle_cnt += 1
-        ctx.set(dut.bcp_done,   0)
 
-        # Collect 6 implication bytes; when impl_ready fires, clear FIFO
+        # Collect 6 implication bytes; when impl_ready fires, clear FIFO.
+        # impl_ready is combinational (the pop happens as the packet is
+        # latched, already in the bcp_done cycle when the TX FIFO has
+        # room), so sample it before the tick that pops.
         t4_bytes = []
         ctx.set(dut.tx_ready, 1)
         for _ in range(200):
+            popped = ctx.get(dut.impl_ready)
             await ctx.tick(); cycle_cnt += 1
-            if ctx.get(dut.tx_valid):
-                t4_bytes.append(ctx.get(dut.tx_data))
-            if ctx.get(dut.impl_ready):
+            ctx.set(dut.bcp_done, 0)
+            if popped:
                 # FIFO head popped — no more implications
                 ctx.set(dut.impl_valid, 0)
+            if ctx.get(dut.tx_valid):
+                t4_bytes.append(ctx.get(dut.tx_data))
             if len(t4_bytes) == 6:
                 break
         ctx.set(dut.tx_ready, 0)
 
-        # Now collect 4 done bytes
+        # Now collect 3 done bytes
         for _ in range(4):
             await ctx.tick(); cycle_cnt += 1
-        more = await collect_tx_bytes(dut, ctx, 4, cycle_cnt)
+        more = await collect_tx_bytes(dut, ctx, 3, cycle_cnt)
         results["t4_tx"] = (cycle_cnt, t4_bytes + more)
 
         # ──────────────────────────────────────────────────────────────
         # Test 5: BCP_START false_lit=13, conflict clause_id=7
-        # Expected TX: [0xC1, 0x00, 0x07, 0x00]
+        # Expected TX: [0xC1, 0x00, 0x07]
         # ──────────────────────────────────────────────────────────────
         for _ in range(4):
             await ctx.tick(); cycle_cnt += 1
@@ -244,7 +255,203 @@ def test_host_interface():
         ctx.set(dut.bcp_done,        0)
         ctx.set(dut.bcp_conflict,    0)
 
-        results["t5_tx"] = (cycle_cnt, await collect_tx_bytes(dut, ctx, 4, cycle_cnt))
+        results["t5_tx"] = (cycle_cnt, await collect_tx_bytes(dut, ctx, 3, cycle_cnt))
+
+        # ──────────────────────────────────────────────────────────────
+        # Test 6: RESET_STATE (no payload) — executes on the command byte
+        # ──────────────────────────────────────────────────────────────
+        for _ in range(4):
+            await ctx.tick(); cycle_cnt += 1
+
+        ctx.set(dut.rx_data, CMD_RESET_STATE)
+        ctx.set(dut.rx_valid, 1)
+        await ctx.tick(); cycle_cnt += 1
+        ctx.set(dut.rx_valid, 0)
+        results["t6_clear"] = (cycle_cnt, ctx.get(dut.assign_clear_all))
+
+        await ctx.tick(); cycle_cnt += 1
+        results["t6_clear_after"] = (cycle_cnt, ctx.get(dut.assign_clear_all))
+
+        # ──────────────────────────────────────────────────────────────
+        # Test 7: BCP_START false_lit=3, implications (var=1, val=1,
+        #         reason=2) and (var=4, val=0, reason=5), UART stalled
+        # ──────────────────────────────────────────────────────────────
+        for _ in range(4):
+            await ctx.tick(); cycle_cnt += 1
+
+        await send_cmd(dut, ctx, CMD_BCP_START, [0x00, 0x03], cycle_cnt)
+
+        ctx.set(dut.tx_ready,    0)
+        ctx.set(dut.bcp_conflict_id, 0)
+        ctx.set(dut.impl_valid,  1)
+        ctx.set(dut.impl_var,    1)
+        ctx.set(dut.impl_value,  1)
+        ctx.set(dut.impl_reason, 2)
+        ctx.set(dut.bcp_done,    1)
+
+        # tx_ready stays low: count FIFO pops, presenting the second
+        # implication after the first pop and emptying after the second.
+        # The first pop happens in the bcp_done cycle itself.
+        pops = 0
+        for _ in range(40):
+            popped = ctx.get(dut.impl_ready)
+            await ctx.tick(); cycle_cnt += 1
+            ctx.set(dut.bcp_done, 0)
+            if popped:
+                pops += 1
+                if pops == 1:
+                    ctx.set(dut.impl_var,    4)
+                    ctx.set(dut.impl_value,  0)
+                    ctx.set(dut.impl_reason, 5)
+                else:
+                    ctx.set(dut.impl_valid, 0)
+        results["t7_pops"] = (cycle_cnt, pops)
+
+        # The first byte is already waiting on tx_data: sample each byte
+        # before the tick that accepts it.
+        t7_bytes = []
+        ctx.set(dut.tx_ready, 1)
+        for _ in range(100):
+            if ctx.get(dut.tx_valid):
+                t7_bytes.append(ctx.get(dut.tx_data))
+            await ctx.tick(); cycle_cnt += 1
+            if len(t7_bytes) == 15:
+                break
+        ctx.set(dut.tx_ready, 0)
+        results["t7_tx"] = (cycle_cnt, t7_bytes)
+
+        # ──────────────────────────────────────────────────────────────
+        # Test 8: WRITE_CLAUSE_BURST count=2, first id=5
+        #   clause 5: size=2, sat=0, lits 6, 9
+        #   clause 6: size=3, sat=1, lits 2, 4, 8
+        # followed by WRITE_ASSIGN var=3, val=1
+        # ──────────────────────────────────────────────────────────────
+        for _ in range(4):
+            await ctx.tick(); cycle_cnt += 1
+
+        payload_burst = [
+            0x00, 0x02,   # count = 2
+            0x00, 0x05,   # first clause_id = 5
+            0x02, 0x00, 0x00, 0x06, 0x00, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+            0x03, 0x01, 0x00, 0x02, 0x00, 0x04, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00,
+        ]
+        t8_writes = []
+        for b in [CMD_WRITE_CLAUSE_BURST] + payload_burst:
+            ctx.set(dut.rx_data,  b)
+            ctx.set(dut.rx_valid, 1)
+            await ctx.tick(); cycle_cnt += 1
+            ctx.set(dut.rx_valid, 0)
+            if ctx.get(dut.clause_wr_en):
+                t8_writes.append((
+                    ctx.get(dut.clause_wr_addr),
+                    ctx.get(dut.clause_wr_size),
+                    ctx.get(dut.clause_wr_sat_bit),
+                    ctx.get(dut.clause_wr_lit0),
+                    ctx.get(dut.clause_wr_lit1),
+                    ctx.get(dut.clause_wr_lit2),
+                ))
+            await ctx.tick(); cycle_cnt += 1
+        results["t8_writes"] = (cycle_cnt, t8_writes)
+
+        cycle_cnt = await send_cmd(dut, ctx, CMD_WRITE_ASSIGN, [0x00, 0x03],
+                                   cycle_cnt)
+        ctx.set(dut.rx_data, 0x01)
+        ctx.set(dut.rx_valid, 1)
+        await ctx.tick(); cycle_cnt += 1
+        ctx.set(dut.rx_valid, 0)
+        results["t8_after"] = (cycle_cnt, (ctx.get(dut.assign_wr_en),
+                                           ctx.get(dut.assign_wr_addr)))
+
+        # ──────────────────────────────────────────────────────────────
+        # Test 9: a WRITE_ASSIGN sent during BCP_WAIT waits in the RX
+        #         buffer and runs after the response; one byte more than
+        #         the buffer holds is dropped and flagged, and RESET_STATE
+        #         clears the flag
+        # ──────────────────────────────────────────────────────────────
+        for _ in range(4):
+            await ctx.tick(); cycle_cnt += 1
+
+        results["t9_ready_idle"] = (cycle_cnt, ctx.get(dut.rx_ready))
+        cycle_cnt = await send_cmd(dut, ctx, CMD_BCP_START, [0x00, 0x09],
+                                   cycle_cnt)
+        cycle_cnt = await send_cmd(dut, ctx, CMD_WRITE_ASSIGN,
+                                   [0x00, 0x07, 0x01], cycle_cnt)
+        results["t9_ready_full"] = (cycle_cnt, (ctx.get(dut.rx_ready),
+                                                ctx.get(dut.rx_overrun)))
+        cycle_cnt = await send_byte(dut, ctx, 0x55, cycle_cnt)
+        results["t9_overrun"] = (cycle_cnt, ctx.get(dut.rx_overrun))
+
+        ctx.set(dut.bcp_done, 1)
+        await ctx.tick(); cycle_cnt += 1
+        ctx.set(dut.bcp_done, 0)
+
+        # The done packet goes out while the buffered command is decoded
+        t9_bytes, t9_writes = [], []
+        ctx.set(dut.tx_ready, 1)
+        for _ in range(20):
+            if ctx.get(dut.tx_valid):
+                t9_bytes.append(ctx.get(dut.tx_data))
+            if ctx.get(dut.assign_wr_en):
+                t9_writes.append((ctx.get(dut.assign_wr_addr),
+                                  ctx.get(dut.assign_wr_data)))
+            await ctx.tick(); cycle_cnt += 1
+        ctx.set(dut.tx_ready, 0)
+        results["t9_tx"] = (cycle_cnt, t9_bytes)
+        results["t9_writes"] = (cycle_cnt, t9_writes)
+
+        cycle_cnt = await send_byte(dut, ctx, CMD_RESET_STATE, cycle_cnt)
+        results["t9_overrun_cleared"] = (cycle_cnt, ctx.get(dut.rx_overrun))
+
+        # ──────────────────────────────────────────────────────────────
+        # Test 10: WRITE_CLAUSE_BYTE id=3, offset=3 (lit1 low byte), 0x0B
+        # ──────────────────────────────────────────────────────────────
+        results["t10_lanes_idle"] = (cycle_cnt, ctx.get(dut.clause_wr_byte_en))
+        cycle_cnt = await send_cmd(dut, ctx, CMD_WRITE_CLAUSE_BYTE,
+                                   [0x00, 0x03, 0x03], cycle_cnt)
+        ctx.set(dut.rx_data, 0x0B)
+        ctx.set(dut.rx_valid, 1)
+        await ctx.tick(); cycle_cnt += 1
+        ctx.set(dut.rx_valid, 0)
+        results["t10_write"] = (cycle_cnt, (ctx.get(dut.clause_wr_en),
+                                            ctx.get(dut.clause_wr_addr),
+                                            ctx.get(dut.clause_wr_byte_en),
+                                            ctx.get(dut.clause_wr_lit1)))
+
+        # ──────────────────────────────────────────────────────────────
+        # Test 11: WRITE_BATCH cmd=WRITE_ASSIGN, count=3
+        #   var=1 val=2, var=2 val=1, var=0x104 val=0
+        # followed by WRITE_WL_LEN lit=4, len=2
+        # ──────────────────────────────────────────────────────────────
+        await ctx.tick(); cycle_cnt += 1
+
+        payload_batch = [
+            CMD_WRITE_ASSIGN, 0x03,
+            0x00, 0x01, 0x02,
+            0x00, 0x02, 0x01,
+            0x01, 0x04, 0x00,
+        ]
+        t11_writes = []
+        for b in [CMD_WRITE_BATCH] + payload_batch:
+            ctx.set(dut.rx_data,  b)
+            ctx.set(dut.rx_valid, 1)
+            await ctx.tick(); cycle_cnt += 1
+            ctx.set(dut.rx_valid, 0)
+            if ctx.get(dut.assign_wr_en):
+                t11_writes.append((ctx.get(dut.assign_wr_addr),
+                                   ctx.get(dut.assign_wr_data)))
+            await ctx.tick(); cycle_cnt += 1
+        results["t11_writes"] = (cycle_cnt, t11_writes)
+
+        cycle_cnt = await send_cmd(dut, ctx, CMD_WRITE_WL_LEN, [0x00, 0x04],
+                                   cycle_cnt)
+        ctx.set(dut.rx_data, 0x02)
+        ctx.set(dut.rx_valid, 1)
+        await ctx.tick(); cycle_cnt += 1
+        ctx.set(dut.rx_valid, 0)
+        results["t11_after"] = (cycle_cnt, (ctx.get(dut.wl_wr_len_en),
+                                            ctx.get(dut.assign_wr_en),
+                                            ctx.get(dut.wl_wr_lit),
+                                            ctx.get(dut.wl_wr_len)))
 
     sim = Simulator(dut)
     sim.add_clock(1e-8)
@@ -283,16 +490,50 @@ def test_host_interface():
 
     # Test 3: done-ok packet
     check("T3 done-ok TX", results["t3_tx"],
-          [RSP_DONE_OK, 0x00, 0x00, 0x00])
+          [RSP_DONE_OK, 0x00, 0x00])
 
     # Test 4: one implication then done-ok
     check("T4 impl+done TX", results["t4_tx"],
           [RSP_IMPLICATION, 0x00, 0x06, 0x01, 0x00, 0x03,
-           RSP_DONE_OK,     0x00, 0x00, 0x00])
+           RSP_DONE_OK,     0x00, 0x00])
 
     # Test 5: done-conflict with clause_id=7
     check("T5 done-conflict TX", results["t5_tx"],
-          [RSP_DONE_CONF, 0x00, 0x07, 0x00])
+          [RSP_DONE_CONF, 0x00, 0x07])
+
+    # Test 6: RESET_STATE pulses assign_clear_all for one cycle
+    check("T6 assign_clear_all",       results["t6_clear"],       1)
+    check("T6 assign_clear_all (off)", results["t6_clear_after"], 0)
+
+    # Test 7: both implications popped while the UART was stalled
+    check("T7 pops while stalled", results["t7_pops"], 2)
+    check("T7 impl+impl+done TX", results["t7_tx"],
+          [RSP_IMPLICATION, 0x00, 0x01, 0x01, 0x00, 0x02,
+           RSP_IMPLICATION, 0x00, 0x04, 0x00, 0x00, 0x05,
+           RSP_DONE_OK,     0x00, 0x00])
+
+    # Test 8: burst wrote clauses 5 and 6, then a normal command decodes
+    check("T8 burst clause writes", results["t8_writes"],
+          [(5, 2, 0, 6, 9, 0), (6, 3, 1, 2, 4, 8)])
+    check("T8 next command", results["t8_after"], (1, 3))
+
+    # Test 9: bytes buffered during a BCP call; overflow flagged
+    check("T9 rx_ready in CMD_WAIT",  results["t9_ready_idle"], 1)
+    check("T9 buffer full, no overrun", results["t9_ready_full"], (0, 0))
+    check("T9 rx_overrun set",        results["t9_overrun"],    1)
+    check("T9 done-ok TX",            results["t9_tx"],
+          [RSP_DONE_OK, 0x00, 0x00])
+    check("T9 buffered write",        results["t9_writes"], [(7, 1)])
+    check("T9 rx_overrun cleared",   results["t9_overrun_cleared"], 0)
+
+    # Test 10: one byte lane enabled, data byte repeated across lanes
+    check("T10 all lanes by default", results["t10_lanes_idle"], 0x7FF)
+    check("T10 byte write", results["t10_write"], (1, 3, 1 << 3, 0x0B0B))
+
+    # Test 11: one assignment write per batched payload, then a normal command
+    check("T11 batched writes", results["t11_writes"],
+          [(1, 2), (2, 1), (0x104, 0)])
+    check("T11 next command", results["t11_after"], (1, 0, 4, 2))
 
     if all_pass:
         print("\nAll tests PASSED.")
@@ -11,6 +11,8 @@ Tests:
   3. BCP_START, no implications — DONE_OK status
   4. BCP_START, one implication + no conflict — IMPL then DONE_OK
   5. BCP_START, conflict — DONE_CONFLICT status with clause id
+  6. BCP_START, two implications — both popped into one IMPL response
+     (count = 2), a single ACK_IMPL, then DONE_OK
 
 JTAG response protocol: Each drscan shifts out the response loaded at the
 PREVIOUS jupdate and shifts in a new command.  So reading a response requires
@@ -58,7 +60,8 @@ def decode_response(rsp_bits):
     """
     Decode a 128-bit response.
     Layout: [127:120]=status, [119:104]=var, [103:96]=val,
-            [95:80]=reason/clause_id, [79:8]=reserved, [7:0]=ack_seq
+            [95:80]=reason/clause_id, [79:32]=second implication and
+            count (see decode_pair), [31:8]=reserved, [7:0]=ack_seq
     """
     status    = (rsp_bits >> 120) & 0xFF
     var       = (rsp_bits >> 104) & 0xFFFF
@@ -68,6 +71,18 @@ def decode_response(rsp_bits):
     return status, var, val, reason_id, ack_seq
 
 
+def decode_pair(rsp_bits):
+    """
+    Decode the second-implication fields of an IMPL response.
+    Layout: [79:64]=var2, [63:56]=val2, [55:40]=reason2, [39:32]=count
+    """
+    var2    = (rsp_bits >> 64) & 0xFFFF
+    val2    = (rsp_bits >> 56) & 0xFF
+    reason2 = (rsp_bits >> 40) & 0xFFFF
+    count   = (rsp_bits >> 32) & 0xFF
+    return count, var2, val2, reason2
+
+
 def format_raw_hex(rsp_bits):
     """Return 32-char hex string matching OpenOCD drscan output (MSB first)."""
     return f"{rsp_bits:032x}"
@@ -202,7 +217,7 @@ def test_jtag_host_interface():
         await ctx.tick()
         ctx.set(dut.bcp_done, 0)
 
-        # FSM: BCP_WAIT → IMPL_CHECK → DONE_READY
+        # FSM: BCP_WAIT → DONE_READY
         # Wait for FSM to settle + response CDC handshake
         await wait_sync(ctx, CDC_SETTLE)
 
@@ -224,11 +239,16 @@ def test_jtag_host_interface():
         ctx.set(dut.impl_value, 1)
         ctx.set(dut.impl_reason, 3)
 
+        # BCP_WAIT latches the implication and pops it in the bcp_done
+        # cycle; the mock FIFO then runs empty, so IMPL_PAIR finds no
+        # second one.
         ctx.set(dut.bcp_done, 1)
+        results["t4_popped"] = ctx.get(dut.impl_ready)
         await ctx.tick()
         ctx.set(dut.bcp_done, 0)
+        ctx.set(dut.impl_valid, 0)
 
-        # FSM: BCP_WAIT → IMPL_CHECK → IMPL_READY
+        # FSM: BCP_WAIT → IMPL_PAIR → IMPL_READY
         # Wait for response to appear in rsp_shadow
         await wait_sync(ctx, CDC_SETTLE)
 
@@ -243,12 +263,6 @@ def test_jtag_host_interface():
         results["t4_impl_val"]    = val
         results["t4_impl_reason"] = reason_id
 
-        # Clear impl_valid BEFORE sending ACK_IMPL so that when the FSM
-        # processes ACK_IMPL (IMPL_READY → IMPL_CHECK), it sees
-        # impl_valid=0 and proceeds to DONE_READY instead of bouncing
-        # back to IMPL_READY.
-        ctx.set(dut.impl_valid, 0)
-
         # Send ACK_IMPL separately, then wait for FSM to process
         seq += 1
         await jtag_scan(dut, ctx, CMD_ACK_IMPL, [], seq)
@@ -274,7 +288,7 @@ def test_jtag_host_interface():
         ctx.set(dut.bcp_done, 0)
         ctx.set(dut.bcp_conflict, 0)
 
-        # FSM: BCP_WAIT → IMPL_CHECK → DONE_READY
+        # FSM: BCP_WAIT → DONE_READY
         await wait_sync(ctx, CDC_SETTLE)
 
         status, _, _, reason_id, ack_seq, seq = await read_response(
@@ -282,6 +296,50 @@ def test_jtag_host_interface():
         results["t5_status"]      = status
         results["t5_conflict_id"] = reason_id
 
+        await wait_sync(ctx, 4)
+
+        # ────────────────────────────────────────────────────────────────
+        # Test 6: BCP_START false_lit=15, implications (var=8, val=1,
+        #         reason=4) and (var=9, val=0, reason=5), then done ok
+        # ────────────────────────────────────────────────────────────────
+        seq += 1
+        await jtag_scan(dut, ctx, CMD_BCP_START, [0x00, 0x0F], seq)
+        await wait_sync(ctx, CDC_SETTLE)
+
+        ctx.set(dut.impl_valid, 1)
+        ctx.set(dut.impl_var, 8)
+        ctx.set(dut.impl_value, 1)
+        ctx.set(dut.impl_reason, 4)
+        ctx.set(dut.bcp_done, 1)
+
+        # Mock FIFO: each pop (impl_ready) advances to the next entry
+        pops = ctx.get(dut.impl_ready)
+        await ctx.tick()
+        ctx.set(dut.bcp_done, 0)
+        ctx.set(dut.impl_var, 9)
+        ctx.set(dut.impl_value, 0)
+        ctx.set(dut.impl_reason, 5)
+        pops += ctx.get(dut.impl_ready)
+        await ctx.tick()
+        ctx.set(dut.impl_valid, 0)
+        results["t6_pops"] = pops
+        await wait_sync(ctx, CDC_SETTLE)
+
+        seq += 1
+        await jtag_scan(dut, ctx, 0x00, [], seq)
+        seq += 1
+        rsp = await jtag_scan(dut, ctx, 0x00, [], seq)
+        status, var, val, reason_id, _ = decode_response(rsp)
+        results["t6_impl"] = (status, var, val, reason_id)
+        results["t6_pair"] = decode_pair(rsp)
+
+        seq += 1
+        await jtag_scan(dut, ctx, CMD_ACK_IMPL, [], seq)
+        await wait_sync(ctx, CDC_SETTLE)
+
+        status, _, _, _, ack_seq, seq = await read_response(dut, ctx, seq)
+        results["t6_done_status"] = status
+
     sim = Simulator(dut)
     sim.add_clock(1e-8)                # 100 MHz system clock (sync)
     sim.add_clock(1.3e-7, domain="jtck")  # ~7.7 MHz JTAG clock
@@ -317,6 +375,7 @@ def test_jtag_host_interface():
     check("T3 done status", results["t3_status"], RSP_DONE_OK)
 
     # Test 4: implication then done
+    check("T4 popped on load", results["t4_popped"], 1)
     check("T4 impl status", results["t4_impl_status"], RSP_IMPLICATION)
     check("T4 impl var",    results["t4_impl_var"],    6)
     check("T4 impl val",    results["t4_impl_val"],    1)
@@ -327,6 +386,12 @@ def test_jtag_host_interface():
     check("T5 conflict status", results["t5_status"], RSP_DONE_CONF)
     check("T5 conflict id",     results["t5_conflict_id"], 7)
 
+    # Test 6: two implications in one response word, one ACK
+    check("T6 pops",           results["t6_pops"], 2)
+    check("T6 first impl",     results["t6_impl"], (RSP_IMPLICATION, 8, 1, 4))
+    check("T6 second impl",    results["t6_pair"], (2, 9, 0, 5))
+    check("T6 done status",    results["t6_done_status"], RSP_DONE_OK)
+
     if all_pass:
         print("\nAll tests PASSED.")
     else:
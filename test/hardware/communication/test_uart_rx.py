@@ -7,6 +7,8 @@ Verifies:
   3. Correct decoding of alternating-bit bytes (0x55, 0xAA).
   4. Multiple back-to-back bytes are all received correctly.
   5. rx_valid pulses for exactly one cycle per byte.
+  6. A 2-cycle glitch at a bit centre is outvoted (0x00 and 0xFF still
+     decode correctly).
 """
 
 import sys, os
@@ -23,12 +25,16 @@ from communication.uart_rx import UARTReceiver
 
 DIVISOR = 12   # matches 1 Mbaud @ 12 MHz
 
+# (byte, data bits hit by a 2-cycle glitch at their centre)
+GLITCH_CASES = [(0x00, (0, 3, 7)), (0xFF, (1, 2, 6))]
 
-async def _drive_and_receive(dut, byte_val, ctx):
+
+async def _drive_and_receive(dut, byte_val, ctx, glitch_bits=()):
     """
     Drive one UART byte onto dut.rx_pin and return the value captured
     when rx_valid fires.  rx_valid is checked on every tick during the
-    stop-bit window so the 1-cycle pulse is never missed.
+    stop-bit window so the 1-cycle pulse is never missed.  Data bits in
+    glitch_bits are inverted for two cycles around their centre.
     """
     # Start bit
     ctx.set(dut.rx_pin, 0)
@@ -36,8 +42,10 @@ async def _drive_and_receive(dut, byte_val, ctx):
         await ctx.tick()
     # Data bits (LSB first)
     for i in range(8):
-        ctx.set(dut.rx_pin, (byte_val >> i) & 1)
-        for _ in range(DIVISOR):
+        bit = (byte_val >> i) & 1
+        for c in range(DIVISOR):
+            glitch = i in glitch_bits and c in (DIVISOR // 2 - 1, DIVISOR // 2)
+            ctx.set(dut.rx_pin, bit ^ glitch)
             await ctx.tick()
     # Stop bit: drive high and poll rx_valid each tick
     ctx.set(dut.rx_pin, 1)
@@ -67,6 +75,13 @@ def test_uart_rx():
             for _ in range(8):
                 await ctx.tick()
 
+        for byte_val, glitch_bits in GLITCH_CASES:
+            captured = await _drive_and_receive(dut, byte_val, ctx,
+                                                glitch_bits)
+            received.append(captured)
+            for _ in range(8):
+                await ctx.tick()
+
     sim = Simulator(dut)
     sim.add_clock(1e-6)
     sim.add_testbench(testbench)
@@ -75,7 +90,7 @@ def test_uart_rx():
     with sim.write_vcd(vcd_path):
         sim.run()
 
-    test_bytes = [0x55, 0xAA, 0x00, 0xFF, 0xA5]
+    test_bytes = [0x55, 0xAA, 0x00, 0xFF, 0xA5] + [b for b, _ in GLITCH_CASES]
     print("UARTReceiver testbench results:")
     all_pass = True
     for expected, actual in zip(test_bytes, received):
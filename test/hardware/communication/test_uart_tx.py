@@ -7,6 +7,8 @@ Verifies:
   3. Correct serialisation of alternating-bit bytes (0x55, 0xAA).
   4. Multiple back-to-back bytes are all transmitted correctly.
   5. tx_ready goes low during transmission and high again afterwards.
+  6. Two bytes offered back to back go out with no idle gap: the second
+     start bit follows the first stop bit directly.
 """
 
 import sys, os
@@ -92,5 +94,43 @@ def test_uart_tx():
         raise AssertionError("UARTTransmitter testbench failed")
 
 
+def test_uart_tx_back_to_back():
+    """Holding tx_valid sends consecutive frames without an idle bit."""
+    dut = UARTTransmitter(divisor=DIVISOR)
+    test_bytes = [0x55, 0xA3]
+    pins = []
+
+    async def testbench(ctx):
+        ctx.set(dut.tx_valid, 1)
+        for byte_val in test_bytes:
+            ctx.set(dut.tx_data, byte_val)
+            while not ctx.get(dut.tx_ready):
+                pins.append(ctx.get(dut.tx_pin))
+                await ctx.tick()
+            pins.append(ctx.get(dut.tx_pin))
+            await ctx.tick()
+        ctx.set(dut.tx_valid, 0)
+        for _ in range(11 * DIVISOR):
+            pins.append(ctx.get(dut.tx_pin))
+            await ctx.tick()
+
+    sim = Simulator(dut)
+    sim.add_clock(1e-6)
+    sim.add_testbench(testbench)
+    sim.run()
+
+    # Sample every bit centre from the first start bit on: two 10-bit
+    # frames, then the line must be idle
+    first = pins.index(0)
+    bits = [pins[first + DIVISOR * k + DIVISOR // 2] for k in range(21)]
+    expected = []
+    for byte_val in test_bytes:
+        expected += [0] + [(byte_val >> i) & 1 for i in range(8)] + [1]
+    expected += [1]
+    print(f"UARTTransmitter back-to-back: expected={expected} got={bits}")
+    assert bits == expected, "UARTTransmitter back-to-back frames wrong"
+
+
 if __name__ == "__main__":
     test_uart_tx()
+    test_uart_tx_back_to_back()
@@ -7,6 +7,10 @@ Verifies:
   3. Reads reflect the most recent write.
   4. Multiple variables can hold independent values.
   5. Overwriting a variable updates correctly.
+  6. clear_all resets every variable to UNASSIGNED in one cycle, and a
+     write in the same cycle still lands.
+  7. Variables packed into the same 16-variable word are written and read
+     back independently.
 """
 
 import sys, os
@@ -96,6 +100,58 @@ def test_assignment_memory():
             )
         print("Test 5 PASSED: Unwritten variables remain UNASSIGNED.")
 
+        # ---- Test 6: clear_all ----
+        # Vars 0, 1, 2, 100, 511 hold values from tests 2-4; clear them all
+        # while writing var 7 = TRUE in the same cycle.
+        ctx.set(dut.clear_all, 1)
+        ctx.set(dut.wr_addr, 7)
+        ctx.set(dut.wr_data, TRUE)
+        ctx.set(dut.wr_en, 1)
+        await ctx.tick()
+        ctx.set(dut.clear_all, 0)
+        ctx.set(dut.wr_en, 0)
+
+        for var_id in [0, 1, 2, 100, 511]:
+            ctx.set(dut.rd_addr, var_id)
+            val = ctx.get(dut.rd_data)
+            assert val == UNASSIGNED, (
+                f"Test 6 FAIL: var {var_id} expected UNASSIGNED(0), got {val}"
+            )
+        ctx.set(dut.rd_addr, 7)
+        val = ctx.get(dut.rd_data)
+        assert val == TRUE, f"Test 6 FAIL: var 7 expected TRUE(2), got {val}"
+
+        # A later write to a cleared variable reads back normally
+        ctx.set(dut.wr_addr, 100)
+        ctx.set(dut.wr_data, FALSE)
+        ctx.set(dut.wr_en, 1)
+        await ctx.tick()
+        ctx.set(dut.wr_en, 0)
+        ctx.set(dut.rd_addr, 100)
+        val = ctx.get(dut.rd_data)
+        assert val == FALSE, f"Test 6 FAIL: var 100 expected FALSE(1), got {val}"
+        print("Test 6 PASSED: clear_all resets all variables in one cycle.")
+
+        # ---- Test 7: neighbours in one word are independent ----
+        # vars 96..111 share a word; var 100 = FALSE from test 6.  Writing
+        # var 97 and var 111 must leave var 100 and the untouched var 98
+        # alone.
+        for var_id in [97, 111]:
+            ctx.set(dut.wr_addr, var_id)
+            ctx.set(dut.wr_data, TRUE)
+            ctx.set(dut.wr_en, 1)
+            await ctx.tick()
+        ctx.set(dut.wr_en, 0)
+
+        for var_id, expected in [(97, TRUE), (98, UNASSIGNED),
+                                 (100, FALSE), (111, TRUE)]:
+            ctx.set(dut.rd_addr, var_id)
+            got = ctx.get(dut.rd_data)
+            assert got == expected, (
+                f"Test 7 FAIL: var {var_id} expected {expected}, got {got}"
+            )
+        print("Test 7 PASSED: Variables sharing a word are written independently.")
+
         print("\nAll tests PASSED.")
 
     sim.add_testbench(testbench)
@@ -3,10 +3,12 @@ Testbench for the Clause Database Memory module.
 
 Verifies:
   1. Default reads return 0 (all fields zero).
-  2. Write a clause, read it back after 2 cycles, verify all fields.
+  2. Write a clause, read it back after 1 cycle, verify all fields.
   3. Write multiple clauses with distinct data, read each back.
   4. Overwrite a clause and verify the update.
   5. Verify the example content from the spec (clauses for (a∨b∨c), (¬a∨d), etc.).
+  6. Byte-lane write (wr_byte_en) changes only the enabled bytes.
+  7. A read and a write to different clauses in the same cycle both succeed.
 """
 
 import sys, os
@@ -29,16 +31,15 @@ def test_clause_memory():
     sim.add_clock(1e-8)  # 100 MHz
 
     async def testbench(ctx):
-        # Helper: issue a read and wait 2 cycles for data
+        # Helper: issue a read and wait 1 cycle for data
         async def read_clause(addr):
             ctx.set(dut.rd_addr, addr)
             ctx.set(dut.rd_en, 1)
-            await ctx.tick()  # Cycle 1: BRAM latches address; pipe1 captures rd_en=1
+            await ctx.tick()  # BRAM latches address; pipe1 captures rd_en=1
             ctx.set(dut.rd_en, 0)
-            await ctx.tick()  # Cycle 2: stage2 captures BRAM output; pipe2 captures pipe1=1
             # Now rd_valid should be asserted and data available
             valid = ctx.get(dut.rd_valid)
-            assert valid == 1, f"rd_valid not asserted after 2-cycle read"
+            assert valid == 1, f"rd_valid not asserted after 1-cycle read"
             return {
                 "sat_bit": ctx.get(dut.rd_data_sat_bit),
                 "size": ctx.get(dut.rd_data_size),
@@ -157,6 +158,38 @@ def test_clause_memory():
                 )
         print("Test 5 PASSED: Spec example clauses verified.")
 
+        # ---- Test 6: Byte-lane writes touch only the enabled bytes ----
+        # Lane 0 holds sat_bit/size, lane 3 is lit1's low byte.  Set the
+        # sat bit of (a ∨ b ∨ c) (rewriting its size of 3 alongside) and
+        # change lit1 from 4 to 0x0B; the other literals must be untouched.
+        ctx.set(dut.wr_byte_en, (1 << 0) | (1 << 3))
+        await write_clause(0, 1, 3, [0xFFFF, 0x000B, 0xFFFF, 0xFFFF, 0xFFFF])
+        ctx.set(dut.wr_byte_en, (1 << 11) - 1)
+        d = await read_clause(0)
+        assert d["sat_bit"] == 1, f"Test 6 FAIL: sat_bit"
+        assert d["size"] == 3, f"Test 6 FAIL: size expected 3, got {d['size']}"
+        assert d["lit0"] == 2, f"Test 6 FAIL: lit0 expected 2, got {d['lit0']}"
+        assert d["lit1"] == 0x0B, f"Test 6 FAIL: lit1 expected 11, got {d['lit1']}"
+        assert d["lit2"] == 6, f"Test 6 FAIL: lit2 expected 6, got {d['lit2']}"
+        assert d["lit3"] == 0, f"Test 6 FAIL: lit3"
+        print("Test 6 PASSED: Byte-lane write updates only the enabled bytes.")
+
+        # ---- Test 7: Concurrent read and write (dual-port) ----
+        # Read clause 0 on the read port while clause 200 is written on
+        # the write port in the same cycle.
+        ctx.set(dut.rd_addr, 0)
+        ctx.set(dut.rd_en, 1)
+        await write_clause(200, 0, 2, [12, 14, 0, 0, 0])
+        ctx.set(dut.rd_en, 0)
+        assert ctx.get(dut.rd_valid) == 1, "Test 7 FAIL: rd_valid"
+        assert ctx.get(dut.rd_data_lit0) == 2, "Test 7 FAIL: clause 0 lit0"
+        assert ctx.get(dut.rd_data_lit1) == 0x0B, "Test 7 FAIL: clause 0 lit1"
+        d = await read_clause(200)
+        assert d["size"] == 2, f"Test 7 FAIL: size expected 2, got {d['size']}"
+        assert d["lit0"] == 12, f"Test 7 FAIL: lit0 expected 12, got {d['lit0']}"
+        assert d["lit1"] == 14, f"Test 7 FAIL: lit1 expected 14, got {d['lit1']}"
+        print("Test 7 PASSED: Concurrent read and write to different clauses.")
+
         print("\nAll tests PASSED.")
 
     sim.add_testbench(testbench)
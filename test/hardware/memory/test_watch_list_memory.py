@@ -3,10 +3,11 @@ Testbench for the Watch List Memory module.
 
 Verifies:
   1. Default reads return 0 (length=0, clause_id=0).
-  2. Write a length and clause IDs for one literal, read back after 2 cycles.
+  2. Write a length and clause IDs for one literal, read back after 1 cycle.
   3. Write watch lists for multiple literals with distinct data, read each back.
   4. Overwrite a watch list entry and verify update.
   5. Verify the spec example content (literal encodings and their watch lists).
+  6. Burst-write a watch list (one entry per cycle) and read it back.
 """
 
 import sys, os
@@ -29,17 +30,16 @@ def test_watch_list_memory():
     sim.add_clock(1e-8)  # 100 MHz
 
     async def testbench(ctx):
-        # Helper: issue a read and wait 2 cycles for data
+        # Helper: issue a read and wait 1 cycle for data
         async def read_watch(lit, idx):
             ctx.set(dut.rd_lit, lit)
             ctx.set(dut.rd_idx, idx)
             ctx.set(dut.rd_en, 1)
-            await ctx.tick()  # Cycle 1: BRAM latches address; pipe1 captures rd_en=1
+            await ctx.tick()  # BRAM latches address; pipe1 captures rd_en=1
             ctx.set(dut.rd_en, 0)
-            await ctx.tick()  # Cycle 2: stage2 captures BRAM output; pipe2 captures pipe1=1
             # Now rd_valid should be asserted and data available
             valid = ctx.get(dut.rd_valid)
-            assert valid == 1, f"rd_valid not asserted after 2-cycle read"
+            assert valid == 1, f"rd_valid not asserted after 1-cycle read"
             return {
                 "len": ctx.get(dut.rd_len),
                 "data": ctx.get(dut.rd_data),
@@ -166,6 +166,34 @@ def test_watch_list_memory():
                 )
         print("Test 5 PASSED: Spec example watch lists verified.")
 
+        # ---- Test 6: Burst write ----
+        # Literal 20: watch list = [7, 8, 9, 10, 11], uploaded back-to-back
+        burst_cids = [7, 8, 9, 10, 11]
+        ctx.set(dut.wr_lit, 20)
+        ctx.set(dut.wr_len, len(burst_cids))
+        ctx.set(dut.wr_burst_start, 1)
+        await ctx.tick()
+        ctx.set(dut.wr_burst_start, 0)
+        ctx.set(dut.wr_burst_en, 1)
+        for cid in burst_cids:
+            ctx.set(dut.wr_burst_data, cid)
+            await ctx.tick()
+        ctx.set(dut.wr_burst_en, 0)
+
+        d = await read_watch(20, 0)
+        assert d["len"] == len(burst_cids), (
+            f"Test 6 FAIL: len expected {len(burst_cids)}, got {d['len']}"
+        )
+        for idx, expected_cid in enumerate(burst_cids):
+            d = await read_watch(20, idx)
+            assert d["data"] == expected_cid, (
+                f"Test 6 FAIL: clause_id[{idx}] expected {expected_cid}, got {d['data']}"
+            )
+        # Neighbouring literal untouched
+        d = await read_watch(21, 0)
+        assert d["len"] == 0 and d["data"] == 0, "Test 6 FAIL: lit 21 modified"
+        print("Test 6 PASSED: Burst write fills a watch list one entry per cycle.")
+
         print("\nAll tests PASSED.")
 
     sim.add_testbench(testbench)
@@ -5,8 +5,8 @@ Verifies end-to-end integration of all pipeline stages:
   Watch List Manager → Clause Prefetcher → Clause Evaluator → Implication FIFO
 backed by Clause Memory, Watch List Memory, and Assignment Memory.
 
-Tests use single-clause watch lists so that the evaluator (which processes
-one clause at a time) always has time to finish before the pipeline drains.
+The evaluator accepts a clause every cycle, so watch lists may hold
+several clauses streamed back to back.
 
 Verifies:
   1. Empty watch list: done asserted quickly, no implications, no conflict.
@@ -14,6 +14,11 @@ Verifies:
   3. Conflict detection: conflict signal latched with correct clause ID.
   4. Satisfied clause (sat_bit): no implication, no conflict, done.
   5. Sequential BCP calls accumulate implications in the FIFO.
+  6. Implications are written back to Assignment Memory by the hardware:
+     a later clause sees the implied value without a host write.
+  7. Multi-clause watch list: every clause is evaluated, none dropped.
+  8. Conflict mid-list: UNIT clauses after the conflict are neither
+     pushed to the FIFO nor written back to Assignment Memory.
 """
 
 import sys, os
@@ -29,11 +34,13 @@ from amaranth.sim import Simulator
 from memory.assignment_memory import UNASSIGNED, FALSE, TRUE
 from modules.bcp_accelerator import BCPAccelerator
 
+CLK_PERIOD = 1e-8  # 100 MHz
+
 
 def test_bcp_accelerator():
     dut = BCPAccelerator()
     sim = Simulator(dut)
-    sim.add_clock(1e-8)  # 100 MHz
+    sim.add_clock(CLK_PERIOD)
 
     async def testbench(ctx):
 
@@ -55,18 +62,17 @@ def test_bcp_accelerator():
             ctx.set(dut.clause_wr_en, 0)
 
         async def write_watch_list(lit, clause_ids):
+            # Burst upload: length + base address once, then one entry/cycle
             ctx.set(dut.wl_wr_lit, lit)
             ctx.set(dut.wl_wr_len, len(clause_ids))
-            ctx.set(dut.wl_wr_len_en, 1)
+            ctx.set(dut.wl_wr_burst_start, 1)
             await ctx.tick()
-            ctx.set(dut.wl_wr_len_en, 0)
-            for idx, cid in enumerate(clause_ids):
-                ctx.set(dut.wl_wr_lit, lit)
-                ctx.set(dut.wl_wr_idx, idx)
-                ctx.set(dut.wl_wr_data, cid)
-                ctx.set(dut.wl_wr_en, 1)
+            ctx.set(dut.wl_wr_burst_start, 0)
+            ctx.set(dut.wl_wr_burst_en, 1)
+            for cid in clause_ids:
+                ctx.set(dut.wl_wr_burst_data, cid)
                 await ctx.tick()
-                ctx.set(dut.wl_wr_en, 0)
+            ctx.set(dut.wl_wr_burst_en, 0)
 
         async def write_assign(var_id, value):
             ctx.set(dut.assign_wr_addr, var_id)
@@ -82,11 +88,13 @@ def test_bcp_accelerator():
             ctx.set(dut.start, 0)
 
         async def wait_done(max_cycles=60):
-            for _ in range(max_cycles):
-                if ctx.get(dut.done):
-                    return
-                await ctx.tick()
-            raise AssertionError("Timed out waiting for done")
+            # Sleep until done rises (or the timeout expires) rather than
+            # waking the testbench on every clock edge.
+            if ctx.get(dut.done):
+                return
+            rose, _ = await ctx.posedge(dut.done).delay(max_cycles * CLK_PERIOD)
+            if not rose:
+                raise AssertionError("Timed out waiting for done")
 
         async def pop_implication():
             """Pop one entry from the implication FIFO."""
@@ -112,13 +120,31 @@ def test_bcp_accelerator():
         # Clause 1: (¬a ∨ ¬b)  lits=[1, 3]  size=2  sat_bit=0
         # Clause 2: (¬a ∨ c)   lits=[1, 4]  size=2  sat_bit=0
         # Clause 3: (a ∨ b)    lits=[0, 2]  size=2  sat_bit=1  (satisfied)
+        # Clause 4: (¬e ∨ b)   lits=[9, 2]  size=2  sat_bit=0
+        # Clause 5: (¬f ∨ ¬b)  lits=[11, 3] size=2  sat_bit=0
+        # Clause 6: (¬g ∨ c)   lits=[13, 4] size=2  sat_bit=0
+        # Clause 7: (¬g ∨ b)   lits=[13, 2] size=2  sat_bit=0
+        # Clause 8: (¬g ∨ h)   lits=[13, 14] size=2 sat_bit=0
+        # Clause 9: (¬i ∨ ¬a)  lits=[17, 1] size=2  sat_bit=0
+        # Clause 10: (¬i ∨ j)  lits=[17, 18] size=2 sat_bit=0
+        # Clause 11: (¬i ∨ k)  lits=[17, 20] size=2 sat_bit=0
+        # Clause 12: (¬l ∨ j)  lits=[23, 18] size=2 sat_bit=0
         #
         await write_clause(0, sat_bit=0, size=2, lits=[1, 2, 0, 0, 0])
         await write_clause(1, sat_bit=0, size=2, lits=[1, 3, 0, 0, 0])
         await write_clause(2, sat_bit=0, size=2, lits=[1, 4, 0, 0, 0])
         await write_clause(3, sat_bit=1, size=2, lits=[0, 2, 0, 0, 0])
+        await write_clause(4, sat_bit=0, size=2, lits=[9, 2, 0, 0, 0])
+        await write_clause(5, sat_bit=0, size=2, lits=[11, 3, 0, 0, 0])
+        await write_clause(6, sat_bit=0, size=2, lits=[13, 4, 0, 0, 0])
+        await write_clause(7, sat_bit=0, size=2, lits=[13, 2, 0, 0, 0])
+        await write_clause(8, sat_bit=0, size=2, lits=[13, 14, 0, 0, 0])
+        await write_clause(9, sat_bit=0, size=2, lits=[17, 1, 0, 0, 0])
+        await write_clause(10, sat_bit=0, size=2, lits=[17, 18, 0, 0, 0])
+        await write_clause(11, sat_bit=0, size=2, lits=[17, 20, 0, 0, 0])
+        await write_clause(12, sat_bit=0, size=2, lits=[23, 18, 0, 0, 0])
 
-        # Watch lists (one clause per literal for Phase 1 testing)
+        # Watch lists
         # lit 1 (¬a) watches clause 0  — used in tests 2, 3, 5
         await write_watch_list(1, [0])
         # lit 3 (¬b) watches clause 1  — used in test 3 (conflict)
@@ -129,6 +155,15 @@ def test_bcp_accelerator():
         await write_watch_list(7, [])
         # lit 0 (a) watches clause 3   — used in test 4 (satisfied)
         await write_watch_list(0, [3])
+        # lit 9 (¬e) watches clause 4, lit 11 (¬f) clause 5 — test 6
+        await write_watch_list(9, [4])
+        await write_watch_list(11, [5])
+        # lit 13 (¬g) watches clauses 6, 7, 8 — test 7
+        await write_watch_list(13, [6, 7, 8])
+        # lit 17 (¬i) watches a conflict, satisfied clauses, then two UNIT
+        # clauses; lit 23 (¬l) watches clause 12 — test 8
+        await write_watch_list(17, [9, 3, 3, 3, 10, 11])
+        await write_watch_list(23, [12])
 
         # ---- Test 1: Empty watch list ----
         await start_bcp(false_lit=7)
@@ -136,7 +171,6 @@ def test_bcp_accelerator():
         assert ctx.get(dut.conflict) == 0, "Test 1 FAIL: unexpected conflict"
         assert ctx.get(dut.impl_valid) == 0, "Test 1 FAIL: unexpected implication"
         print("Test 1 PASSED: Empty watch list → done, no output.")
-        await ctx.tick()  # DONE → IDLE
 
         # ---- Test 2: Single UNIT implication ----
         # a=TRUE → ¬a (lit 1) becomes false
@@ -203,6 +237,82 @@ def test_bcp_accelerator():
         assert ctx.get(dut.impl_valid) == 0, "Test 5 FAIL: FIFO should be empty"
         print("Test 5 PASSED: Two sequential BCP calls → two implications.")
 
+        # ---- Test 6: Implication write-back ----
+        # e=TRUE → ¬e (lit 9) false → clause 4 (¬e ∨ b) UNIT → b=TRUE,
+        # which the accelerator writes into Assignment Memory itself.
+        # f=TRUE → ¬f (lit 11) false → clause 5 (¬f ∨ ¬b) must then see
+        # b=TRUE and conflict, rather than imply b=FALSE from a stale value.
+        await write_assign(1, UNASSIGNED)  # b unassigned
+        await write_assign(4, TRUE)        # e = TRUE
+        await write_assign(5, TRUE)        # f = TRUE
+        await start_bcp(false_lit=9)
+        await wait_done()
+        await ctx.tick()
+        imp = await pop_implication()
+        assert imp["var"] == 1 and imp["value"] == 1 and imp["reason"] == 4, (
+            f"Test 6 FAIL: expected b=TRUE reason 4, got {imp}")
+
+        # No write_assign for b here — the hardware already has it.
+        await start_bcp(false_lit=11)
+        await wait_done()
+        assert ctx.get(dut.conflict) == 1, "Test 6 FAIL: conflict not detected"
+        assert ctx.get(dut.conflict_clause_id) == 5, (
+            f"Test 6 FAIL: conflict_clause_id expected 5, "
+            f"got {ctx.get(dut.conflict_clause_id)}")
+        assert ctx.get(dut.impl_valid) == 0, (
+            "Test 6 FAIL: contradictory implication b=FALSE emitted")
+        print("Test 6 PASSED: Implied b=TRUE written back; clause 5 conflicts.")
+        await ctx.tick()
+
+        # ---- Test 7: Multi-clause watch list ----
+        # g=TRUE → ¬g (lit 13) false → clauses 6, 7, 8 are streamed back to
+        # back and each implies its second literal, in watch-list order.
+        await write_assign(1, UNASSIGNED)  # b unassigned
+        await write_assign(2, UNASSIGNED)  # c unassigned
+        await write_assign(6, TRUE)        # g = TRUE
+        await write_assign(7, UNASSIGNED)  # h unassigned
+        await start_bcp(false_lit=13)
+        await wait_done()
+        assert ctx.get(dut.conflict) == 0, "Test 7 FAIL: unexpected conflict"
+        await ctx.tick()
+        imps = [await pop_implication() for _ in range(3)]
+        got = [(i["var"], i["value"], i["reason"]) for i in imps]
+        assert got == [(2, 1, 6), (1, 1, 7), (7, 1, 8)], (
+            f"Test 7 FAIL: expected c, b, h = TRUE from clauses 6-8, got {got}")
+        assert ctx.get(dut.impl_valid) == 0, "Test 7 FAIL: FIFO should be empty"
+        print("Test 7 PASSED: Three-clause watch list → three implications.")
+
+        # ---- Test 8: Conflict followed by UNIT clauses ----
+        # a=TRUE, i=TRUE → ¬i (lit 17) false → clause 9 (¬i ∨ ¬a) conflicts.
+        # Clauses 10 and 11 would imply j and k, but come after the
+        # conflict in the watch list, so neither may reach the FIFO or
+        # Assignment Memory.
+        await write_assign(8, TRUE)        # i = TRUE
+        await write_assign(9, UNASSIGNED)  # j unassigned
+        await write_assign(10, UNASSIGNED) # k unassigned
+        await write_assign(11, TRUE)       # l = TRUE
+        await start_bcp(false_lit=17)
+        await wait_done()
+        assert ctx.get(dut.conflict) == 1, "Test 8 FAIL: conflict not detected"
+        assert ctx.get(dut.conflict_clause_id) == 9, (
+            f"Test 8 FAIL: conflict_clause_id expected 9, "
+            f"got {ctx.get(dut.conflict_clause_id)}")
+        await ctx.tick().repeat(8)
+        assert ctx.get(dut.impl_valid) == 0, (
+            "Test 8 FAIL: implication pushed after the conflict")
+
+        # ¬l (lit 23) false → clause 12 (¬l ∨ j) is UNIT only if j was
+        # left unassigned by the conflicted round.
+        await start_bcp(false_lit=23)
+        await wait_done()
+        assert ctx.get(dut.conflict) == 0, "Test 8 FAIL: stale conflict"
+        await ctx.tick()
+        imp = await pop_implication()
+        assert (imp["var"], imp["value"], imp["reason"]) == (9, 1, 12), (
+            f"Test 8 FAIL: expected j=TRUE reason 12, got {imp}")
+        assert ctx.get(dut.impl_valid) == 0, "Test 8 FAIL: FIFO should be empty"
+        print("Test 8 PASSED: Conflict mid-list → later UNIT results dropped.")
+
         print("\nAll tests PASSED.")
 
     sim.add_testbench(testbench)
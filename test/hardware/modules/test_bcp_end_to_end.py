@@ -39,6 +39,8 @@ from modules.bcp_accelerator import BCPAccelerator
 HW_FALSE = 1
 HW_TRUE  = 2
 
+CLK_PERIOD = 1e-8  # 100 MHz
+
 
 # =====================================================================
 #  Python reference model  (mirrors the HW evaluation, one clause/call)
@@ -197,7 +199,7 @@ def test_bcp_end_to_end():
     wmem  = dut.watch_mem
     amem  = dut.assign_mem
     sim   = Simulator(dut)
-    sim.add_clock(1e-8)
+    sim.add_clock(CLK_PERIOD)
 
     clauses, watch_lists, scenarios = build_scenarios()
 
@@ -246,11 +248,13 @@ def test_bcp_end_to_end():
             ctx.set(dut.start, 0)
 
         async def wait_done(max_cycles=80):
-            for _ in range(max_cycles):
-                if ctx.get(dut.done):
-                    return
-                await ctx.tick()
-            raise AssertionError("Timed out waiting for done")
+            # Sleep until done rises (or the timeout expires) rather than
+            # waking the testbench on every clock edge.
+            if ctx.get(dut.done):
+                return
+            rose, _ = await ctx.posedge(dut.done).delay(max_cycles * CLK_PERIOD)
+            if not rose:
+                raise AssertionError("Timed out waiting for done")
 
         async def pop_implication():
             result = {
@@ -277,14 +281,11 @@ def test_bcp_end_to_end():
 
                 if ctx.get(dut.conflict):
                     hw_conflict = ctx.get(dut.conflict_clause_id)
-                    await ctx.tick()          # DONE → IDLE
                     # Drain any leftover FIFO entries
                     while ctx.get(dut.impl_valid):
                         await pop_implication()
                     break
 
-                await ctx.tick()              # DONE → IDLE
-
                 # Pop implications from FIFO, apply, extend trail
                 while ctx.get(dut.impl_valid):
                     imp = await pop_implication()
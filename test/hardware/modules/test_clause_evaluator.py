@@ -8,9 +8,12 @@ Verifies:
   4. Unresolved clause: multiple UNASSIGNED literals → UNRESOLVED.
   5. Satisfied via assignment: one literal TRUE → SATISFIED.
   6. Spec example: (a ∨ b ∨ c) with a=FALSE, b=UNASSIGNED, c=FALSE → UNIT implying b.
+  7. Back-to-back clauses: one accepted per cycle, results on consecutive cycles.
+  8. Satisfied via a negative literal whose variable is FALSE.
 
-Uses a real AssignmentMemory (combinational read) connected to the evaluator
-so that assign_rd_addr → assign_rd_data works within a single cycle.
+Uses a real AssignmentMemory (combinational reads, one port per literal)
+connected to the evaluator so that every assign_rd_addr[i] →
+assign_rd_data[i] lane works within a single cycle.
 """
 
 import sys, os
@@ -28,6 +31,7 @@ from modules.clause_evaluator import (
     ClauseEvaluator, SATISFIED, UNIT, CONFLICT, UNRESOLVED,
 )
 from memory.assignment_memory import AssignmentMemory, UNASSIGNED, FALSE, TRUE
+from memory.clause_memory import MAX_K
 
 
 STATUS_NAMES = {SATISFIED: "SATISFIED", UNIT: "UNIT",
@@ -39,18 +43,19 @@ class EvalTestWrapper(Elaboratable):
 
     def __init__(self, max_clauses=8192, max_vars=512):
         self.ev = ClauseEvaluator(max_clauses=max_clauses, max_vars=max_vars)
-        self.amem = AssignmentMemory(max_vars=max_vars)
+        self.amem = AssignmentMemory(max_vars=max_vars, num_rd_ports=MAX_K)
 
     def elaborate(self, platform):
         m = Module()
         m.submodules.ev = self.ev
         m.submodules.amem = self.amem
 
-        # Wire evaluator ↔ assignment memory
-        m.d.comb += [
-            self.amem.rd_addr.eq(self.ev.assign_rd_addr),
-            self.ev.assign_rd_data.eq(self.amem.rd_data),
-        ]
+        # Wire evaluator ↔ assignment memory, lane by lane
+        for i in range(MAX_K):
+            m.d.comb += [
+                self.amem.rd_addrs[i].eq(self.ev.assign_rd_addr[i]),
+                self.ev.assign_rd_data[i].eq(self.amem.rd_datas[i]),
+            ]
         return m
 
 
@@ -87,7 +92,7 @@ def test_clause_evaluator():
             ctx.set(ev.lit2, lits[2])
             ctx.set(ev.lit3, lits[3])
             ctx.set(ev.lit4, lits[4])
-            await ctx.tick()  # Latch cycle (IDLE → EVAL or OUTPUT)
+            await ctx.tick()  # Evaluate-and-latch cycle
             ctx.set(ev.meta_valid, 0)
 
         async def wait_result(max_cycles=10):
@@ -110,7 +115,7 @@ def test_clause_evaluator():
             f"Test 1 FAIL: expected SATISFIED, got {STATUS_NAMES[r['status']]}")
         assert r["clause_id"] == 42, f"Test 1 FAIL: clause_id"
         print("Test 1 PASSED: sat_bit=1 → SATISFIED")
-        await ctx.tick()  # let FSM return to IDLE
+        await ctx.tick()
 
         # ---- Test 2: Unit clause ----
         # Clause (x0 ∨ ¬x1): lit0 = var0 positive = 0<<1|0 = 0,
@@ -186,6 +191,39 @@ def test_clause_evaluator():
             f"Test 6 FAIL: implied_val expected 1 (TRUE), got {r['implied_val']}")
         assert r["clause_id"] == 0
         print("Test 6 PASSED: Spec example (a∨b∨c) → UNIT implying b=TRUE")
+        await ctx.tick()
+
+        # ---- Test 7: Back-to-back clauses ----
+        # Clause 20 = (x1 ∨ x3), both FALSE → CONFLICT, presented while
+        # clause 21 = (x1 ∨ x2) follows in the very next cycle → UNIT x2.
+        # ready stays high, and each result appears the cycle after its
+        # clause was accepted.
+        assert ctx.get(ev.ready) == 1, "Test 7 FAIL: ready low"
+        await submit_clause(20, sat_bit=0, size=2, lits=[2, 6, 0, 0, 0])
+        assert ctx.get(ev.ready) == 1, "Test 7 FAIL: ready low in output cycle"
+        assert ctx.get(ev.result_valid) == 1
+        assert ctx.get(ev.result_clause_id) == 20
+        assert ctx.get(ev.result_status) == CONFLICT, (
+            f"Test 7 FAIL: clause 20 expected CONFLICT, got "
+            f"{STATUS_NAMES[ctx.get(ev.result_status)]}")
+        await submit_clause(21, sat_bit=0, size=2, lits=[2, 4, 0, 0, 0])
+        assert ctx.get(ev.result_valid) == 1
+        assert ctx.get(ev.result_clause_id) == 21
+        assert ctx.get(ev.result_status) == UNIT, (
+            f"Test 7 FAIL: clause 21 expected UNIT, got "
+            f"{STATUS_NAMES[ctx.get(ev.result_status)]}")
+        assert ctx.get(ev.result_implied_var) == 2
+        await ctx.tick()
+        assert ctx.get(ev.result_valid) == 0, "Test 7 FAIL: spurious result"
+        print("Test 7 PASSED: Back-to-back clauses, one result per cycle")
+
+        # ---- Test 8: Satisfied via a negative literal ----
+        # Clause (x1 ∨ ¬x3): lits = [2, 7], x1 = x3 = FALSE → ¬x3 is TRUE
+        await submit_clause(22, sat_bit=0, size=2, lits=[2, 7, 0, 0, 0])
+        r = await wait_result()
+        assert r["status"] == SATISFIED, (
+            f"Test 8 FAIL: expected SATISFIED, got {STATUS_NAMES[r['status']]}")
+        print("Test 8 PASSED: Negative literal of a FALSE variable → SATISFIED")
 
         print("\nAll tests PASSED.")
 
@@ -2,10 +2,10 @@
 Testbench for the Clause Prefetcher module.
 
 Uses a real ClauseMemory connected to the Prefetcher so that the
-2-cycle read latency is exercised end-to-end.
+1-cycle read latency is exercised end-to-end.
 
 Verifies:
-  1. Single clause fetch: correct data and clause_id after 2-cycle latency.
+  1. Single clause fetch: correct data and clause_id after 1-cycle latency.
   2. Back-to-back fetches: pipelined throughput (1 result per cycle once full).
   3. No spurious output: meta_valid stays low when no input is presented.
   4. Clause fields: sat_bit, size, and all 5 literal slots forwarded correctly.
@@ -112,11 +112,10 @@ def test_clause_prefetcher():
         # ---- Test 1: Single clause fetch ----
         ctx.set(pf.clause_id_in, 0)
         ctx.set(pf.clause_id_valid, 1)
-        await ctx.tick()                # Edge 1: read issued
+        await ctx.tick()                # Edge 1: BRAM latches address, stage 1
         ctx.set(pf.clause_id_valid, 0)
-        await ctx.tick()                # Edge 2: pipeline stage 1
 
-        # After edge 2: meta_valid should be 1
+        # After edge 1: meta_valid should be 1
         out = read_output()
         assert out["valid"] == 1, f"Test 1 FAIL: meta_valid not asserted"
         assert out["clause_id"] == 0, f"Test 1 FAIL: clause_id"
@@ -136,18 +135,17 @@ def test_clause_prefetcher():
         ctx.set(pf.clause_id_valid, 1)
         await ctx.tick()                # Edge: read clause 0
         ctx.set(pf.clause_id_in, 1)
-        await ctx.tick()                # Edge: read clause 1, pipeline filling
-        ctx.set(pf.clause_id_valid, 0)
 
-        # After 2nd edge: clause 0 data arrives
+        # After 1st edge: clause 0 data arrives
         out = read_output()
         assert out["valid"] == 1, "Test 2a FAIL: meta_valid"
         assert out["clause_id"] == 0, f"Test 2a FAIL: clause_id got {out['clause_id']}"
         assert out["size"] == 3, f"Test 2a FAIL: size got {out['size']}"
 
-        await ctx.tick()
+        await ctx.tick()                # Edge: read clause 1
+        ctx.set(pf.clause_id_valid, 0)
 
-        # After 3rd edge: clause 1 data arrives
+        # After 2nd edge: clause 1 data arrives
         out = read_output()
         assert out["valid"] == 1, "Test 2b FAIL: meta_valid"
         assert out["clause_id"] == 1, f"Test 2b FAIL: clause_id got {out['clause_id']}"
@@ -171,7 +169,6 @@ def test_clause_prefetcher():
         ctx.set(pf.clause_id_valid, 1)
         await ctx.tick()
         ctx.set(pf.clause_id_valid, 0)
-        await ctx.tick()
 
         out = read_output()
         assert out["valid"] == 1, "Test 4 FAIL: meta_valid"
@@ -191,7 +188,6 @@ def test_clause_prefetcher():
         ctx.set(pf.clause_id_valid, 1)
         await ctx.tick()
         ctx.set(pf.clause_id_valid, 0)
-        await ctx.tick()
 
         out = read_output()
         assert out["valid"] == 1, "Test 5 FAIL: meta_valid"
@@ -4,10 +4,11 @@ Testbench for the Implication FIFO module.
 Verifies:
   1. Empty on reset: fifo_empty=1, fifo_full=0, pop_valid=0.
   2. Single push/pop round-trip with correct field unpacking.
-  3. Fill to full (16 entries), verify fifo_full, then pop all in FIFO order.
+  3. Fill to full (DEFAULT_FIFO_DEPTH entries), verify fifo_full, then pop all in FIFO order.
   4. Backpressure: push when full is ignored.
   5. Pop when empty is a no-op.
   6. Simultaneous push+pop: count stays the same.
+  7. Bypass: a push into an empty FIFO is visible (and poppable) in its own cycle.
 """
 
 import sys, os
@@ -24,7 +25,7 @@ from amaranth.sim import Simulator
 from modules.implication_fifo import ImplicationFIFO, DEFAULT_FIFO_DEPTH
 
 
-DEPTH = DEFAULT_FIFO_DEPTH  # 16
+DEPTH = DEFAULT_FIFO_DEPTH  # 128
 
 
 def test_implication_fifo():
@@ -159,6 +160,26 @@ def test_implication_fifo():
         )
         print("Test 6 PASSED: Simultaneous push+pop keeps count unchanged.")
 
+        # ---- Test 7: Bypass when empty ----
+        await pop()
+        assert ctx.get(dut.fifo_empty) == 1, "Test 7 FAIL: should be empty"
+        ctx.set(dut.push_valid, 1)
+        ctx.set(dut.push_var, 7)
+        ctx.set(dut.push_value, 0)
+        ctx.set(dut.push_reason, 33)
+        # The pushed entry is visible in the push cycle itself
+        assert ctx.get(dut.pop_valid) == 1, "Test 7 FAIL: no bypass"
+        assert ctx.get(dut.pop_var) == 7, "Test 7 FAIL: bypass var"
+        assert ctx.get(dut.pop_reason) == 33, "Test 7 FAIL: bypass reason"
+        ctx.set(dut.pop_ready, 1)
+        await ctx.tick()
+        ctx.set(dut.push_valid, 0)
+        ctx.set(dut.pop_ready, 0)
+        # Popped on the way through, so nothing was stored
+        assert ctx.get(dut.fifo_empty) == 1, "Test 7 FAIL: entry was stored"
+        assert ctx.get(dut.pop_valid) == 0, "Test 7 FAIL: pop_valid stuck"
+        print("Test 7 PASSED: Push into an empty FIFO bypasses storage.")
+
         print("\nAll tests PASSED.")
 
     sim.add_testbench(testbench)
@@ -1,7 +1,7 @@
 """
 Testbench for the Watch List Manager module.
 
-Uses a real WatchListMemory connected to the WLM so that the 2-cycle
+Uses a real WatchListMemory connected to the WLM so that the 1-cycle
 read latency is exercised end-to-end.
 
 Verifies:
@@ -81,9 +81,8 @@ def test_watch_list_manager():
             """Start the WLM and collect streamed clause IDs."""
             ctx.set(wlm.false_lit, false_lit)
             ctx.set(wlm.start, 1)
-            await ctx.tick()          # Edge: IDLE → FETCH_LEN
+            await ctx.tick()          # Edge: IDLE → STREAM
             ctx.set(wlm.start, 0)
-            await ctx.tick()          # Edge: FETCH_LEN → STREAM
 
             results = []
             for _ in range(max_cycles):
@@ -137,9 +137,9 @@ async def recv_response(ctx, tx_pin):
         return rsp_type, data
 
     elif rsp_type in (RSP_DONE_OK, RSP_DONE_CONFLICT):
-        # 3 more bytes: clause_id_hi, clause_id_lo, padding
+        # 2 more bytes: clause_id_hi, clause_id_lo
         data = []
-        for _ in range(3):
+        for _ in range(2):
             data.append(await uart_recv_byte(ctx, tx_pin))
         return rsp_type, data
 
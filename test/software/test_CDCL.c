@@ -242,6 +242,62 @@ static void test_empty_clause(void) {
     cdcl_destroy(s);
 }
 
+/*
+ * Add the pigeonhole clauses for `pigeons` pigeons and `holes` holes.
+ *   Variable p(i,j) = holes*i + j + 1 means pigeon i sits in hole j.
+ *   UNSAT whenever pigeons > holes.
+ */
+static void add_pigeonhole(CDCLSolver *s, int pigeons, int holes) {
+    int c[16];
+    /* Every pigeon sits in some hole. */
+    for (int i = 0; i < pigeons; i++) {
+        for (int j = 0; j < holes; j++) c[j] = holes * i + j + 1;
+        cdcl_add_clause(s, c, holes);
+    }
+    /* No two pigeons share a hole. */
+    for (int j = 0; j < holes; j++) {
+        for (int a = 0; a < pigeons; a++) {
+            for (int b = a + 1; b < pigeons; b++) {
+                c[0] = -(holes * a + j + 1);
+                c[1] = -(holes * b + j + 1);
+                cdcl_add_clause(s, c, 2);
+            }
+        }
+    }
+}
+
+/*
+ * Test 8: Pigeonhole 4-into-3 (UNSAT)
+ *   Large enough that conflict analysis must resolve through several
+ *   reason clauses before reaching the first UIP.
+ */
+static void test_pigeonhole_4_3(void) {
+    CDCLSolver *s = cdcl_create(12);
+    add_pigeonhole(s, 4, 3);
+
+    int result = cdcl_solve(s);
+    check("pigeonhole 4-into-3 UNSAT", result == UNSAT);
+
+    cdcl_destroy(s);
+}
+
+/*
+ * Test 9: Pigeonhole 8-into-7 (UNSAT)
+ *   Needs a few thousand conflicts, so the solver restarts and the learnt
+ *   clause database is reduced at least once before the proof completes.
+ */
+static void test_pigeonhole_reduce_db(void) {
+    CDCLSolver *s = cdcl_create(56);
+    add_pigeonhole(s, 8, 7);
+
+    int result = cdcl_solve(s);
+    check("pigeonhole 8-into-7 UNSAT", result == UNSAT);
+    check("pigeonhole 8-into-7 reduced learnt DB", s->reductions > 0);
+    check("pigeonhole 8-into-7 restarted", s->restarts > 0);
+
+    cdcl_destroy(s);
+}
+
 /* ========================================================================= */
 /*  Main — run all tests                                                     */
 /* ========================================================================= */
@@ -256,6 +312,8 @@ int main(void) {
     test_xor_chain_sat();
     test_3sat();
     test_empty_clause();
+    test_pigeonhole_4_3();
+    test_pigeonhole_reduce_db();
 
     printf("\n=== Results: %d / %d tests passed ===\n", tests_passed, tests_run);
 